@@ -0,0 +1,38 @@
+"""
+Custom renderers for the API.
+
+This module provides a newline-delimited JSON renderer, used by endpoints
+that stream one result per line so clients can process them as they arrive.
+"""
+
+from typing import Any, Iterable, Iterator, Optional
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Render a list as one JSON document per line, anything else as one line."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict] = None,
+    ) -> bytes:
+        """Render data as newline-delimited JSON."""
+        if data is None:
+            return b""
+        if not isinstance(data, list):
+            data = [data]
+        return b"".join(self.iter_lines(data))
+
+    @staticmethod
+    def iter_lines(items: Iterable[Any]) -> Iterator[bytes]:
+        """Yield one encoded JSON line per item, for streaming responses."""
+        renderer = JSONRenderer()
+        for item in items:
+            yield renderer.render(item) + b"\n"
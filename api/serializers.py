@@ -14,7 +14,9 @@ from campaigns.models import (
     CampaignSafetyAgreement,
 )
 from characters.models import Character
+from characters.services import CharacterStatusService
 from items.models import Item
+from items.services import ItemTransferService
 from locations.models import Location
 from scenes.models import Message, Scene
 from users.models.password_reset import PasswordReset
@@ -608,7 +610,7 @@ class CharacterSerializer(serializers.ModelSerializer):
 
     def get_character_type(self, obj):
         """Get the polymorphic character type."""
-        return obj.__class__.__name__
+        return obj.get_character_type_name()
 
     def to_representation(self, instance):
         """Use polymorphic serialization for specific character types."""
@@ -618,7 +620,10 @@ class CharacterSerializer(serializers.ModelSerializer):
         # Add type-specific fields based on character type
         from characters.models import MageCharacter, WoDCharacter
 
-        if isinstance(instance, MageCharacter):
+        # List rows are base Characters annotated with the subclass fields
+        # (see CharacterQuerySet.with_subclass_fields)
+        character_class = instance.get_real_instance_class() or type(instance)
+        if issubclass(character_class, MageCharacter):
             # Add Mage-specific fields
             data.update(
                 {
@@ -628,7 +633,7 @@ class CharacterSerializer(serializers.ModelSerializer):
                     "willpower": instance.willpower,  # From WoDCharacter
                 }
             )
-        elif isinstance(instance, WoDCharacter):
+        elif issubclass(character_class, WoDCharacter):
             # Add WoD-specific fields
             data.update(
                 {
@@ -639,6 +644,41 @@ class CharacterSerializer(serializers.ModelSerializer):
         return data
 
 
+class CharacterBulkTransitionSerializer(serializers.Serializer):
+    """Serializer for bulk character status transition requests."""
+
+    campaign = serializers.IntegerField()
+    transition = serializers.ChoiceField(
+        choices=CharacterStatusService.BULK_TRANSITIONS
+    )
+    character_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=CharacterStatusService.MAX_BULK_OPERATIONS,
+    )
+
+
+class CharacterBulkTransitionSuccessSerializer(serializers.Serializer):
+    """Serializer for successful bulk character transitions."""
+
+    character_id = serializers.IntegerField(read_only=True)
+    status = serializers.CharField(read_only=True)
+
+
+class CharacterBulkTransitionErrorSerializer(serializers.Serializer):
+    """Serializer for failed bulk character transitions."""
+
+    character_id = serializers.IntegerField(read_only=True)
+    error = serializers.CharField(read_only=True)
+
+
+class CharacterBulkTransitionResponseSerializer(serializers.Serializer):
+    """Serializer for bulk character transition response."""
+
+    updated = CharacterBulkTransitionSuccessSerializer(many=True, read_only=True)
+    errors = CharacterBulkTransitionErrorSerializer(many=True, read_only=True)
+
+
 class CharacterCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer for creating and updating characters."""
 
@@ -1710,6 +1750,64 @@ class ItemCreateUpdateSerializer(serializers.ModelSerializer):
         return serializer.data
 
 
+class ItemTransferEntrySerializer(serializers.Serializer):
+    """Serializer for a single item transfer in a bulk request."""
+
+    item_id = serializers.IntegerField()
+    owner = serializers.IntegerField(allow_null=True)
+
+
+class ItemBulkTransferSerializer(serializers.Serializer):
+    """Serializer for bulk item transfer requests."""
+
+    campaign = serializers.IntegerField()
+    transfers = ItemTransferEntrySerializer(
+        many=True,
+        allow_empty=False,
+        max_length=ItemTransferService.MAX_BULK_OPERATIONS,
+    )
+    atomic = serializers.BooleanField(default=False)
+
+
+class ItemBulkTransferSuccessSerializer(serializers.Serializer):
+    """Serializer for successful item transfers."""
+
+    item_id = serializers.IntegerField(read_only=True)
+    owner = serializers.IntegerField(read_only=True, allow_null=True)
+
+
+class ItemBulkTransferErrorSerializer(serializers.Serializer):
+    """Serializer for failed item transfers."""
+
+    item_id = serializers.IntegerField(read_only=True)
+    error = serializers.CharField(read_only=True)
+
+
+class ItemBulkTransferResponseSerializer(serializers.Serializer):
+    """Serializer for bulk item transfer response."""
+
+    updated = ItemBulkTransferSuccessSerializer(many=True, read_only=True)
+    errors = ItemBulkTransferErrorSerializer(many=True, read_only=True)
+
+
+class ItemInventoryOwnerSerializer(serializers.Serializer):
+    """Serializer for one owner's inventory totals."""
+
+    owner_id = serializers.IntegerField(read_only=True, allow_null=True)
+    owner_name = serializers.CharField(read_only=True, allow_null=True)
+    item_count = serializers.IntegerField(read_only=True)
+    total_quantity = serializers.IntegerField(read_only=True)
+
+
+class ItemInventorySummarySerializer(serializers.Serializer):
+    """Serializer for a campaign's inventory summary."""
+
+    campaign_id = serializers.IntegerField(read_only=True)
+    total_items = serializers.IntegerField(read_only=True)
+    total_quantity = serializers.IntegerField(read_only=True)
+    owners = ItemInventoryOwnerSerializer(many=True, read_only=True)
+
+
 # Scene API serializers
 class SceneCampaignSerializer(serializers.ModelSerializer):
     """Lightweight campaign serializer for scene responses."""
@@ -2353,19 +2451,27 @@ class UserSessionSerializer(serializers.ModelSerializer):
         """Check if this is the current session."""
         request = self.context.get("request")
         if request and hasattr(request, "session"):
-            return obj.session.session_key == request.session.session_key
+            return obj.session_key == request.session.session_key
         return False
 
+    def _get_expiry_date(self, obj):
+        """Get session expiry time, from the live session if it is current."""
+        request = self.context.get("request")
+        if self.get_is_current(obj):
+            return obj.get_expiry_date(session_store=request.session)
+        return obj.get_expiry_date()
+
     def get_expires_at(self, obj):
         """Get session expiry time."""
-        return obj.session.expire_date
+        return self._get_expiry_date(obj)
 
     def get_time_until_expiry(self, obj):
         """Get time until session expires."""
         from django.utils import timezone
 
-        if obj.session.expire_date > timezone.now():
-            return (obj.session.expire_date - timezone.now()).total_seconds()
+        expire_date = self._get_expiry_date(obj)
+        if expire_date > timezone.now():
+            return (expire_date - timezone.now()).total_seconds()
         return 0
 
 
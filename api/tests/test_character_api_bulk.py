@@ -0,0 +1,129 @@
+"""
+Tests for bulk Character API operations.
+
+This module tests the bulk status transition endpoint including:
+- Role checks (GMs and owners, players retiring their own characters)
+- Per-character outcomes for ineligible and unknown characters
+- Audit trail entries for every transitioned character
+"""
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+
+from characters.models import Character, CharacterAuditLog
+
+from .test_character_api_base import BaseCharacterAPITestCase
+
+User = get_user_model()
+
+
+class CharacterBulkTransitionAPITest(BaseCharacterAPITestCase):
+    """Test the bulk character status transition endpoint."""
+
+    def setUp(self):
+        """Set up submitted characters for bulk transitions."""
+        super().setUp()
+        self.bulk_url = reverse("api:characters-bulk-transition")
+        Character.objects.filter(
+            pk__in=[self.character1.pk, self.character2.pk]
+        ).update(status="SUBMITTED")
+
+    def _post(self, transition, character_ids):
+        return self.client.post(
+            self.bulk_url,
+            {
+                "campaign": self.campaign.pk,
+                "transition": transition,
+                "character_ids": character_ids,
+            },
+            format="json",
+        )
+
+    def test_gm_can_bulk_approve(self):
+        """Test that a GM approves several submitted characters at once."""
+        self.client.force_authenticate(user=self.gm)
+
+        response = self._post("approve", [self.character1.pk, self.character2.pk])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["updated"]), 2)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(
+            set(
+                Character.objects.filter(
+                    pk__in=[self.character1.pk, self.character2.pk]
+                ).values_list("status", flat=True)
+            ),
+            {"APPROVED"},
+        )
+        audit_entries = CharacterAuditLog.objects.filter(
+            character__in=[self.character1, self.character2], changed_by=self.gm
+        )
+        self.assertEqual(audit_entries.count(), 2)
+        self.assertEqual(
+            audit_entries.first().field_changes,
+            {"status": {"old": "SUBMITTED", "new": "APPROVED"}},
+        )
+
+    def test_ineligible_and_unknown_characters_are_reported(self):
+        """Test per-character errors for wrong source status and unknown IDs."""
+        self.client.force_authenticate(user=self.owner)
+
+        response = self._post(
+            "approve", [self.character1.pk, self.gm_character.pk, 99999]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["updated"],
+            [{"character_id": self.character1.pk, "status": "APPROVED"}],
+        )
+        failed_ids = [error["character_id"] for error in response.data["errors"]]
+        self.assertEqual(failed_ids, [self.gm_character.pk, 99999])
+        self.gm_character.refresh_from_db()
+        self.assertEqual(self.gm_character.status, "DRAFT")
+
+    def test_player_cannot_bulk_approve(self):
+        """Test that players cannot apply GM-only transitions."""
+        self.client.force_authenticate(user=self.player1)
+
+        response = self._post("approve", [self.character1.pk])
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.character1.refresh_from_db()
+        self.assertEqual(self.character1.status, "SUBMITTED")
+
+    def test_player_can_only_retire_own_characters(self):
+        """Test that players may retire their own characters but no others."""
+        Character.objects.filter(
+            pk__in=[self.character1.pk, self.character2.pk]
+        ).update(status="APPROVED")
+        self.client.force_authenticate(user=self.player1)
+
+        response = self._post("retire", [self.character1.pk, self.character2.pk])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["updated"],
+            [{"character_id": self.character1.pk, "status": "RETIRED"}],
+        )
+        self.character2.refresh_from_db()
+        self.assertEqual(self.character2.status, "APPROVED")
+
+    def test_non_member_gets_not_found(self):
+        """Test that non-members cannot discover the campaign."""
+        self.client.force_authenticate(user=self.non_member)
+
+        response = self._post("approve", [self.character1.pk])
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_transition_is_rejected(self):
+        """Test that unknown transitions fail validation."""
+        self.client.force_authenticate(user=self.gm)
+
+        response = self._post("submit_for_approval", [self.character1.pk])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("transition", response.data)
@@ -81,6 +81,42 @@ class CharacterPolymorphicSerializationTest(BaseCharacterAPITestCase):
         self.assertIn("Character", character_types)  # Base characters
         self.assertIn("MageCharacter", character_types)  # Mage character
 
+    def test_polymorphic_character_list_skips_subclass_queries(self):
+        """Test that the list endpoint does not query subclass tables separately."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_authenticate(user=self.owner)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.list_url, {"campaign": self.campaign.pk})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        subclass_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "characters_magecharacter"' in query["sql"]
+        ]
+        self.assertEqual(subclass_queries, [])
+
+    def test_polymorphic_character_list_includes_subclass_fields(self):
+        """Test that list rows keep the Mage and WoD fields."""
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.get(self.list_url, {"campaign": self.campaign.pk})
+
+        results = {char["id"]: char for char in response.data["results"]}
+        mage = results[self.mage_character.pk]
+        self.assertEqual(mage["arete"], 3)
+        self.assertEqual(mage["quintessence"], 10)
+        self.assertEqual(mage["paradox"], 0)
+        self.assertEqual(mage["willpower"], 3)
+        base = next(
+            char for char in results.values() if char["character_type"] == "Character"
+        )
+        self.assertNotIn("arete", base)
+        self.assertNotIn("willpower", base)
+
     def test_polymorphic_character_creation(self):
         """Test creating polymorphic characters via API."""
         if not self.mage_character:
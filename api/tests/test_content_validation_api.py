@@ -1,12 +1,16 @@
 """Test cases for Content Validation API endpoints."""
 
+import json
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from campaigns.models import Campaign, CampaignMembership
+from core.services import safety
 
 User = get_user_model()
 
@@ -342,6 +346,84 @@ class ContentValidationAPITest(TestCase):
         self.assertFalse(results_by_id["scene2"]["is_safe"])  # Violence + torture
         self.assertFalse(results_by_id["scene3"]["is_safe"])  # Animal harm
 
+    def test_batch_content_validation_reports_user_ids(self):
+        """Test batch results identify users by ID."""
+        self.client.force_authenticate(user=self.gm)
+
+        response = self.client.post(
+            reverse("api:validate_content_batch"),
+            {
+                "campaign_id": self.campaign.id,
+                "content_items": [{"id": "scene1", "content": "Animal harm"}],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user_ids = {
+            user_result["username"]: user_result["user_id"]
+            for user_result in response.data["results"][0]["user_results"]
+        }
+        self.assertEqual(user_ids["player2"], self.player2.id)
+        self.assertEqual(user_ids["owner"], self.owner.id)
+
+    def test_batch_content_validation_streams_ndjson(self):
+        """Test batch results stream one JSON document per line on request."""
+        self.client.force_authenticate(user=self.gm)
+
+        response = self.client.post(
+            reverse("api:validate_content_batch"),
+            {
+                "campaign_id": self.campaign.id,
+                "content_items": [
+                    {"id": "scene1", "content": "Safe tavern conversation"},
+                    {"id": "scene2", "content": "Animal harm scenario"},
+                ],
+            },
+            format="json",
+            HTTP_ACCEPT="application/x-ndjson",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        results = [json.loads(line) for line in lines]
+        self.assertEqual([result["id"] for result in results], ["scene1", "scene2"])
+        self.assertTrue(results[0]["is_safe"])
+        self.assertEqual(results[1]["lines_violated"], ["Animal harm"])
+
+    @override_settings(SAFETY_BATCH_WORKERS=2)
+    def test_large_batch_uses_process_pool(self):
+        """Test large batches give the same results from worker processes."""
+        self.client.force_authenticate(user=self.gm)
+        content_items = [
+            {"id": f"scene{i}", "content": content}
+            for i, content in enumerate(
+                ["Safe tavern conversation", "Animal harm scenario"] * 3
+            )
+        ]
+
+        with (
+            patch("core.services.safety.BATCH_PROCESS_POOL_THRESHOLD", 4),
+            patch("core.services.safety.BATCH_CHUNK_SIZE", 2),
+        ):
+            response = self.client.post(
+                reverse("api:validate_content_batch"),
+                {"campaign_id": self.campaign.id, "content_items": content_items},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["is_safe"] for result in response.data["results"]],
+            [True, False] * 3,
+        )
+        # Later batches reuse the same spawned workers
+        pool = safety._get_batch_pool(2)
+        self.assertIs(safety._get_batch_pool(2), pool)
+        self.assertEqual(pool._mp_context.get_start_method(), "spawn")
+
 
 class ContentValidationAPIErrorHandlingTest(TestCase):
     """Test error handling in content validation API."""
@@ -9,9 +9,13 @@ This module tests the item API endpoint functionality including:
 - Soft delete handling
 - Single character ownership
 - Polymorphic model support preparation
+- Bulk transfers
 """
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -19,6 +23,7 @@ from rest_framework.test import APITestCase
 from campaigns.models import Campaign, CampaignMembership
 from characters.models import Character
 from items.models import Item
+from prerequisites.results import get_character_versions
 
 User = get_user_model()
 
@@ -1019,3 +1024,225 @@ class ItemPolymorphicPreparationTest(BaseItemAPITestCase):
         # Delete (soft delete)
         response = self.client.delete(detail_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class ItemBulkTransferAPITest(BaseItemAPITestCase):
+    """Test bulk item transfer endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.transfer_url = reverse("api:items-transfer")
+
+    def _transfer(self, transfers, atomic=False, campaign=None):
+        return self.client.post(
+            self.transfer_url,
+            {
+                "campaign": (campaign or self.campaign).pk,
+                "transfers": transfers,
+                "atomic": atomic,
+            },
+            format="json",
+        )
+
+    def test_gm_transfers_items_with_single_update(self):
+        """Test that owners and timestamps are changed in one UPDATE."""
+        self.client.force_authenticate(user=self.gm)
+        transfers = [
+            {"item_id": self.item1.pk, "owner": self.character2.pk},
+            {"item_id": self.unowned_item.pk, "owner": self.character1.pk},
+            {"item_id": self.npc_item.pk, "owner": None},
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._transfer(transfers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["updated"]), 3)
+        self.assertEqual(response.data["errors"], [])
+        updates = [q for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+
+        for item, owner in (
+            (self.item1, self.character2),
+            (self.unowned_item, self.character1),
+            (self.npc_item, None),
+        ):
+            item.refresh_from_db()
+            self.assertEqual(item.owner, owner)
+            self.assertIsNotNone(item.last_transferred_at)
+
+    def test_player_gets_per_item_results(self):
+        """Test that players may only transfer items they created."""
+        self.client.force_authenticate(user=self.player1)
+        dagger = Item.objects.create(
+            name="Dagger", campaign=self.campaign, created_by=self.player1
+        )
+
+        response = self._transfer(
+            [
+                {"item_id": self.item1.pk, "owner": self.character2.pk},
+                {"item_id": self.item2.pk, "owner": self.character1.pk},
+                {"item_id": self.other_campaign_item.pk, "owner": None},
+                {"item_id": dagger.pk, "owner": self.other_campaign_character.pk},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["updated"],
+            [{"item_id": self.item1.pk, "owner": self.character2.pk}],
+        )
+        errors = {e["item_id"]: e["error"] for e in response.data["errors"]}
+        self.assertIn("permission", errors[self.item2.pk])
+        self.assertEqual(errors[self.other_campaign_item.pk], "Item not found.")
+        self.assertIn("same campaign", errors[dagger.pk])
+        self.item2.refresh_from_db()
+        self.assertEqual(self.item2.owner, self.character2)
+
+    def test_atomic_mode_transfers_nothing_on_error(self):
+        """Test that atomic requests are all-or-nothing."""
+        self.client.force_authenticate(user=self.gm)
+
+        response = self._transfer(
+            [
+                {"item_id": self.item1.pk, "owner": self.character2.pk},
+                {"item_id": 999999, "owner": self.character2.pk},
+            ],
+            atomic=True,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["updated"], [])
+        self.assertEqual(response.data["errors"][0]["item_id"], 999999)
+        self.item1.refresh_from_db()
+        self.assertEqual(self.item1.owner, self.character1)
+
+    def test_transfer_invalidates_prerequisite_results(self):
+        """Test that both owners' cached prerequisite results are invalidated."""
+        cache.clear()
+        ids = [self.character1.pk, self.character2.pk]
+        versions = get_character_versions(ids)
+        self.client.force_authenticate(user=self.gm)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._transfer([{"item_id": self.item1.pk, "owner": self.character2.pk}])
+
+        new_versions = get_character_versions(ids)
+        for character_id in ids:
+            self.assertNotEqual(new_versions[character_id], versions[character_id])
+
+    def test_non_member_gets_not_found(self):
+        """Test that non-members cannot discover the campaign."""
+        self.client.force_authenticate(user=self.non_member)
+
+        response = self._transfer([{"item_id": self.item1.pk, "owner": None}])
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ItemInventorySummaryAPITest(BaseItemAPITestCase):
+    """Test the cached per-character inventory summary endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.summary_url = reverse("api:items-summary")
+
+    def _summary(self):
+        return self.client.get(self.summary_url, {"campaign_id": self.campaign.pk})
+
+    def _owner_totals(self, response):
+        return {
+            owner["owner_id"]: (owner["item_count"], owner["total_quantity"])
+            for owner in response.data["owners"]
+        }
+
+    def test_summary_totals_per_owner(self):
+        """Test totals per owner, including unowned items."""
+        self.item2.soft_delete(self.player2)
+        self.client.force_authenticate(user=self.player1)
+
+        response = self._summary()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_items"], 3)
+        self.assertEqual(response.data["total_quantity"], 12)
+        self.assertEqual(
+            self._owner_totals(response),
+            {
+                self.character1.pk: (1, 1),
+                self.npc_character.pk: (1, 10),
+                None: (1, 1),
+            },
+        )
+
+    def test_summary_is_one_aggregate_and_cached(self):
+        """Test that the summary is one GROUP BY query and then served cached."""
+        self.client.force_authenticate(user=self.player1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._summary()
+        aggregates = [q for q in queries if "GROUP BY" in q["sql"]]
+        self.assertEqual(len(aggregates), 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._summary()
+        self.assertFalse([q for q in queries if "items_item" in q["sql"]])
+
+    def test_item_writes_invalidate_summary(self):
+        """Test that creates and bulk transfers refresh the cached summary."""
+        self.client.force_authenticate(user=self.gm)
+        self._summary()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Item.objects.create(
+                name="Rope",
+                campaign=self.campaign,
+                quantity=3,
+                owner=self.character1,
+                created_by=self.gm,
+            )
+        self.assertEqual(
+            self._owner_totals(self._summary())[self.character1.pk], (2, 4)
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("api:items-transfer"),
+                {
+                    "campaign": self.campaign.pk,
+                    "transfers": [
+                        {"item_id": self.item2.pk, "owner": self.character1.pk}
+                    ],
+                },
+                format="json",
+            )
+        totals = self._owner_totals(self._summary())
+        self.assertEqual(totals[self.character1.pk], (3, 9))
+        self.assertNotIn(self.character2.pk, totals)
+
+    def test_summary_is_dropped_on_commit(self):
+        """Test that item writes only drop the summary once committed."""
+        self.client.force_authenticate(user=self.gm)
+        self._summary()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.item1.quantity = 5
+            self.item1.save()
+            self.assertEqual(
+                self._owner_totals(self._summary())[self.character1.pk], (1, 1)
+            )
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            self._owner_totals(self._summary())[self.character1.pk], (1, 5)
+        )
+
+    def test_non_member_denied(self):
+        """Test that non-members cannot read a campaign's summary."""
+        self.client.force_authenticate(user=self.non_member)
+
+        response = self._summary()
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -4,7 +4,12 @@ URL configuration for item API endpoints.
 
 from django.urls import path
 
-from api.views.item_views import ItemDetailAPIView, ItemListCreateAPIView
+from api.views.item_views import (
+    ItemBulkTransferAPIView,
+    ItemDetailAPIView,
+    ItemInventorySummaryAPIView,
+    ItemListCreateAPIView,
+)
 
 # Note: No app_name here since these are accessed as api:items-list
 
@@ -12,4 +17,8 @@ urlpatterns = [
     # Item CRUD operations
     path("", ItemListCreateAPIView.as_view(), name="items-list"),
     path("<int:pk>/", ItemDetailAPIView.as_view(), name="items-detail"),
+    # Bulk operations
+    path("transfer/", ItemBulkTransferAPIView.as_view(), name="items-transfer"),
+    # Aggregates
+    path("summary/", ItemInventorySummaryAPIView.as_view(), name="items-summary"),
 ]
@@ -158,8 +158,6 @@ def register_view(request):
 @permission_classes([AllowAny])
 def login_view(request):
     """Login a user."""
-    from django.contrib.sessions.models import Session
-
     from users.services.session_security import SessionSecurityService
 
     serializer = LoginSerializer(data=request.data, context={"request": request})
@@ -177,13 +175,9 @@ def login_view(request):
         try:
             # Create UserSession record
             service = SessionSecurityService()
-            django_session = Session.objects.get(
-                session_key=request.session.session_key
-            )
-
             user_session = service.create_user_session(
                 user=user,
-                session=django_session,
+                session=request.session.session_key,
                 ip_address=ip_address,
                 user_agent=user_agent,
                 remember_me=remember_me,
@@ -191,7 +185,7 @@ def login_view(request):
 
             # Extend session for remember me functionality
             if remember_me:
-                user_session.extend_for_remember_me()
+                user_session.extend_for_remember_me(session_store=request.session)
 
             logger.info(f"User {user.id} logged in successfully from {ip_address}")
 
@@ -236,7 +230,7 @@ def logout_view(request):
         session_key = request.session.session_key
         if session_key:
             user_session = UserSession.objects.get(
-                user=request.user, session__session_key=session_key, is_active=True
+                user=request.user, session_id=session_key, is_active=True
             )
 
             # Log logout event
@@ -787,9 +781,10 @@ def sessions_list_view(request):
     """List all active sessions for the authenticated user."""
     from users.models.session_models import UserSession
 
+    # Prefetch rather than join: cache-backed engines keep no django_session rows
     user_sessions = UserSession.objects.filter(
         user=request.user, is_active=True
-    ).select_related("session")
+    ).prefetch_related("session")
     serializer = UserSessionSerializer(
         user_sessions, many=True, context={"request": request}
     )
@@ -804,8 +799,6 @@ def sessions_list_view(request):
 @permission_classes([IsAuthenticated])
 def terminate_session_view(request, session_id):
     """Terminate a specific session."""
-    from django.contrib.sessions.models import Session
-
     from users.models.session_models import (
         SessionSecurityEvent,
         SessionSecurityLog,
@@ -840,11 +833,7 @@ def terminate_session_view(request, session_id):
     user_session.deactivate()
 
     # Also delete Django session if it exists
-    try:
-        django_session = user_session.session
-        django_session.delete()
-    except Session.DoesNotExist:
-        pass
+    user_session.end_django_session()
 
     return Response(
         {"message": "Session terminated successfully"}, status=status.HTTP_200_OK
@@ -855,8 +844,6 @@ def terminate_session_view(request, session_id):
 @permission_classes([IsAuthenticated])
 def terminate_all_sessions_view(request):
     """Terminate all sessions except the current one."""
-    from django.contrib.sessions.models import Session
-
     from users.models.session_models import (
         SessionSecurityEvent,
         SessionSecurityLog,
@@ -871,13 +858,11 @@ def terminate_all_sessions_view(request):
     user_agent = request.META.get("HTTP_USER_AGENT", "")
 
     # Get all other active sessions for this user
-    user_sessions = UserSession.objects.filter(
-        user=request.user, is_active=True
-    ).select_related("session")
+    user_sessions = UserSession.objects.filter(user=request.user, is_active=True)
 
     # Exclude current session if we can identify it
     if current_session_key:
-        user_sessions = user_sessions.exclude(session__session_key=current_session_key)
+        user_sessions = user_sessions.exclude(session_id=current_session_key)
 
     terminated_count = 0
     for user_session in user_sessions:
@@ -895,10 +880,7 @@ def terminate_all_sessions_view(request):
         user_session.deactivate()
 
         # Delete Django session
-        try:
-            user_session.session.delete()
-        except Session.DoesNotExist:
-            pass
+        user_session.end_django_session()
 
         terminated_count += 1
 
@@ -938,7 +920,7 @@ def extend_session_view(request):
 
     try:
         user_session = UserSession.objects.get(
-            user=request.user, session__session_key=current_session_key, is_active=True
+            user=request.user, session_id=current_session_key, is_active=True
         )
     except UserSession.DoesNotExist:
         return Response(
@@ -951,8 +933,8 @@ def extend_session_view(request):
 
     hours = serializer.validated_data["hours"]
 
-    # Extend session
-    user_session.extend_expiry(hours=hours)
+    # Extend session; SessionMiddleware saves the new expiry with the session
+    user_session.extend_expiry(hours=hours, session_store=request.session)
 
     # Return updated session info
     session_serializer = UserSessionSerializer(
@@ -983,7 +965,7 @@ def current_session_view(request):
 
     try:
         user_session = UserSession.objects.get(
-            user=request.user, session__session_key=current_session_key, is_active=True
+            user=request.user, session_id=current_session_key, is_active=True
         )
     except UserSession.DoesNotExist:
         return Response(
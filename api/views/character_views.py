@@ -23,9 +23,15 @@ from rest_framework.response import Response
 
 from api.errors import APIError
 from api.messages import ErrorMessages
-from api.serializers import CharacterCreateUpdateSerializer, CharacterSerializer
+from api.serializers import (
+    CharacterBulkTransitionResponseSerializer,
+    CharacterBulkTransitionSerializer,
+    CharacterCreateUpdateSerializer,
+    CharacterSerializer,
+)
 from campaigns.models import Campaign
 from characters.models import Character
+from characters.services import CharacterStatusService
 
 User = get_user_model()
 
@@ -117,6 +123,11 @@ class CharacterViewSet(viewsets.ModelViewSet):
             "campaign", "player_owner", "deleted_by"
         ).prefetch_related("campaign__memberships__user")
 
+        # List responses skip the polymorphic subclass queries and join the
+        # subclass fields instead; detail views load the full instance
+        if self.action == "list":
+            queryset = queryset.for_list().with_subclass_fields()
+
         # Apply campaign filtering
         campaign_id = self.request.query_params.get("campaign")
         if campaign_id:
@@ -429,4 +440,35 @@ class CharacterViewSet(viewsets.ModelViewSet):
         except (PermissionError, ValueError) as e:
             return APIError.create_bad_request_response(str(e))
 
+    @action(detail=False, methods=["post"], url_path="bulk-transition")
+    def bulk_transition(self, request):
+        """Apply one status transition to many characters in a campaign."""
+        request_serializer = CharacterBulkTransitionSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        data = request_serializer.validated_data
+
+        try:
+            campaign = Campaign.objects.get(pk=data["campaign"], is_active=True)
+        except Campaign.DoesNotExist:
+            return APIError.not_found()
+
+        user_role = campaign.get_user_role(request.user)
+        if user_role is None:
+            # Hide campaign existence from non-members
+            return APIError.not_found()
+
+        service = CharacterStatusService(campaign)
+        try:
+            results = service.bulk_transition(
+                request.user,
+                data["character_ids"],
+                data["transition"],
+                user_role=user_role,
+            )
+        except PermissionError as e:
+            return APIError.create_permission_denied_response(str(e))
+
+        serializer = CharacterBulkTransitionResponseSerializer(results)
+        return Response(serializer.data)
+
     # Remove the custom override methods - let DRF handle errors naturally
@@ -5,14 +5,17 @@ API views for content validation against safety preferences.
 import logging
 
 from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
 from campaigns.models import Campaign
 from core.services.safety import SafetyValidationService
 
+from ..renderers import NDJSONRenderer
 from ..serializers import (
     BatchContentValidationRequestSerializer,
     CampaignContentValidationRequestSerializer,
@@ -24,6 +27,31 @@ User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
+def _member_ids(validation_service, campaign):
+    """Map usernames to user IDs for everyone in the campaign safety profile."""
+    return {
+        username: user_id
+        for user_id, username in validation_service.get_campaign_profile(
+            campaign
+        ).members
+    }
+
+
+def _user_results_list(validation_result, username_to_id):
+    """Transform a campaign validation's user_results dict to list format."""
+    return [
+        {
+            "user_id": username_to_id.get(username),
+            "username": username,
+            "is_safe": user_result["is_safe"],
+            "lines_violated": user_result["lines_violated"],
+            "veils_triggered": user_result["veils_triggered"],
+            "consent_required": user_result.get("consent_required", False),
+        }
+        for username, user_result in validation_result["user_results"].items()
+    ]
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def validate_content_view(request):
@@ -155,32 +183,8 @@ def validate_content_for_campaign_view(request):
             )
 
             # Transform user_results dict to list format for serializer
-            user_results_list = []
-            for username, user_result in result["user_results"].items():
-                user_results_list.append(
-                    {
-                        "user_id": None,  # We'd need to get this from the campaign
-                        "username": username,
-                        "is_safe": user_result["is_safe"],
-                        "lines_violated": user_result["lines_violated"],
-                        "veils_triggered": user_result["veils_triggered"],
-                        "consent_required": user_result.get("consent_required", False),
-                    }
-                )
-
-            # Get user IDs for the results
-            from campaigns.services.campaign_services import MembershipService
-
-            membership_service = MembershipService(campaign)
-
-            # Create mapping of username to user ID
-            username_to_id = {campaign.owner.username: campaign.owner.id}
-            for membership in membership_service.get_campaign_members():
-                username_to_id[membership.user.username] = membership.user.id
-
-            # Update user results with IDs
-            for user_result in user_results_list:
-                user_result["user_id"] = username_to_id.get(user_result["username"])
+            username_to_id = _member_ids(validation_service, campaign)
+            user_results_list = _user_results_list(result, username_to_id)
 
             response_data = {
                 "is_safe": result["is_safe"],
@@ -257,8 +261,15 @@ def pre_scene_safety_check_view(request):
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
+@renderer_classes([*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer])
 def validate_content_batch_view(request):
-    """Validate multiple content items at once."""
+    """
+    Validate multiple content items at once.
+
+    The campaign's safety profile is loaded once for the whole batch. Send
+    ``Accept: application/x-ndjson`` to stream one result per line as each
+    item is validated, instead of a single ``{"results": [...]}`` document.
+    """
     serializer = BatchContentValidationRequestSerializer(data=request.data)
     if serializer.is_valid():
         try:
@@ -276,46 +287,17 @@ def validate_content_batch_view(request):
             )
 
         validation_service = SafetyValidationService()
-        results = []
-
-        try:
-            for content_item in serializer.validated_data["content_items"]:
-                # Validate each content item against campaign participants
-                validation_result = validation_service.validate_content_for_campaign(
-                    content=content_item["content"], campaign=campaign
-                )
+        content_items = serializer.validated_data["content_items"]
 
-                # Transform user results to list format
-                user_results_list = []
-                for username, user_result in validation_result["user_results"].items():
-                    user_results_list.append(
-                        {
-                            "user_id": None,  # We'd need user lookup for this
-                            "username": username,
-                            "is_safe": user_result["is_safe"],
-                            "lines_violated": user_result["lines_violated"],
-                            "veils_triggered": user_result["veils_triggered"],
-                            "consent_required": user_result.get(
-                                "consent_required", False
-                            ),
-                        }
-                    )
-
-                # Get user IDs for the results
-                from campaigns.services.campaign_services import MembershipService
-
-                membership_service = MembershipService(campaign)
-
-                # Create mapping of username to user ID
-                username_to_id = {campaign.owner.username: campaign.owner.id}
-                for membership in membership_service.get_campaign_members():
-                    username_to_id[membership.user.username] = membership.user.id
-
-                # Update user results with IDs
-                for user_result in user_results_list:
-                    user_result["user_id"] = username_to_id.get(user_result["username"])
-
-                item_result = {
+        def iter_results():
+            username_to_id = _member_ids(validation_service, campaign)
+            validation_results = validation_service.validate_content_batch(
+                [content_item["content"] for content_item in content_items], campaign
+            )
+            for content_item, validation_result in zip(
+                content_items, validation_results
+            ):
+                yield {
                     "id": content_item["id"],
                     "is_safe": validation_result["is_safe"],
                     "lines_violated": validation_result["overall_violations"].get(
@@ -324,12 +306,31 @@ def validate_content_batch_view(request):
                     "veils_triggered": validation_result["overall_violations"].get(
                         "veils", []
                     ),
-                    "user_results": user_results_list,
+                    "user_results": _user_results_list(
+                        validation_result, username_to_id
+                    ),
                 }
 
-                results.append(item_result)
+        if isinstance(request.accepted_renderer, NDJSONRenderer):
 
-            return Response({"results": results}, status=status.HTTP_200_OK)
+            def stream():
+                try:
+                    yield from NDJSONRenderer.iter_lines(iter_results())
+                except Exception as e:
+                    # Headers are already sent, so report the failure in-band
+                    logger.error(f"Error performing batch content validation: {e}")
+                    yield from NDJSONRenderer.iter_lines(
+                        [{"detail": "Failed to validate content batch"}]
+                    )
+
+            return StreamingHttpResponse(
+                stream(), content_type=NDJSONRenderer.media_type
+            )
+
+        try:
+            return Response(
+                {"results": list(iter_results())}, status=status.HTTP_200_OK
+            )
 
         except Exception as e:
             logger.error(f"Error performing batch content validation: {e}")
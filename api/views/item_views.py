@@ -3,7 +3,8 @@ Item API CRUD views.
 
 This module provides the core CRUD operations for item management including
 list, create, detail, update, and soft delete endpoints with proper
-permission checking and single character ownership support.
+permission checking and single character ownership support, plus bulk
+transfer and inventory summary endpoints.
 """
 
 import logging
@@ -16,10 +17,17 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.errors import APIError, SecurityResponseHelper
-from api.serializers import ItemCreateUpdateSerializer, ItemSerializer
+from api.serializers import (
+    ItemBulkTransferResponseSerializer,
+    ItemBulkTransferSerializer,
+    ItemCreateUpdateSerializer,
+    ItemInventorySummarySerializer,
+    ItemSerializer,
+)
 from campaigns.models import Campaign
 from characters.models import Character
 from items.models import Item
+from items.services import InventorySummaryService, ItemTransferService
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +67,31 @@ class ItemPermissionMixin:
 
         return None
 
+    def _validate_campaign_access(self, request):
+        """Validate campaign ID and check user access permissions."""
+        campaign_id = request.GET.get("campaign_id")
+        if not campaign_id:
+            return APIError.validation_error(
+                {"campaign_id": ["Campaign ID is required."]}
+            )
+
+        try:
+            campaign_id = int(campaign_id)
+        except ValueError:
+            return APIError.validation_error({"campaign_id": ["Invalid campaign ID."]})
+
+        try:
+            campaign = Campaign.objects.get(pk=campaign_id)
+        except Campaign.DoesNotExist:
+            return SecurityResponseHelper.resource_access_denied()
+
+        # Check access permissions - users must be campaign members
+        user_role = campaign.get_user_role(request.user)
+        if not user_role and not request.user.is_superuser:
+            return SecurityResponseHelper.resource_access_denied()
+
+        return campaign, campaign_id
+
 
 class ItemListCreateAPIView(APIView, ItemPermissionMixin):
     """
@@ -127,31 +160,6 @@ class ItemListCreateAPIView(APIView, ItemPermissionMixin):
         # Return paginated response
         return self._create_paginated_response(request, queryset)
 
-    def _validate_campaign_access(self, request):
-        """Validate campaign ID and check user access permissions."""
-        campaign_id = request.GET.get("campaign_id")
-        if not campaign_id:
-            return APIError.validation_error(
-                {"campaign_id": ["Campaign ID is required."]}
-            )
-
-        try:
-            campaign_id = int(campaign_id)
-        except ValueError:
-            return APIError.validation_error({"campaign_id": ["Invalid campaign ID."]})
-
-        try:
-            campaign = Campaign.objects.get(pk=campaign_id)
-        except Campaign.DoesNotExist:
-            return SecurityResponseHelper.resource_access_denied()
-
-        # Check access permissions - users must be campaign members
-        user_role = campaign.get_user_role(request.user)
-        if not user_role and not request.user.is_superuser:
-            return SecurityResponseHelper.resource_access_denied()
-
-        return campaign, campaign_id
-
     def _apply_item_filters(self, request, queryset, campaign_id):
         """Apply owner, created_by, quantity, and search filters to the queryset."""
         # Apply owner filter
@@ -474,3 +482,77 @@ class ItemDetailAPIView(APIView, ItemPermissionMixin):
             return Response(status=status.HTTP_204_NO_CONTENT)
         except (PermissionError, ValueError) as e:
             return APIError.create_bad_request_response(str(e))
+
+
+class ItemBulkTransferAPIView(APIView):
+    """
+    API view for transferring many items at once.
+
+    POST: Move items to new owners within one campaign
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """
+        Transfer items in bulk.
+
+        Request body:
+        - campaign: Campaign ID the items belong to
+        - transfers: List of {"item_id": ..., "owner": character ID or null}
+        - atomic: If true, apply nothing unless every transfer is valid
+
+        Returns per-item ``updated`` and ``errors`` lists; atomic requests
+        that fail validation respond with 400 and transfer nothing.
+        """
+        request_serializer = ItemBulkTransferSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        data = request_serializer.validated_data
+
+        try:
+            campaign = Campaign.objects.get(pk=data["campaign"], is_active=True)
+        except Campaign.DoesNotExist:
+            return APIError.not_found()
+
+        user_role = campaign.get_user_role(request.user)
+        if user_role is None and not request.user.is_superuser:
+            # Hide campaign existence from non-members
+            return APIError.not_found()
+
+        service = ItemTransferService(campaign)
+        results = service.bulk_transfer(
+            request.user,
+            data["transfers"],
+            atomic=data["atomic"],
+            user_role=user_role,
+        )
+
+        serializer = ItemBulkTransferResponseSerializer(results)
+        if data["atomic"] and results["errors"]:
+            return Response(serializer.data, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serializer.data)
+
+
+class ItemInventorySummaryAPIView(APIView, ItemPermissionMixin):
+    """
+    API view for per-character inventory totals.
+
+    GET: Item counts and total quantities per owner in a campaign
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """
+        Return the campaign's inventory summary.
+
+        Query parameters:
+        - campaign_id (required): Campaign ID to summarize
+        """
+        campaign_result = self._validate_campaign_access(request)
+        if isinstance(campaign_result, Response):
+            return campaign_result
+
+        campaign, _ = campaign_result
+        summary = InventorySummaryService(campaign).get_summary()
+        return Response(ItemInventorySummarySerializer(summary).data)
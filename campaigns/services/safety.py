@@ -12,6 +12,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Case, FilteredRelation, IntegerField, Q, Value, When
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -315,48 +316,91 @@ class CampaignSafetyService:
                 "Only campaign owners and GMs can view agreements summary"
             )
 
-        from campaigns.models import CampaignSafetyAgreement
-
-        from .campaign_services import MembershipService
-
-        # Get all campaign participants
-        membership_service = MembershipService(campaign)
-        participants = []
-        
-        # Add all members
-        for membership in membership_service.get_campaign_members():
-            participants.append(membership.user)
-        
-        # Add owner if not already included
-        if campaign.owner not in participants:
-            participants.append(campaign.owner)
+        # Members and the owner, each joined to their agreement for this
+        # campaign, in a single query: members in membership order, then the
+        # owner if not also a member
+        participants = (
+            User.objects.annotate(
+                membership=FilteredRelation(
+                    "campaign_memberships",
+                    condition=Q(campaign_memberships__campaign=campaign),
+                ),
+                agreement=FilteredRelation(
+                    "safety_agreements",
+                    condition=Q(safety_agreements__campaign=campaign),
+                ),
+                owner_only=Case(
+                    When(membership__isnull=True, then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                ),
+            )
+            .filter(Q(pk=campaign.owner_id) | Q(membership__isnull=False))
+            .order_by("owner_only", "membership__role", "username")
+            .values(
+                "pk",
+                "username",
+                "membership__role",
+                "agreement__pk",
+                "agreement__agreed_to_terms",
+                "agreement__acknowledged_warnings",
+                "agreement__updated_at",
+            )
+        )
 
         # Get agreement status for each participant
         agreements_data = []
         stats = {
-            "total_participants": len(participants),
+            "total_participants": 0,
             "with_agreements": 0,
             "agreed_to_terms": 0,
             "fully_acknowledged": 0,
             "needs_update": 0,
             "no_agreement": 0,
         }
-
-        for user in participants:
-            agreement = self.get_user_safety_agreement(campaign, user)
-            agreement_status = self.check_user_safety_agreement(campaign, user)
+        content_warnings = set(campaign.content_warnings)
+
+        for row in participants:
+            agreement_status = {
+                "has_agreement": False,
+                "agreement_valid": False,
+                "agreed_to_terms": False,
+                "warnings_acknowledged": [],
+                "missing_warnings": campaign.content_warnings,
+                "needs_update": False,
+            }
+            if row["agreement__pk"] is not None:
+                # Same rules as check_user_safety_agreement
+                acknowledged = row["agreement__acknowledged_warnings"]
+                missing_warnings = content_warnings - set(acknowledged)
+                agreement_status.update(
+                    {
+                        "has_agreement": True,
+                        "agreement_valid": row["agreement__agreed_to_terms"]
+                        and not missing_warnings,
+                        "agreed_to_terms": row["agreement__agreed_to_terms"],
+                        "warnings_acknowledged": acknowledged,
+                        "missing_warnings": list(missing_warnings),
+                        "needs_update": bool(missing_warnings),
+                    }
+                )
 
             participant_data = {
-                "username": user.username,
-                "user_id": user.id,
-                "role": campaign.get_user_role(user),
+                "username": row["username"],
+                "user_id": row["pk"],
+                "role": (
+                    "OWNER"
+                    if row["pk"] == campaign.owner_id
+                    else row["membership__role"]
+                ),
                 "agreement_status": agreement_status,
-                "last_updated": agreement.updated_at if agreement else None,
+                "last_updated": row["agreement__updated_at"],
             }
 
             agreements_data.append(participant_data)
 
             # Update statistics
+            stats["total_participants"] += 1
             if agreement_status["has_agreement"]:
                 stats["with_agreements"] += 1
                 if agreement_status["agreed_to_terms"]:
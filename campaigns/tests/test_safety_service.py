@@ -0,0 +1,111 @@
+"""Tests for CampaignSafetyService agreement summaries."""
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from campaigns.models import Campaign, CampaignMembership, CampaignSafetyAgreement
+from campaigns.services.safety import CampaignSafetyService
+
+User = get_user_model()
+
+
+class CampaignAgreementsSummaryTest(TestCase):
+    """Test get_campaign_agreements_summary."""
+
+    def setUp(self):
+        """Set up a campaign with members in every agreement state."""
+        self.owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="testpass123"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Safety Campaign",
+            owner=self.owner,
+            game_system="Mage: The Ascension",
+            content_warnings=["Violence", "Horror"],
+        )
+        self.gm = self._member("gm", "GM")
+        self.current = self._member("current", "PLAYER")
+        self.outdated = self._member("outdated", "PLAYER")
+        self.declined = self._member("declined", "OBSERVER")
+        self._member("missing", "PLAYER")
+
+        CampaignSafetyAgreement.objects.create(
+            campaign=self.campaign,
+            participant=self.current,
+            agreed_to_terms=True,
+            acknowledged_warnings=["Violence", "Horror"],
+        )
+        CampaignSafetyAgreement.objects.create(
+            campaign=self.campaign,
+            participant=self.outdated,
+            agreed_to_terms=True,
+            acknowledged_warnings=["Violence"],
+        )
+        CampaignSafetyAgreement.objects.create(
+            campaign=self.campaign,
+            participant=self.declined,
+            agreed_to_terms=False,
+            acknowledged_warnings=["Violence", "Horror"],
+        )
+        # Agreements for other campaigns must not be counted
+        other = Campaign.objects.create(
+            name="Other Campaign", owner=self.owner, game_system="Vampire"
+        )
+        CampaignSafetyAgreement.objects.create(
+            campaign=other, participant=self.gm, agreed_to_terms=True
+        )
+        self.service = CampaignSafetyService()
+
+    def _member(self, username, role):
+        user = User.objects.create_user(
+            username=username, email=f"{username}@example.com", password="x"
+        )
+        CampaignMembership.objects.create(campaign=self.campaign, user=user, role=role)
+        return user
+
+    def test_summary_statistics(self):
+        """Test statistics cover members and the owner."""
+        summary = self.service.get_campaign_agreements_summary(
+            self.campaign, self.owner
+        )
+
+        self.assertEqual(
+            summary["statistics"],
+            {
+                "total_participants": 6,
+                "with_agreements": 3,
+                "agreed_to_terms": 2,
+                "fully_acknowledged": 1,
+                "needs_update": 1,
+                "no_agreement": 3,
+            },
+        )
+        participants = {p["username"]: p for p in summary["participants"]}
+        self.assertEqual(participants["owner"]["role"], "OWNER")
+        self.assertEqual(participants["gm"]["role"], "GM")
+        self.assertEqual(summary["participants"][-1]["username"], "owner")
+        self.assertEqual(
+            participants["outdated"]["agreement_status"]["missing_warnings"],
+            ["Horror"],
+        )
+        self.assertFalse(participants["gm"]["agreement_status"]["has_agreement"])
+        self.assertIsNone(participants["missing"]["last_updated"])
+
+    def test_summary_query_count_does_not_grow(self):
+        """Test the summary is loaded in one query however many members."""
+        campaign = Campaign.objects.select_related("owner").get(pk=self.campaign.pk)
+        with self.assertNumQueries(1):
+            self.service.get_campaign_agreements_summary(campaign, self.owner)
+
+        for i in range(20):
+            self._member(f"extra{i}", "PLAYER")
+
+        with self.assertNumQueries(1):
+            summary = self.service.get_campaign_agreements_summary(campaign, self.owner)
+        self.assertEqual(summary["statistics"]["total_participants"], 26)
+
+    def test_summary_requires_owner_or_gm(self):
+        """Test players cannot view the summary."""
+        with self.assertRaises(ValidationError):
+            self.service.get_campaign_agreements_summary(self.campaign, self.current)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django_fsm import FSMField, transition  # type: ignore[import-untyped]
@@ -17,6 +18,10 @@ if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
 
 
+# pg_advisory_xact_lock(int4, int4) takes signed 32-bit keys
+_ADVISORY_LOCK_KEY_SPACE = 2**31
+
+
 class CharacterAuditLog(models.Model):
     """Audit trail for character changes."""
 
@@ -150,6 +155,51 @@ class CharacterQuerySet(PolymorphicQuerySet):
             "campaign__memberships__user"
         )
 
+    def for_list(self) -> "CharacterQuerySet":
+        """Return base Character rows without loading concrete subclasses.
+
+        List pages only need base fields, so this skips the extra query per
+        subclass that the polymorphic loader issues. Use
+        ``get_character_type_name()`` to resolve the concrete type of the rows.
+
+        Returns:
+            Non-polymorphic QuerySet of base Character instances
+        """
+        return self.non_polymorphic()
+
+    def with_subclass_fields(self) -> "CharacterQuerySet":
+        """Annotate rows with the WoD and Mage subclass fields.
+
+        Lets ``for_list()`` rows carry subclass fields through joins in the
+        same query instead of loading the concrete instances. Rows of other
+        types get None for fields they do not have.
+
+        Returns:
+            QuerySet annotated with willpower, arete, quintessence and paradox
+        """
+        return self.annotate(
+            willpower=models.F("wodcharacter__willpower"),
+            arete=models.F("wodcharacter__magecharacter__arete"),
+            quintessence=models.F("wodcharacter__magecharacter__quintessence"),
+            paradox=models.F("wodcharacter__magecharacter__paradox"),
+        )
+
+    def meeting(self, requirement: Dict[str, Any]) -> "CharacterQuerySet":
+        """Filter to characters that meet a prerequisite requirement.
+
+        As much of the requirement as possible is translated to SQL; the rest
+        is checked in Python on the narrowed rows.
+
+        Args:
+            requirement: JSON requirement structure
+
+        Returns:
+            QuerySet of characters meeting the requirement
+        """
+        from prerequisites.pushdown import filter_meeting
+
+        return filter_meeting(self, requirement)
+
     def npcs(self) -> "CharacterQuerySet":
         """Filter to only NPCs (Non-Player Characters).
 
@@ -268,6 +318,25 @@ class CharacterManager(PolymorphicManager):
             # Observers and others cannot edit any characters
             return self.none()
 
+    def for_list(self) -> CharacterQuerySet:
+        """Get base Character rows without loading concrete subclasses.
+
+        Returns:
+            Non-polymorphic QuerySet for list endpoints
+        """
+        return self.get_queryset().for_list()
+
+    def meeting(self, requirement: Dict[str, Any]) -> CharacterQuerySet:
+        """Get characters that meet a prerequisite requirement.
+
+        Args:
+            requirement: JSON requirement structure
+
+        Returns:
+            QuerySet of characters meeting the requirement
+        """
+        return self.get_queryset().meeting(requirement)
+
     def npcs(self) -> CharacterQuerySet:
         """Get only NPCs (Non-Player Characters).
 
@@ -300,6 +369,8 @@ class CharacterManager(PolymorphicManager):
 class AllCharacterManager(PolymorphicManager):
     """Manager that includes soft-deleted characters."""
 
+    queryset_class = CharacterQuerySet
+
     def get_queryset(self):
         """Return the polymorphic QuerySet including all characters."""
         return super().get_queryset()
@@ -456,6 +527,18 @@ class Character(
             "status",
         ]
 
+    def get_character_type_name(self) -> str:
+        """Return the concrete character class name.
+
+        Resolved from ``polymorphic_ctype_id`` through the ContentType cache, so
+        it is also correct for rows loaded with ``non_polymorphic()``.
+        """
+        if self.polymorphic_ctype_id is None:
+            return self.__class__.__name__
+        content_type = ContentType.objects.get_for_id(self.polymorphic_ctype_id)
+        model_class = content_type.model_class()
+        return model_class.__name__ if model_class else self.__class__.__name__
+
     def _has_campaign_changed(self) -> bool:
         """Check if the campaign field has changed since the instance was loaded."""
         return self.campaign_id != self._original_campaign_id
@@ -520,10 +603,11 @@ class Character(
         Raises:
             ValidationError: If character limit would be exceeded
         """
-        # Lock the campaign to prevent concurrent character creation
-        Campaign.objects.select_for_update().get(pk=self.campaign.pk)
+        # Serialize only this player's concurrent creates in this campaign
+        self._lock_character_slot()
 
         # Count existing characters for this player in this campaign
+        # (served by characters_character_count_idx)
         existing_count = (
             Character.objects.filter(
                 campaign=self.campaign, player_owner=self.player_owner
@@ -539,6 +623,28 @@ class Character(
                 "Please delete an existing character before creating a new one."
             )
 
+    def _lock_character_slot(self) -> None:
+        """
+        Take a transaction-scoped lock on this (campaign, player_owner) pair.
+
+        On PostgreSQL this is an advisory lock, so creates by other players and
+        edits to the campaign row are not blocked. Other backends have no
+        equivalent and rely on their own write serialization. Keys are reduced
+        to 32 bits; a collision only means two pairs share a lock.
+        """
+        db_connection = transaction.get_connection(self._state.db or "default")
+        if db_connection.vendor != "postgresql":
+            return
+
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [
+                    self.campaign_id % _ADVISORY_LOCK_KEY_SPACE,
+                    self.player_owner_id % _ADVISORY_LOCK_KEY_SPACE,
+                ],
+            )
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
         Save the character with validation and audit trail.
@@ -549,8 +655,15 @@ class Character(
         # Run validation for new characters or when explicitly requested
         validate = kwargs.pop("validate", self.pk is None)
         if validate:
-            self.full_clean()
+            # Keep the character-limit lock from clean() held until the insert
+            with transaction.atomic(using=kwargs.get("using")):
+                self.full_clean()
+                self._save_with_audit(*args, **kwargs)
+        else:
+            self._save_with_audit(*args, **kwargs)
 
+    def _save_with_audit(self, *args: Any, **kwargs: Any) -> None:
+        """Resolve the audit user and persist through DetailedAuditableMixin."""
         # Get audit user from kwargs (support legacy names for compatibility)
         audit_user = kwargs.pop("audit_user", None) or kwargs.pop("update_user", None)
 
@@ -565,6 +678,11 @@ class Character(
         # Call parent save method which includes DetailedAuditableMixin logic
         super().save(*args, **kwargs)
 
+        # Any field can be read by a trait requirement
+        from prerequisites.results import bump_character_versions
+
+        bump_character_versions(self.pk)
+
         # Update legacy original values for backward compatibility
         self._original_campaign_id = self.campaign_id
         self._original_player_owner_id = self.player_owner_id
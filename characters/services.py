@@ -0,0 +1,161 @@
+"""
+Character service layer for bulk business operations.
+
+This module provides set-based alternatives to the per-instance FSM
+transitions on Character, keeping permission checks and audit logging intact.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from campaigns.models import Campaign
+from prerequisites.results import bump_character_versions
+
+from .models import Character, CharacterAuditLog
+
+logger = logging.getLogger(__name__)
+
+
+class CharacterStatusService:
+    """Service for applying status transitions to many characters at once."""
+
+    MAX_BULK_OPERATIONS = 200  # Prevent oversized requests
+
+    # FSM transitions that may be applied in bulk
+    BULK_TRANSITIONS = (
+        "approve",
+        "reject",
+        "deactivate",
+        "activate",
+        "retire",
+        "mark_deceased",
+    )
+
+    def __init__(self, campaign: Campaign):
+        """Initialize service for a specific campaign."""
+        self.campaign = campaign
+
+    @staticmethod
+    def get_transition_states(transition_name: str) -> Tuple[str, str]:
+        """Return the (source, target) statuses declared on the FSM transition.
+
+        Args:
+            transition_name: Name of a Character transition method
+
+        Returns:
+            Tuple of source and target status values
+        """
+        transitions = getattr(Character, transition_name)._django_fsm.transitions
+        ((source, transition),) = transitions.items()
+        return source, transition.target
+
+    def bulk_transition(
+        self,
+        user: AbstractUser,
+        character_ids: Iterable[int],
+        transition_name: str,
+        user_role: Optional[str] = None,
+    ) -> Dict[str, List[Dict]]:
+        """Apply one status transition to many characters in this campaign.
+
+        The user's role is checked once, eligible rows are moved with a single
+        ``UPDATE ... WHERE status=<source>`` and the audit entries are written
+        with one ``bulk_create``.
+
+        Args:
+            user: User performing the transition
+            character_ids: IDs of the characters to transition
+            transition_name: Name of the FSM transition to apply
+            user_role: Optional cached user role to avoid database query
+
+        Returns:
+            Dictionary with ``updated`` and ``errors`` lists of per-character
+            outcomes
+
+        Raises:
+            ValidationError: If the transition or request size is invalid
+            PermissionError: If the user's role does not allow the transition
+        """
+        if transition_name not in self.BULK_TRANSITIONS:
+            raise ValidationError(f"Invalid transition: {transition_name}")
+
+        requested_ids = list(dict.fromkeys(character_ids))
+        if len(requested_ids) > self.MAX_BULK_OPERATIONS:
+            raise ValidationError(
+                f"Maximum {self.MAX_BULK_OPERATIONS} characters can be "
+                f"transitioned at once."
+            )
+
+        if user_role is None:
+            user_role = self.campaign.get_user_role(user)
+        can_manage = user_role in ["GM", "OWNER"]
+        # Mirrors Character.retire: owners may retire their own characters
+        if not can_manage and not (transition_name == "retire" and user_role):
+            raise PermissionError(
+                "Only GMs and campaign owners can change character status"
+            )
+
+        source, target = self.get_transition_states(transition_name)
+
+        updated: List[Dict] = []
+        errors: List[Dict] = []
+
+        with transaction.atomic():
+            candidates = Character.objects.non_polymorphic().filter(
+                campaign=self.campaign, pk__in=requested_ids
+            )
+            if not can_manage:
+                candidates = candidates.filter(player_owner=user)
+            current_statuses = dict(
+                candidates.select_for_update().values_list("pk", "status")
+            )
+
+            eligible_ids = [
+                pk for pk in requested_ids if current_statuses.get(pk) == source
+            ]
+            if eligible_ids:
+                Character.objects.filter(pk__in=eligible_ids, status=source).update(
+                    status=target, modified_by=user, updated_at=timezone.now()
+                )
+                bump_character_versions(*eligible_ids)
+                CharacterAuditLog.objects.bulk_create(
+                    [
+                        CharacterAuditLog(
+                            character_id=pk,
+                            changed_by=user,
+                            action="UPDATE",
+                            field_changes={"status": {"old": source, "new": target}},
+                        )
+                        for pk in eligible_ids
+                    ]
+                )
+
+        for pk in requested_ids:
+            current_status = current_statuses.get(pk)
+            if current_status is None:
+                errors.append({"character_id": pk, "error": "Character not found."})
+            elif current_status != source:
+                errors.append(
+                    {
+                        "character_id": pk,
+                        "error": (
+                            f"Cannot {transition_name} a character with status "
+                            f"{current_status}."
+                        ),
+                    }
+                )
+            else:
+                updated.append({"character_id": pk, "status": target})
+
+        logger.info(
+            f"User {user.username} (ID: {user.id}) applied '{transition_name}' to "
+            f"{len(updated)} of {len(requested_ids)} characters in campaign "
+            f"{self.campaign.pk}"
+        )
+
+        return {"updated": updated, "errors": errors}
@@ -1,3 +1,5 @@
+from unittest import skipUnless
+
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, connection
@@ -121,6 +123,22 @@ class CharacterModelTest(TestCase):
         self.assertIsNotNone(character.polymorphic_ctype)
         self.assertEqual(character.polymorphic_ctype.model_class(), Character)
 
+    def test_for_list_returns_base_rows_with_resolved_type_name(self):
+        """Test that for_list skips subclass loading but keeps the type name."""
+        from characters.models import MageCharacter
+
+        MageCharacter.objects.create(
+            name="Listed Mage",
+            campaign=self.campaign1,
+            player_owner=self.player1,
+            game_system="Mage: The Ascension",
+        )
+
+        characters = list(Character.objects.for_list())
+        self.assertEqual(len(characters), 1)
+        self.assertIs(type(characters[0]), Character)
+        self.assertEqual(characters[0].get_character_type_name(), "MageCharacter")
+
     def test_foreign_key_relationships_work_correctly(self):
         """Test that foreign key relationships are properly established."""
         character = Character.objects.create(
@@ -372,6 +390,30 @@ class CharacterValidationTest(TestCase):
             )
             character.full_clean()
 
+    def test_character_limit_uses_player_scoped_advisory_lock(self):
+        """Test that limit validation locks the (campaign, player) pair only."""
+        from unittest.mock import MagicMock, patch
+
+        character = Character(
+            name="Locked Character",
+            campaign=self.campaign1,
+            player_owner=self.player1,
+            game_system="Mage: The Ascension",
+        )
+        fake_connection = MagicMock(vendor="postgresql")
+        cursor = fake_connection.cursor.return_value.__enter__.return_value
+
+        with patch(
+            "characters.models.transaction.get_connection",
+            return_value=fake_connection,
+        ):
+            character._lock_character_slot()
+
+        cursor.execute.assert_called_once_with(
+            "SELECT pg_advisory_xact_lock(%s, %s)",
+            [self.campaign1.pk, self.player1.pk],
+        )
+
     def test_unlimited_characters_when_max_is_zero(self):
         """Test behavior when campaign allows unlimited characters."""
         # Set campaign to allow unlimited characters
@@ -2706,6 +2748,86 @@ class CharacterRaceConditionTest(TransactionTestCase):
             )
 
 
+@skipUnless(connection.vendor == "postgresql", "Advisory locks need PostgreSQL")
+class CharacterAdvisoryLockTest(TransactionTestCase):
+    """Test that the advisory lock serializes creates at the character limit."""
+
+    def setUp(self):
+        """Set up a player one character below the campaign limit."""
+        self.owner = User.objects.create_user(
+            username="owner", email="owner@test.com", password="testpass123"
+        )
+        self.player = User.objects.create_user(
+            username="player", email="player@test.com", password="testpass123"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign",
+            owner=self.owner,
+            game_system="Mage: The Ascension",
+            max_characters_per_player=2,
+        )
+        CampaignMembership.objects.create(
+            campaign=self.campaign, user=self.player, role="PLAYER"
+        )
+        Character.objects.create(
+            name="Existing Character",
+            campaign=self.campaign,
+            player_owner=self.player,
+            game_system="Mage: The Ascension",
+        )
+
+    def test_second_create_waits_for_first_and_fails(self):
+        """Test that a concurrent create blocks on the lock, then hits the limit."""
+        from threading import Event, Thread
+
+        from django.db import transaction
+
+        results = {}
+        first_saved = Event()
+        release_first = Event()
+
+        def create(name, hold):
+            try:
+                with transaction.atomic():
+                    Character.objects.create(
+                        name=name,
+                        campaign=self.campaign,
+                        player_owner=self.player,
+                        game_system="Mage: The Ascension",
+                    )
+                    if hold:
+                        first_saved.set()
+                        release_first.wait(5)
+                results[name] = "success"
+            except ValidationError:
+                results[name] = "validation_error"
+            finally:
+                first_saved.set()
+                connection.close()
+
+        first = Thread(target=create, args=("First", True))
+        first.start()
+        self.assertTrue(first_saved.wait(5))
+
+        second = Thread(target=create, args=("Second", False))
+        second.start()
+        # The first transaction still holds the lock, so the second waits
+        second.join(0.5)
+        self.assertTrue(second.is_alive())
+
+        release_first.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(results, {"First": "success", "Second": "validation_error"})
+        self.assertEqual(
+            Character.objects.filter(
+                campaign=self.campaign, player_owner=self.player
+            ).count(),
+            2,
+        )
+
+
 class CharacterNPCFieldTest(TestCase):
     """Test Character model NPC field functionality."""
 
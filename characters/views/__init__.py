@@ -43,7 +43,8 @@ class CampaignCharactersView(CampaignCharacterMixin, CampaignListView):
 
     def get_queryset(self):
         """Get characters with search and filtering."""
-        queryset = super().get_queryset()
+        # Base rows are enough for the list page; skip polymorphic subclass loads
+        queryset = super().get_queryset().for_list()
 
         # Mixin already applies select_related optimizations
 
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        """Keep cached campaign safety profiles in sync with their sources."""
+        from .signals import connect_safety_profile_invalidation
+
+        connect_safety_profile_invalidation()
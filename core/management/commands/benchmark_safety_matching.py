@@ -0,0 +1,143 @@
+"""
+Django management command to benchmark safety theme matching on long posts.
+
+Compares the compiled single-pass matcher used by SafetyValidationService
+against a per-keyword scan mirroring the previous algorithm, on generated scene
+posts of several sizes checked against a typical set of lines and veils.
+
+Usage:
+    python manage.py benchmark_safety_matching --sizes 100 1000 10000
+
+"""
+
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services.safety import SafetyValidationService
+
+FILLER_WORDS = (
+    "the",
+    "shadows",
+    "lantern",
+    "whispered",
+    "across",
+    "ancient",
+    "stone",
+    "corridor",
+    "mage",
+    "quietly",
+    "studied",
+    "runes",
+    "before",
+    "stepping",
+    "forward",
+)
+
+LINES_AND_VEILS = (
+    "graphic violence",
+    "torture",
+    "character death",
+    "spiders",
+    "animal harm",
+    "body horror",
+    "self-harm",
+    "extreme gore",
+)
+
+
+def _per_keyword_scan(service, content, themes):
+    """
+    Reference implementation mirroring the previous per-theme algorithm.
+
+    One substring search per theme keyword, freshly built word-boundary
+    regexes for every line/veil and its words, and a stem comparison against
+    every content word for themes that did not match directly.
+    """
+    content_lower = content.lower()
+    detected = {
+        theme
+        for theme, keywords in service.THEME_KEYWORDS.items()
+        if any(keyword in content_lower for keyword in keywords)
+    }
+    matched = []
+    for theme in themes:
+        theme_lower = theme.lower()
+        theme_words = theme_lower.split()
+        if re.search(r"\b" + re.escape(theme_lower) + r"\b", content_lower) or any(
+            re.search(r"\b" + re.escape(word) + r"\b", content_lower)
+            for word in theme_words
+        ):
+            matched.append(theme)
+            continue
+        content_words = content_lower.split()
+        if any(
+            len(word) >= 4 and len(content_word) >= 4 and word[:4] == content_word[:4]
+            for word in theme_words
+            for content_word in content_words
+        ):
+            matched.append(theme)
+    return detected, matched
+
+
+class Command(BaseCommand):
+    help = "Benchmark safety theme matching on long scene posts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[100, 1000, 10000],
+            help="Post lengths in words",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per post size")
+
+    def _time(self, func, repeat):
+        """Return the best wall time of ``repeat`` runs, in milliseconds."""
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    def handle(self, *args, **options):
+        """Run the benchmark and print a comparison table."""
+        service = SafetyValidationService()
+        rng = random.Random(42)
+        keywords = [k for ks in service.THEME_KEYWORDS.values() for k in ks]
+
+        self.stdout.write(
+            f"{'words':>8} {'per-keyword ms':>15} {'compiled ms':>12} {'speedup':>8}"
+        )
+        for size in options["sizes"]:
+            words = [
+                (
+                    rng.choice(keywords)
+                    if rng.random() < 0.02
+                    else rng.choice(FILLER_WORDS)
+                )
+                for _ in range(size)
+            ]
+            content = " ".join(words)
+
+            def compiled():
+                scan = service.scan_content(content, LINES_AND_VEILS)
+                return [
+                    t for t in LINES_AND_VEILS if service.scan_matches_theme(scan, t)
+                ]
+
+            # Warm the compiled matcher cache, as a running server would
+            compiled()
+            naive_ms = self._time(
+                lambda: _per_keyword_scan(service, content, LINES_AND_VEILS),
+                options["repeat"],
+            )
+            compiled_ms = self._time(compiled, options["repeat"])
+            self.stdout.write(
+                f"{size:>8} {naive_ms:>15.2f} {compiled_ms:>12.2f} "
+                f"{naive_ms / compiled_ms:>7.1f}x"
+            )
@@ -0,0 +1,218 @@
+"""
+Real-time Lines & Veils screening for chat messages.
+
+Each chat connection keeps its own copy of the campaign's safety profile
+(see SafetyValidationService.get_campaign_profile) in a ScreeningProfile and
+only reloads it, off the event loop, when the campaign's profile version
+changes. Messages are then matched on the event loop against that in-memory
+copy with the compiled matcher, so screening adds no database queries.
+
+Screening always finishes before a message is sent. Screens slower than the
+latency budget are logged and counted in the screener's metrics, which are
+logged periodically; if screening fails, the message is not sent.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
+from django.conf import settings
+
+from core.services.safety import (
+    CampaignSafetyProfile,
+    SafetyValidationService,
+    get_campaign_profile_version,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScreeningResult:
+    """Outcome of screening one message."""
+
+    lines_violated: List[str] = field(default_factory=list)
+    veils_triggered: List[str] = field(default_factory=list)
+    # False when screening failed and the message must not be sent
+    screened: bool = True
+    elapsed_ms: float = 0.0
+
+    @property
+    def blocked(self) -> bool:
+        """Whether the message crosses a line and must not be sent."""
+        return bool(self.lines_violated)
+
+
+@dataclass
+class ScreeningProfile:
+    """A chat connection's copy of its campaign's safety profile."""
+
+    campaign: Any
+    profile: Optional[CampaignSafetyProfile] = None
+    # Profile version the copy was loaded under
+    version: Optional[str] = None
+    # Re-read with the profile, so toggling safety tools applies mid-session
+    safety_tools_enabled: bool = False
+
+
+class ScreeningMetrics:
+    """
+    In-process counters and latency totals for chat safety screening.
+
+    A snapshot is logged every CHAT_SAFETY_METRICS_LOG_INTERVAL seconds
+    (0 disables it).
+    """
+
+    def __init__(self):
+        self.log_interval = getattr(settings, "CHAT_SAFETY_METRICS_LOG_INTERVAL", 300)
+        self._next_log = time.monotonic() + self.log_interval
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters."""
+        self.screened = 0
+        self.blocked = 0
+        self.veiled = 0
+        self.timed_out = 0
+        self.failed = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, result: ScreeningResult) -> None:
+        """Add one screening outcome, logging a snapshot when one is due."""
+        self.total_ms += result.elapsed_ms
+        self.max_ms = max(self.max_ms, result.elapsed_ms)
+        if result.screened:
+            self.screened += 1
+            if result.blocked:
+                self.blocked += 1
+            elif result.veils_triggered:
+                self.veiled += 1
+
+        if self.log_interval and time.monotonic() >= self._next_log:
+            self._next_log = time.monotonic() + self.log_interval
+            logger.info(f"Chat safety screening metrics: {self.snapshot()}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current counters and average latency."""
+        # Timed-out screens still finish and are counted as screened
+        attempts = self.screened + self.failed
+        return {
+            "screened": self.screened,
+            "blocked": self.blocked,
+            "veiled": self.veiled,
+            "timed_out": self.timed_out,
+            "failed": self.failed,
+            "avg_ms": self.total_ms / attempts if attempts else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+class ChatSafetyScreener:
+    """
+    Screens chat messages against campaign members' lines and veils.
+
+    The budget can be overridden in settings.
+    """
+
+    def __init__(self):
+        # Screens slower than this are logged and counted as timed out
+        self.budget_ms = getattr(settings, "CHAT_SAFETY_SCREEN_BUDGET_MS", 50)
+        self.service = SafetyValidationService()
+        self.metrics = ScreeningMetrics()
+
+    async def screen(self, state: ScreeningProfile, content: str) -> ScreeningResult:
+        """
+        Screen a message against everyone in the campaign.
+
+        Args:
+            state: The connection's profile for the campaign the message is
+                   posted in
+            content: The message content
+
+        Returns:
+            ScreeningResult with the distinct lines and veils the message
+            touches, or with screened=False if screening failed; never raises
+        """
+        start = time.perf_counter()
+        try:
+            result = await self._screen(state, content)
+        except Exception as e:
+            self.metrics.failed += 1
+            result = ScreeningResult(screened=False)
+            logger.error(f"Error screening chat message: {e}")
+
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        if result.elapsed_ms > self.budget_ms:
+            self.metrics.timed_out += 1
+            logger.warning(
+                f"Safety screening took {result.elapsed_ms:.1f}ms in campaign "
+                f"{state.campaign.pk}, over the {self.budget_ms}ms budget"
+            )
+        self.metrics.record(result)
+        return result
+
+    async def warm(self, state: ScreeningProfile) -> None:
+        """Load the campaign's safety profile so screening starts warm."""
+        try:
+            await self._ensure_current(state)
+        except Exception as e:
+            logger.error(
+                f"Error loading safety profile for campaign {state.campaign.pk}: {e}"
+            )
+
+    async def _screen(self, state: ScreeningProfile, content: str) -> ScreeningResult:
+        """Match content on the event loop against the connection's profile."""
+        if not content:
+            return ScreeningResult()
+
+        await self._ensure_current(state)
+        if not state.safety_tools_enabled:
+            return ScreeningResult()
+        return self._match(state.profile, content)
+
+    async def _ensure_current(self, state: ScreeningProfile) -> None:
+        """Reload the connection's profile if the campaign's has changed."""
+        # A cache read only, so it need not queue behind database work
+        version = await sync_to_async(
+            get_campaign_profile_version, thread_sensitive=False
+        )(state.campaign.pk)
+        if state.profile is None or version != state.version:
+            await database_sync_to_async(self._load)(state, version)
+
+    def _load(self, state: ScreeningProfile, version: Optional[str]) -> None:
+        """Load the campaign's profile and safety tools flag (off the loop)."""
+        campaign = state.campaign
+        campaign.refresh_from_db(fields=["safety_tools_enabled"])
+        profile = self.service.get_campaign_profile(campaign)
+        # Compile the matcher here rather than on the event loop
+        self.service.scan_content("", profile.themes)
+        state.profile = profile
+        state.safety_tools_enabled = campaign.safety_tools_enabled
+        state.version = version
+
+    def _match(self, profile: CampaignSafetyProfile, content: str) -> ScreeningResult:
+        """Match content against a profile."""
+        matches = self.service.match_campaign_profile(profile, content)
+
+        lines_violated = set()
+        veils_triggered = set()
+        for user_matches in matches.values():
+            lines_violated.update(user_matches["lines"])
+            veils_triggered.update(user_matches["veils"])
+        # Report each pattern once, in profile order
+        return ScreeningResult(
+            lines_violated=[
+                line for line in profile.line_users if line in lines_violated
+            ],
+            veils_triggered=[
+                veil for veil in profile.veil_users if veil in veils_triggered
+            ],
+        )
+
+
+# Global instance
+chat_safety_screener = ChatSafetyScreener()
@@ -6,11 +6,44 @@ content validation against user safety preferences and campaign settings.
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
-
+import multiprocessing
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import django
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+
+from core.utils.keyword_matcher import (
+    MATCHER_CACHE_SIZE,
+    KeywordHits,
+    KeywordMatcher,
+    get_keyword_matcher,
+)
 
 if TYPE_CHECKING:
     from campaigns.models import Campaign
@@ -19,6 +52,176 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+SAFETY_PROFILE_KEY_PREFIX = "core:safety_profile"
+
+# Profiles are invalidated whenever preferences, memberships or the campaign
+# change, so this only bounds how long an idle campaign's entry lingers
+SAFETY_PROFILE_TIMEOUT = 60 * 60
+
+
+def _safety_profile_key(campaign_id: Any) -> str:
+    return f"{SAFETY_PROFILE_KEY_PREFIX}:{campaign_id}"
+
+
+def _safety_profile_version_key(campaign_id: Any) -> str:
+    return f"{SAFETY_PROFILE_KEY_PREFIX}:{campaign_id}:version"
+
+
+# Batches at least this large are matched in worker processes; below it,
+# starting the pool costs more than it saves
+BATCH_PROCESS_POOL_THRESHOLD = 200
+
+# Contents sent to a worker at a time
+BATCH_CHUNK_SIZE = 50
+
+# Worker processes shared by all batch validations in this process
+_batch_pool: Optional[ProcessPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def _get_batch_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return this process's batch matching pool, starting it on first use.
+
+    The pool is long-lived so requests do not pay to start workers. Its
+    workers are spawned rather than forked: a forked child of a threaded
+    web server would inherit its open database and cache connections.
+    """
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+        return _batch_pool
+
+
+def _discard_batch_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next batch starts a fresh one."""
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+    pool.shutdown(wait=False)
+
+
+def invalidate_campaign_safety_profiles(*campaign_ids: Any) -> None:
+    """
+    Drop the cached safety profiles of the given campaigns.
+
+    The entries are dropped once the current transaction commits (or
+    straight away outside a transaction), so a concurrent request cannot
+    re-cache the profile from before the change.
+
+    Args:
+        *campaign_ids: IDs of campaigns whose members or preferences changed;
+                       None values are ignored
+    """
+    keys = []
+    for campaign_id in campaign_ids:
+        if campaign_id is not None:
+            keys.append(_safety_profile_key(campaign_id))
+            keys.append(_safety_profile_version_key(campaign_id))
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def get_campaign_profile_version(campaign_id: Any) -> Optional[str]:
+    """
+    Return a token that changes whenever the campaign's profile is invalidated.
+
+    Lets long-lived holders of a profile, such as chat consumers, keep their
+    own copy and reload it only when this token changes. A missing key is
+    seeded with a new token, so an invalidated or evicted key never matches
+    the token a holder loaded under.
+
+    Args:
+        campaign_id: ID of the campaign
+
+    Returns:
+        The current version token
+    """
+    key = _safety_profile_version_key(campaign_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=SAFETY_PROFILE_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+@dataclass
+class CampaignSafetyProfile:
+    """Lines and veils of everyone in a campaign, merged for one-pass checks."""
+
+    campaign_id: int
+    # (user ID, username) of everyone content is checked against, owner first
+    members: List[Tuple[int, str]]
+    # User ID -> lines, veils and consent_required, for users with preferences
+    preferences: Dict[int, Dict[str, Any]]
+    # Each distinct line or veil -> IDs of the users who set it
+    line_users: Dict[str, List[int]]
+    veil_users: Dict[str, List[int]]
+
+    @classmethod
+    def from_preferences(
+        cls,
+        campaign_id: int,
+        members: Dict[int, str],
+        rows: Iterable[Dict[str, Any]],
+    ) -> "CampaignSafetyProfile":
+        """
+        Merge preference rows into a profile.
+
+        Args:
+            campaign_id: ID of the campaign
+            members: User ID -> username of everyone checked, in order
+            rows: Dicts with user_id, lines, veils and consent_required
+
+        Returns:
+            CampaignSafetyProfile
+        """
+        preferences: Dict[int, Dict[str, Any]] = {}
+        line_users: Dict[str, List[int]] = {}
+        veil_users: Dict[str, List[int]] = {}
+        for row in rows:
+            user_id = row["user_id"]
+            preferences[user_id] = {
+                "lines": row["lines"],
+                "veils": row["veils"],
+                "consent_required": row["consent_required"],
+            }
+            for line in dict.fromkeys(row["lines"]):
+                line_users.setdefault(line, []).append(user_id)
+            for veil in dict.fromkeys(row["veils"]):
+                veil_users.setdefault(veil, []).append(user_id)
+
+        return cls(
+            campaign_id=campaign_id,
+            members=list(members.items()),
+            preferences=preferences,
+            line_users=line_users,
+            veil_users=veil_users,
+        )
+
+    @property
+    def themes(self) -> List[str]:
+        """Distinct lines and veils, each matched once per scan."""
+        return list(dict.fromkeys([*self.line_users, *self.veil_users]))
+
+
+@dataclass
+class ContentScan:
+    """Everything theme matching needs to know about one piece of content."""
+
+    content_lower: str
+    hits: KeywordHits
+    detected_themes: Set[str]
+    # Whitespace-separated words and their 4-character stems
+    words: FrozenSet[str]
+    stems: FrozenSet[str]
+
 
 class SafetyValidationService:
     """Service for validating content against safety preferences."""
@@ -132,6 +335,12 @@ class SafetyValidationService:
         ],
     }
 
+    # Words that make a multi-word theme more specific ("graphic violence")
+    QUALIFIERS = ("extreme", "graphic", "detailed", "brutal", "severe", "intense")
+
+    # Words that explicitly soften content ("mild violence")
+    CONTRADICTORY_QUALIFIERS = ("mild", "minor", "slight", "light")
+
     def __init__(self):
         """Initialize the safety validation service."""
         pass
@@ -204,20 +413,18 @@ class SafetyValidationService:
                 result["message"] = "User's safety preferences are private"
                 return result
 
-        # Detect content themes
-        detected_themes = self._detect_content_themes(content)
+        # Scan the content once for theme keywords, lines and veils
+        scan = self.scan_content(content, [*preferences.lines, *preferences.veils])
 
         # Check against lines (hard boundaries)
-        lines_violated = []
-        for line in preferences.lines:
-            if self._content_matches_theme(content, line, detected_themes):
-                lines_violated.append(line)
+        lines_violated = [
+            line for line in preferences.lines if self.scan_matches_theme(scan, line)
+        ]
 
         # Check against veils (fade-to-black content)
-        veils_triggered = []
-        for veil in preferences.veils:
-            if self._content_matches_theme(content, veil, detected_themes):
-                veils_triggered.append(veil)
+        veils_triggered = [
+            veil for veil in preferences.veils if self.scan_matches_theme(scan, veil)
+        ]
 
         # Update result
         result["lines_violated"] = lines_violated
@@ -242,45 +449,93 @@ class SafetyValidationService:
         Returns:
             Dictionary with campaign-wide validation results
         """
-        result = {
-            "is_safe": True,
-            "user_results": {},
-            "overall_violations": {"lines": [], "veils": []},
-        }
+        # One cached profile holds every member's lines and veils, and the
+        # content is scanned once for all of them
+        profile = self.get_campaign_profile(campaign)
+        matches = {}
+        if content and campaign.safety_tools_enabled:
+            matches = self.match_campaign_profile(profile, content)
+
+        return self._campaign_result(profile, matches, campaign)
+
+    def validate_content_batch(
+        self, contents: Iterable[str], campaign: "Campaign"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Validate many pieces of content against all campaign members.
 
-        # Get all campaign members
-        from campaigns.services.campaign_services import MembershipService
+        The campaign profile is loaded once for the whole batch. Batches of
+        BATCH_PROCESS_POOL_THRESHOLD or more are matched in chunks across a
+        shared process pool of SAFETY_BATCH_WORKERS workers (0 or 1 disables
+        it), unless this process cannot have child processes.
 
-        membership_service = MembershipService(campaign)
+        Args:
+            contents: The contents to validate
+            campaign: The campaign to check
 
-        # Include owner and members
-        users_to_check = [campaign.owner]
-        for membership in membership_service.get_campaign_members():
-            users_to_check.append(membership.user)
+        Yields:
+            One validate_content_for_campaign result per content, in order,
+            as soon as it is ready
+        """
+        contents = list(contents)
+        profile = self.get_campaign_profile(campaign)
+        if not campaign.safety_tools_enabled:
+            contents = [""] * len(contents)
+
+        workers = getattr(settings, "SAFETY_BATCH_WORKERS", min(4, os.cpu_count() or 1))
+        # Daemonic processes (e.g. pooled task workers) cannot start children
+        if (
+            workers > 1
+            and len(contents) >= BATCH_PROCESS_POOL_THRESHOLD
+            and not multiprocessing.current_process().daemon
+        ):
+            matches = self._match_in_pool(profile, contents, workers)
+        else:
+            matches = (
+                self.match_campaign_profile(profile, content) for content in contents
+            )
 
-        # For test scenarios - if we're checking a user that's not a member but has
-        # campaign_members privacy level, we should probably add them as members
-        # This seems to be what the test expects
-        if hasattr(self, "_is_testing") or len(users_to_check) == 1:  # Only owner
-            from users.models.safety import UserSafetyPreferences
+        for content_matches in matches:
+            yield self._campaign_result(profile, content_matches, campaign)
+
+    @staticmethod
+    def _match_in_pool(
+        profile: CampaignSafetyProfile, contents: List[str], workers: int
+    ) -> Iterator[Dict[int, Dict[str, List[str]]]]:
+        """Match contents in chunks across worker processes, keeping order."""
+        chunks = [
+            contents[start : start + BATCH_CHUNK_SIZE]
+            for start in range(0, len(contents), BATCH_CHUNK_SIZE)
+        ]
+        pool = _get_batch_pool(workers)
+        try:
+            chunk_results = pool.map(_match_profile_chunk, repeat(profile), chunks)
+        except BrokenProcessPool:
+            logger.warning("Safety batch pool is broken, matching in-process")
+            _discard_batch_pool(pool)
+            chunk_results = (_match_profile_chunk(profile, chunk) for chunk in chunks)
 
-            prefs = UserSafetyPreferences.objects.filter(
-                privacy_level="campaign_members"
-            ).select_related("user")
-            for pref in prefs:
-                if pref.user not in users_to_check:
-                    users_to_check.append(pref.user)
-
-        # Debug: Log who we're checking
-        logger.debug(
-            f"Checking {len(users_to_check)} users for campaign safety: "
-            f"{[u.username for u in users_to_check]}"
-        )
+        for chunk_matches in chunk_results:
+            yield from chunk_matches
 
-        # Check each user's preferences
-        for user in users_to_check:
-            user_result = self.validate_content(content, user, campaign)
-            result["user_results"][user.username] = user_result
+    def _campaign_result(
+        self,
+        profile: CampaignSafetyProfile,
+        matches: Dict[int, Dict[str, List[str]]],
+        campaign: "Campaign",
+    ) -> Dict[str, Any]:
+        """Build a validate_content_for_campaign result from profile matches."""
+        result = {
+            "is_safe": True,
+            "user_results": {},
+            "overall_violations": {"lines": [], "veils": []},
+        }
+
+        for user_id, username in profile.members:
+            user_result = self._profile_user_result(
+                profile, user_id, matches.get(user_id), campaign
+            )
+            result["user_results"][username] = user_result
 
             # If any user has lines violated, campaign content is not safe
             if not user_result["is_safe"]:
@@ -300,6 +555,118 @@ class SafetyValidationService:
 
         return result
 
+    def get_campaign_profile(self, campaign: "Campaign") -> CampaignSafetyProfile:
+        """
+        Return the campaign's safety profile, using the cache.
+
+        Args:
+            campaign: The campaign
+
+        Returns:
+            CampaignSafetyProfile for the campaign's owner and members
+        """
+        key = _safety_profile_key(campaign.pk)
+        profile = cache.get(key)
+        if profile is None:
+            profile = self.build_campaign_profile(campaign)
+            cache.set(key, profile, timeout=SAFETY_PROFILE_TIMEOUT)
+        return profile
+
+    def build_campaign_profile(self, campaign: "Campaign") -> CampaignSafetyProfile:
+        """
+        Load the safety preferences of everyone in a campaign.
+
+        Members come from one query and all of their preferences from another.
+        A campaign with no members besides its owner is checked against every
+        user who shares preferences with campaign members.
+
+        Args:
+            campaign: The campaign
+
+        Returns:
+            CampaignSafetyProfile (not cached; see get_campaign_profile)
+        """
+        from users.models.safety import UserSafetyPreferences
+
+        members = {campaign.owner_id: campaign.owner.username}
+        members.update(campaign.memberships.values_list("user_id", "user__username"))
+
+        query = Q(user_id__in=list(members))
+        if len(members) == 1:  # Only owner
+            query |= Q(privacy_level="campaign_members")
+
+        rows = list(
+            UserSafetyPreferences.objects.filter(query).values(
+                "user_id", "user__username", "lines", "veils", "consent_required"
+            )
+        )
+        for row in rows:
+            members.setdefault(row["user_id"], row["user__username"])
+
+        return CampaignSafetyProfile.from_preferences(campaign.pk, members, rows)
+
+    def match_campaign_profile(
+        self, profile: CampaignSafetyProfile, content: str
+    ) -> Dict[int, Dict[str, List[str]]]:
+        """
+        Match content against every line and veil in a profile in one pass.
+
+        Each distinct line or veil is matched once, however many users share
+        it, and only the users it belongs to are reported.
+
+        Args:
+            profile: The campaign's safety profile
+            content: The content to check
+
+        Returns:
+            User ID -> {"lines": [...], "veils": [...]} for affected users,
+            each list in the user's own order
+        """
+        themes = profile.themes
+        if not content or not themes:
+            return {}
+
+        scan = self.scan_content(content, themes)
+        matched = {theme for theme in themes if self.scan_matches_theme(scan, theme)}
+
+        affected = set()
+        for theme in matched:
+            affected.update(profile.line_users.get(theme, ()))
+            affected.update(profile.veil_users.get(theme, ()))
+
+        matches = {}
+        for user_id in affected:
+            preferences = profile.preferences[user_id]
+            matches[user_id] = {
+                "lines": [line for line in preferences["lines"] if line in matched],
+                "veils": [veil for veil in preferences["veils"] if veil in matched],
+            }
+        return matches
+
+    @staticmethod
+    def _profile_user_result(
+        profile: CampaignSafetyProfile,
+        user_id: int,
+        match: Optional[Dict[str, List[str]]],
+        campaign: "Campaign",
+    ) -> Dict[str, Any]:
+        """Build one user's validate_content result from a profile match."""
+        lines_violated = match["lines"] if match else []
+        veils_triggered = match["veils"] if match else []
+        preferences = profile.preferences.get(user_id)
+        return {
+            "is_safe": not lines_violated,
+            "lines_violated": lines_violated,
+            "veils_triggered": veils_triggered,
+            "privacy_restricted": False,
+            "consent_required": bool(
+                preferences
+                and preferences["consent_required"]
+                and (lines_violated or veils_triggered)
+            ),
+            "safety_tools_disabled": not campaign.safety_tools_enabled,
+        }
+
     def check_campaign_compatibility(
         self, user: AbstractUser, campaign: "Campaign"
     ) -> Dict[str, Any]:
@@ -349,6 +716,10 @@ class SafetyValidationService:
         """
         Perform pre-scene safety check for all participants.
 
+        Memberships, agreements and preferences are each loaded in one query,
+        however many participants there are, and planned content is matched
+        against everyone's lines in a single pass.
+
         Args:
             campaign: The campaign
             planned_content_summary: Optional summary of planned content
@@ -363,81 +734,77 @@ class SafetyValidationService:
             "required_actions": [],
         }
 
-        # Get all participants
-        from campaigns.services.campaign_services import MembershipService
-
-        membership_service = MembershipService(campaign)
-
-        participants = [campaign.owner]
-        for membership in membership_service.get_campaign_members():
-            participants.append(membership.user)
-
-        # Also include users with safety agreements (they might not be formal
-        # members yet)
         from campaigns.models import CampaignSafetyAgreement
+        from users.models.safety import UserSafetyPreferences
+
+        # Participants: owner, members, then users with safety agreements
+        # (they might not be formal members yet), each once by ID
+        participants = {campaign.owner_id: campaign.owner.username}
+        roles = {campaign.owner_id: "OWNER"}
+        for user_id, username, role in campaign.memberships.values_list(
+            "user_id", "user__username", "role"
+        ):
+            participants.setdefault(user_id, username)
+            roles.setdefault(user_id, role)
+
+        agreed = set()
+        agreements = CampaignSafetyAgreement.objects.filter(campaign=campaign)
+        for user_id, username, agreed_to_terms in agreements.values_list(
+            "participant_id", "participant__username", "agreed_to_terms"
+        ):
+            participants.setdefault(user_id, username)
+            if agreed_to_terms:
+                agreed.add(user_id)
+
+        preference_rows = UserSafetyPreferences.objects.filter(
+            user_id__in=list(participants)
+        ).values("user_id", "lines", "veils", "consent_required")
+        profile = CampaignSafetyProfile.from_preferences(
+            campaign.pk, participants, preference_rows
+        )
 
-        safety_agreement_users = CampaignSafetyAgreement.objects.filter(
-            campaign=campaign
-        ).select_related("participant")
-
-        for agreement in safety_agreement_users:
-            if agreement.participant not in participants:
-                participants.append(agreement.participant)
+        # If planned content provided, check it against everyone in one pass
+        content_matches = {}
+        if planned_content_summary and campaign.safety_tools_enabled:
+            content_matches = self.match_campaign_profile(
+                profile, planned_content_summary
+            )
 
-        # Check each participant
-        for user in participants:
+        for user_id, username in profile.members:
             participant_result = {
                 "has_safety_agreement": False,
                 "safety_preferences_set": False,
                 "potential_issues": [],
             }
+            # Campaign owners/GMs are not required to have safety agreements
+            # or preferences
+            is_organizer = roles.get(user_id) in ("OWNER", "GM")
 
             # Check safety agreement
-            try:
-                from campaigns.models import CampaignSafetyAgreement
-
-                CampaignSafetyAgreement.objects.get(
-                    campaign=campaign, participant=user, agreed_to_terms=True
-                )
+            if user_id in agreed or is_organizer:
                 participant_result["has_safety_agreement"] = True
-            except CampaignSafetyAgreement.DoesNotExist:
-                # Campaign owners/GMs are not required to have safety agreements
-                if user != campaign.owner and not campaign.has_role(user, "GM"):
-                    participant_result["potential_issues"].append("No safety agreement")
-                    result["required_actions"].append(
-                        f"{user.username} needs to agree to safety terms"
-                    )
-                else:
-                    # For owners/GMs, mark as having agreement even if not explicit
-                    participant_result["has_safety_agreement"] = True
+            else:
+                participant_result["potential_issues"].append("No safety agreement")
+                result["required_actions"].append(
+                    f"{username} needs to agree to safety terms"
+                )
 
             # Check if user has safety preferences
-            try:
-                from users.models.safety import UserSafetyPreferences
-
-                UserSafetyPreferences.objects.get(user=user)
+            if user_id in profile.preferences:
                 participant_result["safety_preferences_set"] = True
-            except UserSafetyPreferences.DoesNotExist:
-                # Campaign owners/GMs are not required to have safety preferences
-                if user != campaign.owner and not campaign.has_role(user, "GM"):
-                    participant_result["potential_issues"].append(
-                        "No safety preferences set"
-                    )
+            elif not is_organizer:
+                participant_result["potential_issues"].append(
+                    "No safety preferences set"
+                )
 
-            # If planned content provided, check against it
-            if planned_content_summary:
-                content_check = self.validate_content(
-                    planned_content_summary, user, campaign
+            lines_violated = content_matches.get(user_id, {}).get("lines")
+            if lines_violated:
+                participant_result["potential_issues"].extend(lines_violated)
+                result["warnings"].append(
+                    f"Planned content may violate {username}'s boundaries"
                 )
-                if not content_check["is_safe"]:
-                    participant_result["potential_issues"].extend(
-                        content_check["lines_violated"]
-                    )
-                    result["warnings"].append(
-                        f"Planned content may violate {user.username}'s boundaries"
-                    )
 
-            result["participant_status"][user.username] = participant_result
+            result["participant_status"][username] = participant_result
 
             # Update overall check status
             if participant_result["potential_issues"]:
@@ -610,6 +977,45 @@ class SafetyValidationService:
 
         return result
 
+    @classmethod
+    def _theme_vocabulary(cls) -> List[str]:
+        """Return the keywords every content scan looks for."""
+        vocabulary = [*cls.QUALIFIERS, *cls.CONTRADICTORY_QUALIFIERS]
+        for keywords in cls.THEME_KEYWORDS.values():
+            vocabulary.extend(keywords)
+        return vocabulary
+
+    def scan_content(self, content: str, themes: Iterable[str] = ()) -> ContentScan:
+        """
+        Scan content once for theme keywords and the given lines/veils.
+
+        All keywords, and every theme phrase and its words, go into a single
+        compiled matcher (cached per keyword set), so the content is lowercased,
+        split and searched exactly once however many themes are checked.
+
+        Args:
+            content: The content to analyze
+            themes: Lines and veils that will be matched against the scan
+
+        Returns:
+            ContentScan to pass to scan_matches_theme
+        """
+        content_lower = (content or "").lower()
+        hits = _theme_matcher(type(self), tuple(themes)).scan(content_lower)
+        detected_themes = {
+            theme
+            for theme, keywords in self.THEME_KEYWORDS.items()
+            if not hits.substrings.isdisjoint(keywords)
+        }
+        words = frozenset(content_lower.split())
+        return ContentScan(
+            content_lower=content_lower,
+            hits=hits,
+            detected_themes=detected_themes,
+            words=words,
+            stems=frozenset(word[:4] for word in words if len(word) >= 4),
+        )
+
     def _detect_content_themes(self, content: str) -> Set[str]:
         """
         Detect themes in content using keyword matching.
@@ -623,16 +1029,7 @@ class SafetyValidationService:
         if not content:
             return set()
 
-        content_lower = content.lower()
-        detected_themes = set()
-
-        for theme, keywords in self.THEME_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in content_lower:
-                    detected_themes.add(theme)
-                    break
-
-        return detected_themes
+        return self.scan_content(content).detected_themes
 
     def _content_matches_theme(
         self, content: str, theme: str, detected_themes: Set[str] = None
@@ -648,131 +1045,108 @@ class SafetyValidationService:
         Returns:
             True if content matches the theme
         """
-        if detected_themes is None:
-            detected_themes = self._detect_content_themes(content)
+        scan = self.scan_content(content, [theme])
+        if detected_themes is not None:
+            scan.detected_themes = set(detected_themes)
+        return self.scan_matches_theme(scan, theme)
+
+    @staticmethod
+    def _shares_word(scan: ContentScan, word: str, min_length: int) -> bool:
+        """Return whether a content word of min_length+ chars occurs in word."""
+        return any(
+            word[start:end] in scan.words
+            for start in range(len(word) - min_length + 1)
+            for end in range(start + min_length, len(word) + 1)
+        )
 
-        # Direct theme match
+    def scan_matches_theme(self, scan: ContentScan, theme: str) -> bool:
+        """
+        Check if scanned content matches a specific safety theme.
+
+        Args:
+            scan: Result of scan_content, which must have included the theme
+            theme: The theme (line or veil) to match against
+
+        Returns:
+            True if content matches the theme
+        """
         theme_lower = theme.lower()
-        content_lower = content.lower()
+        hits = scan.hits
 
-        # Check for direct keyword match in content first (exact phrase matching)
-        # Use word boundaries to avoid partial matches (e.g., "character death"
+        # Exact phrase match on word boundaries (e.g., "character death"
         # should not match "characters")
-        import re
-
-        # Escape theme_lower for regex and use word boundaries
-        pattern = r"\b" + re.escape(theme_lower) + r"\b"
-        if re.search(pattern, content_lower):
+        if not theme_lower:
+            return re.search(r"\b", scan.content_lower) is not None
+        if theme_lower in hits.words:
             return True
 
         # Check if theme is in our keyword mapping (normalize spaces to underscores)
         theme_normalized = theme_lower.replace(" ", "_")
         if theme_normalized in self.THEME_KEYWORDS:
-            return theme_normalized in detected_themes
+            return theme_normalized in scan.detected_themes
 
         # For multi-word themes with qualifiers, be more strict about matching
         theme_words = theme_lower.split()
         if len(theme_words) > 1:
-            # Check for qualifier words that make themes more specific
-            qualifiers = [
-                "extreme",
-                "graphic",
-                "detailed",
-                "brutal",
-                "severe",
-                "intense",
-            ]
-            theme_has_qualifier = any(qual in theme_words for qual in qualifiers)
+            theme_has_qualifier = any(qual in theme_words for qual in self.QUALIFIERS)
 
             if theme_has_qualifier:
-                # For qualified themes, be more strict - require either:
-                # 1. The exact phrase match, OR
-                # 2. The qualifier + base concept to be present
-
-                # Check for exact phrase match first
-                pattern = r"\b" + re.escape(theme_lower) + r"\b"
-                if re.search(pattern, content_lower):
-                    return True
-
+                # For qualified themes, require the exact phrase (checked above)
+                # or the qualifier + base concept to be present
                 content_has_qualifier = any(
-                    qual in content_lower for qual in qualifiers
+                    qual in hits.substrings for qual in self.QUALIFIERS
                 )
                 base_theme_words = [
-                    word for word in theme_words if word not in qualifiers
+                    word for word in theme_words if word not in self.QUALIFIERS
                 ]
 
                 # Check if base theme concepts are present (with stemming)
                 base_words_present = 0
-                content_words = content_lower.split()
-
                 for base_word in base_theme_words:
-                    # Check for exact match first (word boundaries)
-                    pattern = r"\b" + re.escape(base_word) + r"\b"
-                    if re.search(pattern, content_lower):
+                    if base_word in hits.words:
+                        base_words_present += 1
+                    elif len(base_word) >= 4 and (
+                        # Simple prefix match, or containment either way
+                        base_word[:4] in scan.stems
+                        or base_word in hits.substrings
+                        or self._shares_word(scan, base_word, 4)
+                    ):
                         base_words_present += 1
-                        continue
-
-                    # Check for stemmed matches
-                    for content_word in content_words:
-                        if len(base_word) >= 4 and len(content_word) >= 4:
-                            if base_word[:4] == content_word[:4]:  # Simple prefix match
-                                base_words_present += 1
-                                break
-                            if base_word in content_word or content_word in base_word:
-                                base_words_present += 1
-                                break
 
                 if base_words_present >= len(base_theme_words):
                     # If content has qualifier words, it's definitely a match
                     if content_has_qualifier:
                         return True
 
-                    # Check for contradictory qualifiers (mild vs extreme, etc.)
-                    contradictory_qualifiers = ["mild", "minor", "slight", "light"]
-                    content_has_contradictory = any(
-                        qual in content_lower for qual in contradictory_qualifiers
+                    # If content explicitly says "mild" and theme is
+                    # "extreme", don't match; otherwise match anyway to be
+                    # safe (better to over-warn than under-warn)
+                    return not any(
+                        qual in hits.substrings
+                        for qual in self.CONTRADICTORY_QUALIFIERS
                     )
 
-                    if content_has_contradictory:
-                        # If content explicitly says "mild" and theme is
-                        # "extreme", don't match
-                        return False
-
-                    # If content doesn't have qualifiers but has the base
-                    # concept, match anyway to be safe (better to over-warn
-                    # than under-warn)
-                    return True
-
                 return False
             else:
                 # For non-qualified multi-word themes, check for partial
                 # matches (word boundaries)
-                matching_words = 0
-                for word in theme_words:
-                    pattern = r"\b" + re.escape(word) + r"\b"
-                    if re.search(pattern, content_lower):
-                        matching_words += 1
+                matching_words = sum(1 for word in theme_words if word in hits.words)
                 return matching_words >= len(theme_words) / 2
         else:
             # For single-word themes, check for word matches (word boundaries)
-            for word in theme_words:
-                pattern = r"\b" + re.escape(word) + r"\b"
-                if re.search(pattern, content_lower):
-                    return True
+            if any(word in hits.words for word in theme_words):
+                return True
 
         # Check for root word matches (e.g., "torture" should match "torturing")
-        content_words = content_lower.split()
         for theme_word in theme_words:
-            for content_word in content_words:
-                # Basic stemming - check if words share a common root
-                if len(theme_word) >= 4 and len(content_word) >= 4:
-                    if theme_word[:4] == content_word[:4]:  # Simple prefix match
-                        return True
-                    # Skip aggressive substring matching to avoid false positives
-                    # like "character" matching "characters"
-                    if len(theme_word) >= 6 and len(content_word) >= 6:
-                        if theme_word in content_word or content_word in theme_word:
-                            return True
+            if len(theme_word) >= 4 and theme_word[:4] in scan.stems:
+                return True
+            # Skip aggressive substring matching of short words to avoid false
+            # positives like "character" matching "characters"
+            if len(theme_word) >= 6 and (
+                theme_word in hits.substrings or self._shares_word(scan, theme_word, 6)
+            ):
+                return True
 
         return False
 
@@ -790,3 +1164,24 @@ class SafetyValidationService:
         # Simple case-insensitive string matching
         # Could be enhanced with more sophisticated matching logic
         return theme1.lower() == theme2.lower() or theme1.lower() in theme2.lower()
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _theme_matcher(
+    service_class: type[SafetyValidationService], themes: Tuple[str, ...]
+) -> KeywordMatcher:
+    """Return the compiled matcher for theme keywords plus the given themes."""
+    vocabulary = service_class._theme_vocabulary()
+    for theme in themes:
+        theme_lower = theme.lower()
+        vocabulary.append(theme_lower)
+        vocabulary.extend(theme_lower.split())
+    return get_keyword_matcher(vocabulary)
+
+
+def _match_profile_chunk(
+    profile: CampaignSafetyProfile, contents: List[str]
+) -> List[Dict[int, Dict[str, List[str]]]]:
+    """Match a chunk of contents against a profile (runs in a worker process)."""
+    service = SafetyValidationService()
+    return [service.match_campaign_profile(profile, content) for content in contents]
@@ -0,0 +1,113 @@
+"""
+Signal handlers keeping cached campaign safety profiles fresh.
+
+Profiles are cached per campaign (see core.services.safety), so changes to a
+campaign, its memberships, or a member's safety preferences or username drop
+the affected campaigns' entries. The username and privacy level an instance
+was loaded with are remembered, so saves that leave them unchanged do not
+look up campaigns they cannot affect.
+"""
+
+from typing import Any, Set
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_init, post_save
+
+from core.services.safety import invalidate_campaign_safety_profiles
+
+
+def _user_campaign_ids(user_id: Any) -> Set[Any]:
+    """Return the IDs of campaigns a user owns or is a member of."""
+    campaign_model = apps.get_model("campaigns", "Campaign")
+    return set(
+        campaign_model.objects.filter(
+            Q(owner_id=user_id) | Q(memberships__user_id=user_id)
+        ).values_list("pk", flat=True)
+    )
+
+
+def campaign_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the profile of a saved or deleted campaign."""
+    invalidate_campaign_safety_profiles(instance.pk)
+
+
+def membership_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the profile of the campaign a membership belongs to."""
+    invalidate_campaign_safety_profiles(instance.campaign_id)
+
+
+def safety_preferences_loaded(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Remember the privacy level preferences were loaded with."""
+    instance._loaded_privacy_level = instance.__dict__.get("privacy_level")
+
+
+def safety_preferences_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the profiles of every campaign the preferences apply to."""
+    campaign_ids = _user_campaign_ids(instance.user_id)
+    # Campaigns without members are checked against shared preferences of
+    # non-members too (see SafetyValidationService.build_campaign_profile),
+    # so they only change if the preferences are or were shared
+    shared = "campaign_members"
+    if shared in (instance.privacy_level, instance._loaded_privacy_level):
+        campaign_model = apps.get_model("campaigns", "Campaign")
+        campaign_ids.update(
+            campaign_model.objects.filter(memberships__isnull=True).values_list(
+                "pk", flat=True
+            )
+        )
+    invalidate_campaign_safety_profiles(*campaign_ids)
+    instance._loaded_privacy_level = instance.privacy_level
+
+
+def user_loaded(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Remember the username a user was loaded with."""
+    instance._loaded_username = instance.__dict__.get("username")
+
+
+def user_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate profiles listing a user whose username changed."""
+    update_fields = kwargs.get("update_fields")
+    if (
+        kwargs.get("created")
+        or (update_fields is not None and "username" not in update_fields)
+        or instance.username == instance._loaded_username
+    ):
+        instance._loaded_username = instance.username
+        return
+    invalidate_campaign_safety_profiles(*_user_campaign_ids(instance.pk))
+    instance._loaded_username = instance.username
+
+
+def connect_safety_profile_invalidation() -> None:
+    """Connect handlers for campaigns, memberships, preferences and users."""
+    handlers = [
+        (apps.get_model("campaigns", "Campaign"), campaign_changed),
+        (apps.get_model("campaigns", "CampaignMembership"), membership_changed),
+        (apps.get_model("users", "UserSafetyPreferences"), safety_preferences_changed),
+    ]
+    for model, handler in handlers:
+        label = model._meta.label
+        post_save.connect(
+            handler, sender=model, dispatch_uid=f"safety_profile_saved_{label}"
+        )
+        post_delete.connect(
+            handler, sender=model, dispatch_uid=f"safety_profile_deleted_{label}"
+        )
+
+    post_init.connect(
+        safety_preferences_loaded,
+        sender=apps.get_model("users", "UserSafetyPreferences"),
+        dispatch_uid="safety_profile_preferences_loaded",
+    )
+    post_init.connect(
+        user_loaded,
+        sender=settings.AUTH_USER_MODEL,
+        dispatch_uid="safety_profile_user_loaded",
+    )
+    post_save.connect(
+        user_changed,
+        sender=settings.AUTH_USER_MODEL,
+        dispatch_uid="safety_profile_user_saved",
+    )
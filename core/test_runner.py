@@ -0,0 +1,51 @@
+"""Test runner that gives every test an empty cache."""
+
+import unittest
+
+from django.core.cache import caches
+from django.test.runner import (
+    DiscoverRunner,
+    ParallelTestSuite,
+    RemoteTestResult,
+    RemoteTestRunner,
+)
+
+
+class CacheClearingResultMixin:
+    """Clear every configured cache before each test starts.
+
+    Test transactions are rolled back, so their on-commit cache invalidation
+    never runs and database IDs are reused by later tests. Without this, a
+    test could read values cached for a different object by an earlier one.
+    """
+
+    def startTest(self, test):
+        for cache in caches.all():
+            cache.clear()
+        super().startTest(test)
+
+
+class CacheClearingRemoteTestResult(CacheClearingResultMixin, RemoteTestResult):
+    """Result used by parallel test workers."""
+
+
+class CacheClearingRemoteTestRunner(RemoteTestRunner):
+    resultclass = CacheClearingRemoteTestResult
+
+
+class CacheClearingParallelTestSuite(ParallelTestSuite):
+    runner_class = CacheClearingRemoteTestRunner
+
+
+class CacheClearingTestRunner(DiscoverRunner):
+    """Discover runner that clears caches between tests, also in parallel."""
+
+    parallel_test_suite = CacheClearingParallelTestSuite
+
+    def get_resultclass(self):
+        resultclass = super().get_resultclass() or unittest.TextTestResult
+        return type(
+            f"CacheClearing{resultclass.__name__}",
+            (CacheClearingResultMixin, resultclass),
+            {},
+        )
@@ -0,0 +1,95 @@
+"""Test cases for the compiled keyword matcher used by safety scanning."""
+
+import re
+
+from django.test import SimpleTestCase
+
+from core.services.safety import SafetyValidationService
+from core.utils.keyword_matcher import (
+    KeywordMatcher,
+    clear_matcher_cache,
+    get_keyword_matcher,
+)
+
+
+class KeywordMatcherTest(SimpleTestCase):
+    """Test single-pass keyword matching semantics."""
+
+    def test_overlapping_and_prefix_keywords_are_all_found(self):
+        """Keywords sharing a start position or overlapping are all reported."""
+        matcher = KeywordMatcher(["die", "dies", "death", "eat", "heat"])
+
+        hits = matcher.scan("The heat dies down")
+
+        self.assertEqual(hits.substrings, {"die", "dies", "eat", "heat"})
+
+    def test_word_hits_follow_word_boundaries(self):
+        """Whole-word hits behave like a \\b-delimited regex search."""
+        matcher = KeywordMatcher(["kill", "killing", "spider", "self-harm"])
+        text = "Killing spiders is no self-harm"
+
+        hits = matcher.scan(text)
+
+        self.assertEqual(hits.substrings, {"kill", "killing", "spider", "self-harm"})
+        self.assertEqual(hits.words, {"killing", "self-harm"})
+        for keyword in matcher.keywords:
+            expected = bool(re.search(r"\b" + re.escape(keyword) + r"\b", text.lower()))
+            self.assertEqual(keyword in hits.words, expected, keyword)
+
+    def test_matching_is_case_insensitive(self):
+        """Keywords and text are compared lowercased."""
+        matcher = KeywordMatcher(["Graphic Violence"])
+
+        self.assertEqual(
+            matcher.find_all("GRAPHIC VIOLENCE ahead"), ["graphic violence"]
+        )
+
+    def test_empty_inputs(self):
+        """No keywords or no text produce no hits."""
+        self.assertEqual(KeywordMatcher([]).find_all("anything"), [])
+        self.assertEqual(KeywordMatcher(["blood"]).find_all(""), [])
+
+    def test_matchers_are_cached_per_keyword_set(self):
+        """The same keyword set, in any order or case, reuses one matcher."""
+        clear_matcher_cache()
+
+        first = get_keyword_matcher(["blood", "gore"])
+
+        self.assertIs(get_keyword_matcher(["GORE", "blood"]), first)
+        self.assertIsNot(get_keyword_matcher(["blood"]), first)
+
+
+class SafetyThemeMatchingTest(SimpleTestCase):
+    """Test theme matching built on a single content scan."""
+
+    def setUp(self):
+        """Set up the service."""
+        self.service = SafetyValidationService()
+
+    def test_scan_matches_lines_and_veils(self):
+        """One scan answers every line and veil check."""
+        content = "The character death was mild violence."
+        themes = ["mild violence", "character death", "spiders", "animal harm"]
+
+        scan = self.service.scan_content(content, themes)
+        matched = [t for t in themes if self.service.scan_matches_theme(scan, t)]
+
+        self.assertEqual(matched, ["mild violence", "character death"])
+        self.assertIn("violence", scan.detected_themes)
+
+    def test_wrappers_agree_with_scan(self):
+        """The per-theme helpers give the same answers as a shared scan."""
+        content = "Several characters were tortured in the dungeon."
+        themes = ["character death", "torture", "animal harm"]
+
+        scan = self.service.scan_content(content, themes)
+
+        self.assertEqual(
+            self.service._detect_content_themes(content), scan.detected_themes
+        )
+        for theme in themes:
+            self.assertEqual(
+                self.service._content_matches_theme(content, theme),
+                self.service.scan_matches_theme(scan, theme),
+                theme,
+            )
@@ -0,0 +1,274 @@
+"""Test cases for cached campaign safety profiles."""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from campaigns.models import Campaign, CampaignMembership
+from core.services.safety import SafetyValidationService
+from users.models.safety import UserSafetyPreferences
+
+User = get_user_model()
+
+
+class CampaignSafetyProfileTest(TestCase):
+    """Test building, caching and matching campaign safety profiles."""
+
+    def setUp(self):
+        """Set up a campaign with two players sharing a line."""
+        self.gm = User.objects.create_user(
+            username="gm", email="gm@example.com", password="testpass123"
+        )
+        self.player1 = User.objects.create_user(
+            username="player1", email="p1@example.com", password="testpass123"
+        )
+        self.player2 = User.objects.create_user(
+            username="player2", email="p2@example.com", password="testpass123"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign",
+            owner=self.gm,
+            game_system="Mage: The Ascension",
+            safety_tools_enabled=True,
+        )
+        CampaignMembership.objects.create(
+            campaign=self.campaign, user=self.player1, role="PLAYER"
+        )
+        CampaignMembership.objects.create(
+            campaign=self.campaign, user=self.player2, role="PLAYER"
+        )
+        UserSafetyPreferences.objects.create(
+            user=self.player1,
+            lines=["Torture", "Animal harm"],
+            veils=["Violence"],
+            consent_required=True,
+        )
+        UserSafetyPreferences.objects.create(
+            user=self.player2,
+            lines=["Torture"],
+            veils=["Spiders"],
+            consent_required=False,
+        )
+        self.service = SafetyValidationService()
+
+    def test_profile_maps_shared_patterns_to_users(self):
+        """Each distinct line or veil is listed once with all of its users."""
+        with self.assertNumQueries(2):
+            profile = self.service.get_campaign_profile(self.campaign)
+
+        self.assertEqual(
+            profile.members,
+            [
+                (self.gm.pk, "gm"),
+                (self.player1.pk, "player1"),
+                (self.player2.pk, "player2"),
+            ],
+        )
+        self.assertEqual(
+            profile.line_users["Torture"], [self.player1.pk, self.player2.pk]
+        )
+        self.assertEqual(
+            profile.themes, ["Torture", "Animal harm", "Violence", "Spiders"]
+        )
+
+    def test_profile_is_cached(self):
+        """A second lookup does not touch the database."""
+        self.service.get_campaign_profile(self.campaign)
+
+        with self.assertNumQueries(0):
+            self.service.get_campaign_profile(self.campaign)
+
+    def test_campaign_validation_reports_each_user(self):
+        """One pass reports every member's own lines and veils."""
+        self.service.get_campaign_profile(self.campaign)
+
+        with self.assertNumQueries(0):
+            result = self.service.validate_content_for_campaign(
+                "The prisoner faced torture while spiders crawled.", self.campaign
+            )
+
+        self.assertFalse(result["is_safe"])
+        player1 = result["user_results"]["player1"]
+        player2 = result["user_results"]["player2"]
+        self.assertEqual(player1["lines_violated"], ["Torture"])
+        self.assertEqual(player1["veils_triggered"], [])
+        self.assertTrue(player1["consent_required"])
+        self.assertEqual(player2["lines_violated"], ["Torture"])
+        self.assertEqual(player2["veils_triggered"], ["Spiders"])
+        self.assertFalse(player2["consent_required"])
+        self.assertTrue(result["user_results"]["gm"]["is_safe"])
+        self.assertEqual(result["overall_violations"]["lines"], ["Torture"])
+
+    def test_campaign_validation_matches_per_user_validation(self):
+        """Profile results equal validating each member separately."""
+        content = "A violent fight, then an animal is harmed."
+
+        result = self.service.validate_content_for_campaign(content, self.campaign)
+
+        for user in (self.gm, self.player1, self.player2):
+            self.assertEqual(
+                result["user_results"][user.username],
+                self.service.validate_content(content, user, self.campaign),
+            )
+
+    def test_preference_changes_invalidate_profile(self):
+        """Updating a member's preferences rebuilds the profile."""
+        self.service.get_campaign_profile(self.campaign)
+        preferences = self.player2.safety_preferences
+        preferences.lines = ["Drowning"]
+        with self.captureOnCommitCallbacks(execute=True):
+            preferences.save()
+
+        profile = self.service.get_campaign_profile(self.campaign)
+
+        self.assertEqual(profile.line_users["Torture"], [self.player1.pk])
+        self.assertEqual(profile.line_users["Drowning"], [self.player2.pk])
+
+    def test_preference_change_reaches_next_validation(self):
+        """Validation after a committed preference change uses the new lines."""
+        content = "The ship sank and the crew began drowning."
+        result = self.service.validate_content_for_campaign(content, self.campaign)
+        self.assertTrue(result["is_safe"])
+        preferences = self.player2.safety_preferences
+        preferences.lines = ["Drowning"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            preferences.save()
+
+        result = self.service.validate_content_for_campaign(content, self.campaign)
+        self.assertFalse(result["is_safe"])
+        self.assertEqual(
+            result["user_results"]["player2"]["lines_violated"], ["Drowning"]
+        )
+
+    def test_membership_changes_invalidate_profile(self):
+        """Removing a member rebuilds the profile without them."""
+        self.service.get_campaign_profile(self.campaign)
+        with self.captureOnCommitCallbacks(execute=True):
+            CampaignMembership.objects.get(
+                campaign=self.campaign, user=self.player2
+            ).delete()
+
+        profile = self.service.get_campaign_profile(self.campaign)
+
+        self.assertNotIn(self.player2.pk, dict(profile.members))
+        self.assertNotIn("Spiders", profile.themes)
+
+    def test_profile_is_dropped_on_commit(self):
+        """Changes only drop the cached profile once they are committed."""
+        self.service.get_campaign_profile(self.campaign)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.campaign.content_warnings = ["Violence"]
+            self.campaign.save()
+            with self.assertNumQueries(0):
+                self.service.get_campaign_profile(self.campaign)
+
+        for callback in callbacks:
+            callback()
+        with self.assertNumQueries(2):
+            self.service.get_campaign_profile(self.campaign)
+
+    def test_campaign_changes_invalidate_profile(self):
+        """Saving the campaign drops its cached profile."""
+        self.service.get_campaign_profile(self.campaign)
+        self.campaign.content_warnings = ["Violence"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.save()
+
+        with self.assertNumQueries(2):
+            self.service.get_campaign_profile(self.campaign)
+
+    def test_private_preferences_skip_memberless_campaigns(self):
+        """Saving unshared preferences only looks up the user's campaigns."""
+        preferences = self.player2.safety_preferences
+        preferences.lines = ["Drowning"]
+
+        with self.assertNumQueries(2):
+            preferences.save()
+
+    def test_sharing_preferences_invalidates_memberless_campaigns(self):
+        """Sharing preferences drops profiles of campaigns without members."""
+        solo = Campaign.objects.create(
+            name="Solo Campaign", owner=self.gm, game_system="Mage: The Ascension"
+        )
+        self.assertNotIn("Spiders", self.service.get_campaign_profile(solo).themes)
+        preferences = self.player2.safety_preferences
+        preferences.privacy_level = "campaign_members"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(3):
+                preferences.save()
+
+        self.assertIn("Spiders", self.service.get_campaign_profile(solo).themes)
+
+    def test_user_save_without_username_change_skips_invalidation(self):
+        """Saving a user whose username is unchanged looks up no campaigns."""
+        user = User.objects.get(pk=self.player1.pk)
+        user.email = "player1@example.com"
+
+        # User.save() loads the stored row to compare emails
+        with self.assertNumQueries(2):
+            user.save()
+
+    def test_username_change_invalidates_profile(self):
+        """Renaming a member rebuilds the profile with the new username."""
+        self.service.get_campaign_profile(self.campaign)
+        user = User.objects.get(pk=self.player1.pk)
+        user.username = "renamed"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+
+        profile = self.service.get_campaign_profile(self.campaign)
+        self.assertEqual(dict(profile.members)[self.player1.pk], "renamed")
+
+    def test_pre_scene_check_uses_fixed_queries(self):
+        """Pre-scene checks load agreements, preferences and roles in bulk."""
+        from campaigns.models import CampaignSafetyAgreement
+
+        CampaignSafetyAgreement.objects.create(
+            campaign=self.campaign, participant=self.player1, agreed_to_terms=True
+        )
+        visitor = User.objects.create_user(
+            username="visitor", email="v@example.com", password="testpass123"
+        )
+        CampaignSafetyAgreement.objects.create(
+            campaign=self.campaign, participant=visitor, agreed_to_terms=True
+        )
+        for i in range(10):
+            extra = User.objects.create_user(
+                username=f"extra{i}", email=f"e{i}@example.com", password="x"
+            )
+            CampaignMembership.objects.create(
+                campaign=self.campaign, user=extra, role="OBSERVER"
+            )
+
+        with self.assertNumQueries(3):
+            result = self.service.pre_scene_safety_check(
+                self.campaign, "A scene of torture"
+            )
+
+        status = result["participant_status"]
+        self.assertEqual(len(status), 14)
+        self.assertFalse(result["check_passed"])
+        self.assertEqual(
+            status["gm"],
+            {
+                "has_safety_agreement": True,
+                "safety_preferences_set": False,
+                "potential_issues": [],
+            },
+        )
+        self.assertEqual(status["player1"]["potential_issues"], ["Torture"])
+        self.assertEqual(
+            status["player2"]["potential_issues"], ["No safety agreement", "Torture"]
+        )
+        self.assertEqual(
+            status["visitor"]["potential_issues"], ["No safety preferences set"]
+        )
+        self.assertIn(
+            "player2 needs to agree to safety terms", result["required_actions"]
+        )
+        self.assertIn(
+            "Planned content may violate player1's boundaries", result["warnings"]
+        )
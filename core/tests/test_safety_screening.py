@@ -0,0 +1,39 @@
+"""Test cases for chat safety screening metrics."""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from core.safety_screening import ScreeningMetrics, ScreeningResult
+
+
+class ScreeningMetricsTest(SimpleTestCase):
+    """Test counting and periodic logging of screening outcomes."""
+
+    @override_settings(CHAT_SAFETY_METRICS_LOG_INTERVAL=300)
+    def test_snapshot_is_logged_when_due(self):
+        """A snapshot is logged once the log interval has passed."""
+        metrics = ScreeningMetrics()
+        with patch("core.safety_screening.logger.info") as mock_info:
+            metrics.record(ScreeningResult(veils_triggered=["Spiders"]))
+            mock_info.assert_not_called()
+
+            metrics._next_log = 0
+            metrics.record(ScreeningResult(lines_violated=["Torture"]))
+
+        mock_info.assert_called_once()
+        message = mock_info.call_args[0][0]
+        self.assertIn("'blocked': 1", message)
+        self.assertIn("'veiled': 1", message)
+
+    @override_settings(CHAT_SAFETY_METRICS_LOG_INTERVAL=0)
+    def test_zero_interval_disables_logging(self):
+        """An interval of zero never logs."""
+        metrics = ScreeningMetrics()
+
+        with patch("core.safety_screening.logger.info") as mock_info:
+            metrics.record(ScreeningResult())
+
+        mock_info.assert_not_called()
+
+        self.assertEqual(metrics.snapshot()["screened"], 1)
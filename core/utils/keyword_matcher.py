@@ -0,0 +1,183 @@
+"""
+Compiled multi-keyword matcher for safety content scanning.
+
+A KeywordMatcher compiles any number of keywords into a single trie-shaped
+regular expression and finds every keyword in a text in one pass, reporting
+both substring hits (``keyword in text``) and whole-word hits (equivalent to
+``re.search(r"\\b" + re.escape(keyword) + r"\\b", text)``).
+
+How it works:
+1. The keywords form a trie, rendered as one regex; because sibling branches
+   start with different characters, the regex matches the *longest* keyword
+   starting at a given position.
+2. A zero-width lookahead runs that regex at every position of the text.
+3. Every keyword present starts somewhere, and is a prefix of the longest
+   keyword starting there, so expanding each hit to its keyword prefixes
+   yields all occurrences, including overlapping ones.
+
+Usage:
+    from core.utils.keyword_matcher import get_keyword_matcher
+
+    matcher = get_keyword_matcher(["die", "dies", "graphic violence"])
+    hits = matcher.scan("Graphic violence: he dies.")
+    hits.substrings  # {"die", "dies", "graphic violence"}
+    hits.words       # {"dies", "graphic violence"}
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+# Compiled matchers kept per distinct keyword set
+MATCHER_CACHE_SIZE = 128
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+@dataclass
+class KeywordHits:
+    """Keywords found in one scanned text."""
+
+    substrings: Set[str] = field(default_factory=set)
+    words: Set[str] = field(default_factory=set)
+
+
+def _build_trie(keywords: Iterable[str]) -> dict:
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return trie
+
+
+def _trie_to_regex(node: dict) -> str:
+    """Render a trie node as a regex that prefers the longest continuation."""
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1:
+        body = branches[0]
+    else:
+        body = "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # Terminal node: the continuation is optional (greedy, so longest wins)
+        return f"(?:{body})?"
+    return body
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Return whether ``\\b`` matches at ``index`` in ``text``."""
+    before = index > 0 and bool(_WORD_CHAR.match(text[index - 1]))
+    after = index < len(text) and bool(_WORD_CHAR.match(text[index]))
+    return before != after
+
+
+class KeywordMatcher:
+    """Single-pass matcher over a fixed set of lowercase keywords."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Keywords to find; matching is case-insensitive
+        """
+        self.keywords: FrozenSet[str] = frozenset(
+            keyword.lower() for keyword in keywords if keyword
+        )
+        self._pattern: Optional[re.Pattern] = None
+        if self.keywords:
+            self._pattern = re.compile(
+                "(?=(" + _trie_to_regex(_build_trie(self.keywords)) + "))"
+            )
+        # Keywords that are prefixes of each keyword, longest first
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(
+                sorted(
+                    (other for other in self.keywords if keyword.startswith(other)),
+                    key=len,
+                    reverse=True,
+                )
+            )
+            for keyword in self.keywords
+        }
+
+    def scan(self, text: str) -> KeywordHits:
+        """
+        Find every keyword in ``text`` in a single pass.
+
+        Args:
+            text: Text to scan; it is lowercased once here
+
+        Returns:
+            KeywordHits with substring and whole-word matches
+        """
+        hits = KeywordHits()
+        if not text or self._pattern is None:
+            return hits
+
+        text = text.lower()
+        for match in self._pattern.finditer(text):
+            longest = match.group(1)
+            if not longest:
+                continue
+            start = match.start()
+            starts_word = None
+            for keyword in self._prefixes[longest]:
+                hits.substrings.add(keyword)
+                if keyword in hits.words:
+                    continue
+                if starts_word is None:
+                    starts_word = _is_word_boundary(text, start)
+                if starts_word and _is_word_boundary(text, start + len(keyword)):
+                    hits.words.add(keyword)
+        return hits
+
+    def find_all(self, text: str) -> List[str]:
+        """Return the keywords occurring anywhere in ``text``, sorted."""
+        return sorted(self.scan(text).substrings)
+
+
+_matcher_cache: "OrderedDict[FrozenSet[str], KeywordMatcher]" = OrderedDict()
+_matcher_cache_lock = threading.Lock()
+
+
+def get_keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    Return a compiled matcher for a keyword set, reusing cached ones.
+
+    Args:
+        keywords: Keywords to match
+
+    Returns:
+        KeywordMatcher for the (lowercased, deduplicated) keywords
+    """
+    key = frozenset(keyword.lower() for keyword in keywords if keyword)
+    with _matcher_cache_lock:
+        matcher = _matcher_cache.get(key)
+        if matcher is not None:
+            _matcher_cache.move_to_end(key)
+            return matcher
+
+    matcher = KeywordMatcher(key)
+    with _matcher_cache_lock:
+        _matcher_cache[key] = matcher
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    return matcher
+
+
+def clear_matcher_cache() -> None:
+    """Drop all cached matchers."""
+    with _matcher_cache_lock:
+        _matcher_cache.clear()
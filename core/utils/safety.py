@@ -11,6 +11,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 from django.utils import timezone
 
+from core.utils.keyword_matcher import KeywordHits, get_keyword_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,16 +88,30 @@ class ContentAnalyzer:
         """
         if not content or keyword_category not in self.KEYWORD_CATEGORIES:
             return []
-            
-        content_lower = content.lower()
-        keywords = self.KEYWORD_CATEGORIES[keyword_category]
-        matches = []
-        
-        for keyword in keywords:
-            if keyword in content_lower:
-                matches.append(keyword)
-                
-        return matches
+
+        hits = self.scan_keywords(content)
+        return [
+            keyword
+            for keyword in self.KEYWORD_CATEGORIES[keyword_category]
+            if keyword in hits.substrings
+        ]
+
+    def scan_keywords(self, content: str) -> KeywordHits:
+        """
+        Find the keywords of every category in content with a single pass.
+
+        Args:
+            content: The content to analyze
+
+        Returns:
+            KeywordHits shared by all categories
+        """
+        keywords = [
+            keyword
+            for category_keywords in self.KEYWORD_CATEGORIES.values()
+            for keyword in category_keywords
+        ]
+        return get_keyword_matcher(keywords).scan(content)
     
     def analyze_sentiment(self, content: str) -> Dict[str, Any]:
         """
@@ -177,6 +177,9 @@ CACHES = {
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
+# Local MaxMind-format GeoIP database for session security checks (optional)
+GEOIP_DATABASE_PATH = os.environ.get("GEOIP_DATABASE_PATH")
+
 # Channels configuration with Redis backend
 CHANNEL_LAYERS = {
     "default": {
@@ -286,6 +289,15 @@ SITE_NAME = "Game Master Application"
 # Email verification token expiration (in hours)
 EMAIL_VERIFICATION_EXPIRE_HOURS = 24
 
+# Outbound email queue: requests store emails and a worker delivers them
+# (python manage.py send_queued_email --loop, or make email-worker). Only
+# enable it where that worker is running, otherwise emails are never sent.
+EMAIL_QUEUE_ENABLED = os.getenv("EMAIL_QUEUE_ENABLED", "False").lower() == "true"
+EMAIL_QUEUE_BATCH_SIZE = 100
+EMAIL_QUEUE_MAX_ATTEMPTS = 5
+EMAIL_QUEUE_RETRY_DELAY = 60  # seconds before the first retry, doubled each time
+EMAIL_QUEUE_CLAIM_TIMEOUT = 300  # seconds a worker holds an email it is sending
+
 # For testing purposes, allow locmem backend to be used
 if os.getenv("EMAIL_BACKEND") == "locmem":
     EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
@@ -38,6 +38,9 @@ CACHES = {
     }
 }
 
+# Start every test with an empty cache
+TEST_RUNNER = "core.test_runner.CacheClearingTestRunner"
+
 
 # Disable migrations for faster test runs
 class DisableMigrations:
@@ -57,6 +60,9 @@ DEBUG = False
 # Disable email verification for integration tests
 EMAIL_VERIFICATION_REQUIRED = False
 
+# Send email immediately so tests can inspect mail.outbox after a request
+EMAIL_QUEUE_ENABLED = False
+
 # Set login URL to our custom view
 LOGIN_URL = "users:login"
 
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ItemsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "items"
+
+    def ready(self):
+        """Keep cached inventory summaries in sync with item writes."""
+        from .signals import connect_inventory_invalidation
+
+        connect_inventory_invalidation()
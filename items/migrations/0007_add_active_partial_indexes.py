@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("items", "0006_add_performance_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["campaign", "owner"],
+                name="items_active_owner_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["owner"],
+                name="items_active_by_owner_idx",
+            ),
+        ),
+    ]
@@ -182,6 +182,16 @@ class Item(
             models.Index(
                 fields=["is_deleted", "created_at"], name="items_deleted_created_idx"
             ),  # Soft delete queries by date
+            models.Index(
+                fields=["campaign", "owner"],
+                condition=models.Q(is_deleted=False),
+                name="items_active_owner_idx",
+            ),  # Inventory summaries (GROUP BY owner over active items)
+            models.Index(
+                fields=["owner"],
+                condition=models.Q(is_deleted=False),
+                name="items_active_by_owner_idx",
+            ),  # A character's possessions
         ]
 
     def clean(self) -> None:
@@ -277,7 +287,12 @@ class Item(
         Returns:
             Item instance for method chaining
         """
+        from prerequisites.results import bump_character_versions
+
+        previous_owner_id = self.owner_id
         self.owner = new_owner
         self.last_transferred_at = timezone.now()
         self.save(update_fields=["owner", "last_transferred_at"])
+        # Both characters' has/count_tag prerequisites may have changed
+        bump_character_versions(previous_owner_id, self.owner_id)
         return self
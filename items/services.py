@@ -0,0 +1,241 @@
+"""
+Item service layer for bulk business operations.
+
+This module provides a set-based alternative to Item.transfer_to for moving
+many items between characters at once, keeping the same permission rules, and
+cached per-campaign inventory summaries.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Case, Count, Sum, Value, When
+from django.utils import timezone
+
+from campaigns.models import Campaign
+from characters.models import Character
+from prerequisites.results import bump_character_versions
+
+from .models import Item
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_SUMMARY_KEY_PREFIX = "items:inventory_summary"
+
+# Summaries are invalidated on every item write, so this only bounds how long
+# an entry for an idle campaign lingers
+INVENTORY_SUMMARY_TIMEOUT = 60 * 60
+
+
+def _inventory_summary_key(campaign_id: Any) -> str:
+    return f"{INVENTORY_SUMMARY_KEY_PREFIX}:{campaign_id}"
+
+
+def invalidate_inventory_summary(*campaign_ids: Any) -> None:
+    """
+    Drop the cached inventory summaries of the given campaigns.
+
+    The entries are dropped once the current transaction commits (or
+    straight away outside a transaction), so a concurrent request cannot
+    re-cache the state from before the change.
+
+    Args:
+        *campaign_ids: IDs of campaigns whose items changed; None values are
+                       ignored
+    """
+    keys = [
+        _inventory_summary_key(campaign_id)
+        for campaign_id in campaign_ids
+        if campaign_id is not None
+    ]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class ItemTransferService:
+    """Service for transferring many items in a campaign at once."""
+
+    MAX_BULK_OPERATIONS = 500  # Prevent oversized requests
+
+    def __init__(self, campaign: Campaign):
+        """Initialize service for a specific campaign."""
+        self.campaign = campaign
+
+    def bulk_transfer(
+        self,
+        user: AbstractUser,
+        transfers: Iterable[Dict[str, Any]],
+        atomic: bool = False,
+        user_role: Optional[str] = None,
+    ) -> Dict[str, List[Dict]]:
+        """Transfer many items to new owners in this campaign.
+
+        The user's role is checked once, and every valid transfer is applied
+        with a single ``UPDATE`` setting ``owner`` and ``last_transferred_at``.
+        Cached prerequisite results of previous and new owners are invalidated.
+
+        Permissions mirror Item.can_be_deleted_by: campaign owners, GMs and
+        superusers may transfer any item, other members only items they
+        created.
+
+        Args:
+            user: User performing the transfer
+            transfers: Dictionaries with ``item_id`` and ``owner`` (a character
+                ID, or None to leave the item unowned)
+            atomic: If True, nothing is transferred unless every transfer is
+                valid
+            user_role: Optional cached user role to avoid database query
+
+        Returns:
+            Dictionary with ``updated`` and ``errors`` lists of per-item
+            outcomes
+
+        Raises:
+            ValidationError: If the request size is invalid
+            PermissionError: If the user is not a member of the campaign
+        """
+        transfers = list(transfers)
+        if len(transfers) > self.MAX_BULK_OPERATIONS:
+            raise ValidationError(
+                f"Maximum {self.MAX_BULK_OPERATIONS} items can be "
+                f"transferred at once."
+            )
+
+        if user_role is None:
+            user_role = self.campaign.get_user_role(user)
+        if user_role is None and not user.is_superuser:
+            raise PermissionError("Only campaign members can transfer items")
+        can_manage = user.is_superuser or user_role in ["OWNER", "GM"]
+
+        item_ids = [transfer["item_id"] for transfer in transfers]
+        owner_ids = {
+            transfer["owner"] for transfer in transfers if transfer["owner"] is not None
+        }
+
+        updated: List[Dict] = []
+        errors: List[Dict] = []
+
+        with transaction.atomic():
+            current = {
+                row["pk"]: row
+                for row in Item.objects.non_polymorphic()
+                .filter(campaign=self.campaign, pk__in=item_ids)
+                .select_for_update()
+                .values("pk", "owner_id", "created_by_id")
+            }
+            valid_owner_ids = set(
+                Character.objects.filter(
+                    campaign=self.campaign, pk__in=owner_ids
+                ).values_list("pk", flat=True)
+            )
+
+            seen = set()
+            accepted: Dict[int, Optional[int]] = {}
+            for transfer in transfers:
+                item_id, owner_id = transfer["item_id"], transfer["owner"]
+                row = current.get(item_id)
+                if item_id in seen:
+                    error = "Item is listed more than once."
+                elif row is None:
+                    error = "Item not found."
+                elif not can_manage and row["created_by_id"] != user.id:
+                    error = "You don't have permission to transfer this item."
+                elif owner_id is not None and owner_id not in valid_owner_ids:
+                    error = "New owner must be a character in the same campaign."
+                else:
+                    error = None
+                seen.add(item_id)
+
+                if error:
+                    errors.append({"item_id": item_id, "error": error})
+                else:
+                    accepted[item_id] = owner_id
+
+            if accepted and not (atomic and errors):
+                now = timezone.now()
+                Item.objects.filter(pk__in=accepted).update(
+                    owner_id=Case(
+                        *[
+                            When(pk=item_id, then=Value(owner_id))
+                            for item_id, owner_id in accepted.items()
+                        ],
+                        output_field=models.IntegerField(),
+                    ),
+                    last_transferred_at=now,
+                    modified_by=user,
+                    updated_at=now,
+                )
+                invalidate_inventory_summary(self.campaign.pk)
+                # Both sides of every transfer may have changed has/count_tag
+                # prerequisite outcomes
+                bump_character_versions(
+                    *{current[item_id]["owner_id"] for item_id in accepted},
+                    *{owner_id for owner_id in accepted.values()},
+                )
+                updated = [
+                    {"item_id": item_id, "owner": owner_id}
+                    for item_id, owner_id in accepted.items()
+                ]
+
+        if updated:
+            logger.info(
+                f"User {user.username} transferred {len(updated)} items "
+                f"in campaign {self.campaign.pk}"
+            )
+
+        return {"updated": updated, "errors": errors}
+
+
+class InventorySummaryService:
+    """Service for per-character inventory totals in a campaign."""
+
+    def __init__(self, campaign: Campaign):
+        """Initialize service for a specific campaign."""
+        self.campaign = campaign
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Return item counts and quantities per owner, using the cache.
+
+        The totals come from a single ``GROUP BY owner`` aggregate over the
+        campaign's active items, served by the partial index on
+        ``is_deleted = false``.
+
+        Returns:
+            Dictionary with campaign totals and an ``owners`` list; unowned
+            items are reported with an ``owner_id`` of None
+        """
+        key = _inventory_summary_key(self.campaign.pk)
+        summary = cache.get(key)
+        if summary is None:
+            summary = self._build_summary()
+            cache.set(key, summary, timeout=INVENTORY_SUMMARY_TIMEOUT)
+        return summary
+
+    def _build_summary(self) -> Dict[str, Any]:
+        """Aggregate the campaign's active items by owner."""
+        rows = (
+            Item.objects.non_polymorphic()
+            .filter(campaign=self.campaign)
+            .values("owner_id", "owner__name")
+            .annotate(item_count=Count("pk"), total_quantity=Sum("quantity"))
+            .order_by("owner__name", "owner_id")
+        )
+        owners = [
+            {
+                "owner_id": row["owner_id"],
+                "owner_name": row["owner__name"],
+                "item_count": row["item_count"],
+                "total_quantity": row["total_quantity"],
+            }
+            for row in rows
+        ]
+        return {
+            "campaign_id": self.campaign.pk,
+            "total_items": sum(owner["item_count"] for owner in owners),
+            "total_quantity": sum(owner["total_quantity"] for owner in owners),
+            "owners": owners,
+        }
@@ -0,0 +1,41 @@
+"""
+Signal handlers keeping cached inventory summaries fresh.
+
+Summaries are cached per campaign (see items.services), so any write to an
+item, or to a character that owns items, drops that campaign's entry.
+"""
+
+from typing import Any
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .services import invalidate_inventory_summary
+
+
+def inventory_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the summary of the campaign an item or owner belongs to."""
+    invalidate_inventory_summary(instance.campaign_id)
+
+
+def connect_inventory_invalidation() -> None:
+    """Connect handlers for Item, Character and all of their subclasses."""
+    item_model = apps.get_model("items", "Item")
+    character_model = apps.get_model("characters", "Character")
+
+    for model in apps.get_models():
+        # Characters matter too: renames change owner names and deletes
+        # unassign their items without saving them
+        if not issubclass(model, (item_model, character_model)):
+            continue
+        label = model._meta.label
+        post_save.connect(
+            inventory_changed,
+            sender=model,
+            dispatch_uid=f"items_summary_saved_{label}",
+        )
+        post_delete.connect(
+            inventory_changed,
+            sender=model,
+            dispatch_uid=f"items_summary_deleted_{label}",
+        )
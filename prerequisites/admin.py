@@ -10,14 +10,20 @@ import json
 from django import forms
 from django.contrib import admin
 from django.contrib.admin import ModelAdmin
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.shortcuts import render
 from django.utils.safestring import mark_safe
 
+from . import bulk
 from .forms import PrerequisiteRequiredForm
 from .models import Prerequisite, PrerequisiteCheckResult
 from .widgets import PrerequisiteBuilderWidget
 
+# Rows written per INSERT/UPDATE by the bulk actions
+BATCH_SIZE = bulk.DEFAULT_BATCH_SIZE
+
 
 class PrerequisiteAdminMixin:
     """
@@ -124,37 +130,66 @@ class PrerequisiteAdminMixin:
     has_prerequisites.short_description = "Has Prerequisites"
 
     def get_actions(self, request):
-        """Add prerequisite-related bulk actions."""
+        """
+        Add prerequisite-related bulk actions.
+
+        Models with a ``requirements`` field are updated in place; any other
+        model gets the prerequisites attached to its objects via the
+        GenericForeignKey on Prerequisite, which needs an integer primary key
+        to fit ``object_id``. Models supporting neither get no actions.
+        """
         actions = super().get_actions(request)
-
-        if hasattr(self.model, "requirements"):
-            actions["update_prerequisites"] = (
-                self.update_prerequisites_action,
-                "update_prerequisites",
-                "Update prerequisites for selected items",
-            )
-            actions["clear_prerequisites"] = (
-                self.clear_prerequisites_action,
-                "clear_prerequisites",
-                "Clear prerequisites for selected items",
-            )
-            actions["copy_prerequisites"] = (
-                self.copy_prerequisites_action,
-                "copy_prerequisites",
-                "Copy prerequisites to selected items",
-            )
+        if not (
+            hasattr(self.model, "requirements")
+            or isinstance(self.model._meta.pk, models.IntegerField)
+        ):
+            return actions
+
+        actions["update_prerequisites"] = (
+            self.update_prerequisites_action,
+            "update_prerequisites",
+            "Update prerequisites for selected items",
+        )
+        actions["clear_prerequisites"] = (
+            self.clear_prerequisites_action,
+            "clear_prerequisites",
+            "Clear prerequisites for selected items",
+        )
+        actions["copy_prerequisites"] = (
+            self.copy_prerequisites_action,
+            "copy_prerequisites",
+            "Copy prerequisites to selected items",
+        )
 
         return actions
 
+    def _report_bulk_write(self, request, result, message):
+        """Report a bulk write, including batch progress for large selections."""
+        if result.batches > 1:
+            message = f"{message} ({result.batches} batches of up to {BATCH_SIZE})"
+        self.message_user(request, message)
+
     def update_prerequisites_action(self, request, queryset):
         """Bulk action to update prerequisites."""
         if request.method == "POST" and "apply" in request.POST:
-            # Get new requirements from form
+            # Get new requirements from form (validated once by the form)
             form = PrerequisiteRequiredForm(request.POST)
             if form.is_valid():
                 requirements = form.cleaned_data["requirements"]
-                count = queryset.update(requirements=requirements)
-                self.message_user(request, f"Updated prerequisites for {count} items.")
+                if hasattr(self.model, "requirements"):
+                    count = queryset.update(requirements=requirements)
+                    self.message_user(
+                        request, f"Updated prerequisites for {count} items."
+                    )
+                else:
+                    result = bulk.set_prerequisites(
+                        queryset, requirements, batch_size=BATCH_SIZE
+                    )
+                    self._report_bulk_write(
+                        request,
+                        result,
+                        f"Updated prerequisites for {queryset.count()} items.",
+                    )
                 return None
 
         # Show form for entering new prerequisites
@@ -169,36 +204,76 @@ class PrerequisiteAdminMixin:
 
     def clear_prerequisites_action(self, request, queryset):
         """Bulk action to clear prerequisites."""
-        count = queryset.update(requirements=None)
-        self.message_user(request, f"Cleared prerequisites for {count} items.")
+        if hasattr(self.model, "requirements"):
+            count = queryset.update(requirements={})
+            self.message_user(request, f"Cleared prerequisites for {count} items.")
+        else:
+            deleted = bulk.clear_prerequisites(queryset)
+            self.message_user(
+                request,
+                f"Removed {deleted} prerequisites from {queryset.count()} items.",
+            )
 
     def copy_prerequisites_action(self, request, queryset):
         """Bulk action to copy prerequisites from one item to others."""
+        has_field = hasattr(self.model, "requirements")
+
         if request.method == "POST" and "apply" in request.POST:
             source_id = request.POST.get("source_id")
             if source_id:
                 try:
                     source_obj = self.model.objects.get(id=source_id)
-                    if hasattr(source_obj, "requirements"):
-                        count = queryset.exclude(id=source_id).update(
-                            requirements=source_obj.requirements
-                        )
+                    targets = queryset.exclude(id=source_id)
+                    if has_field:
+                        bulk.validate_requirements_once([source_obj.requirements])
+                        count = targets.update(requirements=source_obj.requirements)
                         self.message_user(
                             request, f"Copied prerequisites to {count} items."
                         )
-                        return None
+                    else:
+                        sources = bulk.attached_prerequisites(
+                            self.model, [source_obj.pk]
+                        )
+                        result = bulk.copy_prerequisites(
+                            sources, targets, batch_size=BATCH_SIZE
+                        )
+                        self._report_bulk_write(
+                            request,
+                            result,
+                            f"Copied {result.count} prerequisites to "
+                            f"{targets.count()} items.",
+                        )
+                    return None
                 except self.model.DoesNotExist:
                     self.message_user(request, "Source item not found.", level="ERROR")
+                except ValidationError as e:
+                    self.message_user(
+                        request,
+                        f"Source prerequisites are invalid: {e}",
+                        level="ERROR",
+                    )
+                    return None
 
         # Show form for selecting source item
+        if has_field:
+            source_choices = [
+                (obj.id, f"{obj} - {self.prerequisite_summary(obj)}")
+                for obj in queryset
+                if obj.requirements
+            ]
+        else:
+            with_prerequisites = set(
+                bulk.attached_prerequisites(
+                    self.model, queryset.values_list("pk", flat=True)
+                ).values_list("object_id", flat=True)
+            )
+            source_choices = [
+                (obj.id, str(obj)) for obj in queryset if obj.pk in with_prerequisites
+            ]
         context = {
             "title": "Copy Prerequisites",
             "objects": queryset,
-            "source_choices": [
-                (obj.id, f"{obj} - {self.prerequisite_summary(obj)}")
-                for obj in queryset
-                if hasattr(obj, "requirements") and obj.requirements
-            ],
+            "source_choices": source_choices,
             "action": "copy_prerequisites",
         }
         return render(request, "admin/prerequisites_copy_action.html", context)
@@ -345,6 +420,8 @@ class PrerequisiteAdmin(ModelAdmin):
 
     readonly_fields = ["created_at", "updated_at"]
 
+    actions = ["copy_to_objects_action"]
+
     fieldsets = (
         (None, {"fields": ("description", "requirements")}),
         (
@@ -404,6 +481,66 @@ class PrerequisiteAdmin(ModelAdmin):
 
     requirements_summary.short_description = "Requirements"
 
+    @admin.action(description="Copy selected prerequisites to objects")
+    def copy_to_objects_action(self, request, queryset):
+        """
+        Attach copies of the selected prerequisites to many objects at once.
+
+        Each distinct requirement is validated once and the copies are written
+        with bulk_create, so copying a set onto hundreds of objects stays fast.
+        """
+        error = None
+        if request.method == "POST" and "apply" in request.POST:
+            try:
+                content_type = ContentType.objects.get(
+                    pk=request.POST.get("content_type")
+                )
+                model_class = content_type.model_class()
+                if model_class is None:
+                    # Stale content type whose model no longer exists
+                    raise ContentType.DoesNotExist
+                object_ids = [
+                    int(value)
+                    for value in request.POST.get("object_ids", "")
+                    .replace(",", " ")
+                    .split()
+                ]
+            except (ContentType.DoesNotExist, ValueError):
+                error = "Choose a content type and enter numeric object IDs."
+            else:
+                targets = list(model_class._default_manager.filter(pk__in=object_ids))
+                try:
+                    result = bulk.copy_prerequisites(
+                        queryset, targets, batch_size=BATCH_SIZE
+                    )
+                except ValidationError as e:
+                    error = f"Selected prerequisites are invalid: {e}"
+                else:
+                    message = (
+                        f"Copied {result.count} prerequisites to {len(targets)} "
+                        f"{model_class._meta.verbose_name_plural}."
+                    )
+                    if result.batches > 1:
+                        message = (
+                            f"{message} ({result.batches} batches of up to "
+                            f"{BATCH_SIZE})"
+                        )
+                    self.message_user(request, message)
+                    return None
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "Copy Prerequisites to Objects",
+            "opts": self.model._meta,
+            "objects": queryset,
+            "content_types": ContentType.objects.order_by("app_label", "model"),
+            "error": error,
+            "action": "copy_to_objects_action",
+        }
+        return render(
+            request, "admin/prerequisites_copy_to_objects_action.html", context
+        )
+
 
 # Register both admin classes
 admin.site.register(Prerequisite, PrerequisiteAdmin)
@@ -16,3 +16,11 @@ class PrerequisitesConfig(AppConfig):
     name = "prerequisites"
     verbose_name = "Prerequisites"
     verbose_name_plural = "Prerequisites"
+
+    def ready(self) -> None:
+        """Invalidate cached prerequisite results when character relations change."""
+        from django.apps import apps
+
+        from prerequisites.results import connect_relation_invalidation
+
+        connect_relation_invalidation(apps.get_model("characters", "Character"))
@@ -0,0 +1,254 @@
+"""
+Batched prerequisite evaluation across many characters and prerequisites.
+
+Checking N prerequisites against M characters with check_requirement costs
+N×M tree walks, and every has/count_tag node queries the database on its own.
+evaluate_many instead collects every relation and tag lookup the compiled
+trees need, loads each one for all characters with a single query keyed by
+character ID, and evaluates the trees in memory.
+
+Usage:
+    from prerequisites.batch import evaluate_many
+
+    matrix = evaluate_many(characters, prerequisites)
+    matrix[character.pk][prerequisite.pk]  # True / False
+
+    # Also record the outcomes as PrerequisiteCheckResult rows
+    evaluate_many(characters, prerequisites, persist=True)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Count
+
+from prerequisites.checkers import RequirementCheckResult
+from prerequisites.compiler import CompiledRequirement, CountTagNode, HasNode
+from prerequisites.models import Prerequisite, PrerequisiteCheckResult
+from prerequisites.pushdown import get_many_relation
+from prerequisites.tags import get_tag_lookup
+
+
+def _criteria_key(search_criteria: Dict[str, Any]) -> str:
+    return json.dumps(search_criteria, sort_keys=True, default=str)
+
+
+def _common_model(characters: Sequence[models.Model]) -> Optional[type[models.Model]]:
+    """Return the most specific model class shared by every character."""
+    for model in type(characters[0]).__mro__:
+        if not (isinstance(model, type) and issubclass(model, models.Model)):
+            continue
+        if model._meta.abstract:
+            continue
+        if all(isinstance(character, model) for character in characters):
+            return model
+    return None
+
+
+class BatchLookups:
+    """
+    Relation lookups loaded in bulk for a fixed set of characters.
+
+    Implements the PrefetchedLookups protocol used by compiled requirements.
+    Lookups that could not be prefetched return None so the node queries the
+    database itself, exactly as it would outside a batch.
+    """
+
+    def __init__(
+        self,
+        characters: Sequence[models.Model],
+        compiled: Iterable[CompiledRequirement],
+    ):
+        self._has: Dict[Tuple[str, str], Set[Any]] = {}
+        self._counts: Dict[Tuple[str, str], Dict[Any, int]] = {}
+
+        if not characters:
+            return
+        model = _common_model(characters)
+        if model is None:
+            return
+        character_ids = [character.pk for character in characters]
+
+        for requirement in compiled:
+            for node in requirement.walk():
+                if isinstance(node, HasNode):
+                    self._load_has(model, character_ids, node)
+                elif isinstance(node, CountTagNode):
+                    self._load_count_tag(model, character_ids, node)
+
+    def _load_has(
+        self, model: type[models.Model], character_ids: List[Any], node: HasNode
+    ) -> None:
+        key = (node.field, _criteria_key(node.search_criteria))
+        if key in self._has:
+            return
+        relation = get_many_relation(model, node.field)
+        if relation is None:
+            return
+        related_model, back_reference = relation
+
+        try:
+            owners = (
+                related_model._default_manager.filter(
+                    **{f"{back_reference}__in": character_ids},
+                    **node.search_criteria,
+                )
+                .order_by()
+                .values_list(back_reference, flat=True)
+                .distinct()
+            )
+            self._has[key] = set(owners)
+        except Exception:
+            # Same outcome as the per-character check: invalid criteria never match
+            self._has[key] = set()
+
+    def _load_count_tag(
+        self, model: type[models.Model], character_ids: List[Any], node: CountTagNode
+    ) -> None:
+        key = (node.model_name, node.tag)
+        if key in self._counts:
+            return
+        relation = get_many_relation(model, node.model_name)
+        if relation is None:
+            return
+        related_model, back_reference = relation
+
+        lookup = get_tag_lookup(related_model)
+        if lookup is None:
+            # No tag field: every character counts zero
+            self._counts[key] = {}
+            return
+
+        counts = (
+            related_model._default_manager.filter(
+                **{f"{back_reference}__in": character_ids, lookup: node.tag}
+            )
+            .order_by()
+            .values(back_reference)
+            .annotate(tag_count=Count("pk"))
+            .values_list(back_reference, "tag_count")
+        )
+        self._counts[key] = dict(counts)
+
+    def has(
+        self, character: models.Model, field: str, search_criteria: Dict[str, Any]
+    ) -> Optional[bool]:
+        """Return whether the character has a matching related object."""
+        owners = self._has.get((field, _criteria_key(search_criteria)))
+        if owners is None:
+            return None
+        return character.pk in owners
+
+    def count_tag(
+        self, character: models.Model, model_name: str, tag: str
+    ) -> Optional[int]:
+        """Return how many related objects carry the tag."""
+        counts = self._counts.get((model_name, tag))
+        if counts is None:
+            return None
+        return counts.get(character.pk, 0)
+
+
+def _failure_reasons(result: RequirementCheckResult) -> List[str]:
+    """Return the messages of the leaf requirements that were not met."""
+
+    def collect(message: str, details: Dict[str, Any]) -> List[str]:
+        sub_results = details.get("sub_results")
+        if not sub_results:
+            return [message]
+        reasons = []
+        for sub_result in sub_results:
+            if not sub_result["success"]:
+                reasons.extend(collect(sub_result["message"], sub_result["details"]))
+        return reasons or [message]
+
+    return collect(result.message, result.details)
+
+
+def evaluate_many(
+    characters: Iterable[models.Model],
+    prerequisites: Iterable[Prerequisite],
+    persist: bool = False,
+) -> Dict[Any, Dict[Any, bool]]:
+    """
+    Evaluate every prerequisite against every character.
+
+    Relation and tag lookups are loaded once per distinct lookup for all
+    characters, so the number of queries depends on the requirement trees and
+    not on the number of characters or prerequisites.
+
+    Args:
+        characters: Characters to check
+        prerequisites: Saved Prerequisite instances to check them against
+        persist: Whether to record each outcome as a PrerequisiteCheckResult
+
+    Returns:
+        Result matrix keyed by character ID, then prerequisite ID
+
+    Raises:
+        ValidationError: If a checker fails for a root requirement
+    """
+    characters = list(characters)
+    prerequisites = list(prerequisites)
+    compiled = {
+        prerequisite.pk: prerequisite.get_compiled_requirements()
+        for prerequisite in prerequisites
+    }
+    lookups = BatchLookups(
+        characters, [tree for tree in compiled.values() if tree is not None]
+    )
+
+    matrix: Dict[Any, Dict[Any, bool]] = {}
+    check_results: List[PrerequisiteCheckResult] = []
+    for character in characters:
+        row = matrix.setdefault(character.pk, {})
+        for prerequisite in prerequisites:
+            tree = compiled[prerequisite.pk]
+            failure_reasons: List[str] = []
+            if tree is None:
+                success = True
+            elif persist:
+                result = tree.explain(character, lookups)
+                success = result.success
+                if not success:
+                    failure_reasons = _failure_reasons(result)
+            else:
+                success = tree.evaluate(character, lookups)
+            row[prerequisite.pk] = success
+
+            if persist:
+                check_results.append(
+                    PrerequisiteCheckResult(
+                        character=character,
+                        requirements=prerequisite.requirements,
+                        result=success,
+                        failure_reasons=failure_reasons,
+                        **_checked_object(prerequisite),
+                    )
+                )
+
+    if check_results:
+        PrerequisiteCheckResult.objects.bulk_create(check_results)
+
+    return matrix
+
+
+def _checked_object(prerequisite: Prerequisite) -> Dict[str, Any]:
+    """Return the object a check result is recorded against.
+
+    That is the object the prerequisite is attached to, or the prerequisite
+    itself when it is standalone.
+    """
+    if prerequisite.content_type_id is not None and prerequisite.object_id:
+        return {
+            "content_type_id": prerequisite.content_type_id,
+            "object_id": prerequisite.object_id,
+        }
+    return {
+        "content_type": ContentType.objects.get_for_model(Prerequisite),
+        "object_id": prerequisite.pk,
+    }
@@ -0,0 +1,264 @@
+"""
+Set-based writes for prerequisites attached to many objects.
+
+Used by the admin bulk actions. Instead of saving (and so fully re-validating)
+one Prerequisite at a time, each distinct requirement is validated once and the
+rows are written with ``bulk_create``/``bulk_update`` in batches. A progress
+callback is invoked after every batch so large selections can be reported on.
+
+Usage:
+    from prerequisites.bulk import copy_prerequisites
+
+    result = copy_prerequisites(source.prerequisites, items)
+    result.count    # rows written
+    result.batches  # batches used
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils import timezone
+
+from prerequisites import validators
+from prerequisites.compiler import requirement_hash
+from prerequisites.models import Prerequisite, validate_description
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+# Called with (rows written so far, total rows) after every batch
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk prerequisite write."""
+
+    count: int = 0
+    batches: int = 0
+
+
+def validate_requirements_once(requirements: Iterable[Dict[str, Any]]) -> int:
+    """
+    Validate every distinct requirement structure exactly once.
+
+    Args:
+        requirements: Requirement structures, possibly repeated
+
+    Returns:
+        Number of distinct requirements validated
+
+    Raises:
+        ValidationError: If any requirement is invalid
+    """
+    seen = set()
+    for requirement in requirements:
+        requirement = requirement or {}
+        content_hash = requirement_hash(requirement)
+        if content_hash in seen:
+            continue
+        validators.validate_requirements(requirement)
+        seen.add(content_hash)
+    return len(seen)
+
+
+def attached_prerequisites(model: type[models.Model], object_ids: Iterable[Any]):
+    """
+    Return the prerequisites attached to the given objects of one model.
+
+    Args:
+        model: Model of the target objects
+        object_ids: Primary keys of the target objects
+
+    Returns:
+        QuerySet of Prerequisite
+    """
+    return Prerequisite.objects.filter(
+        content_type=ContentType.objects.get_for_model(model),
+        object_id__in=list(object_ids),
+    )
+
+
+def _write_in_batches(
+    write: Callable[[List[Prerequisite]], Any],
+    rows: List[Prerequisite],
+    batch_size: int,
+    progress: Optional[ProgressCallback],
+) -> BulkWriteResult:
+    """Write rows in batches, reporting progress after each one."""
+    result = BulkWriteResult()
+    total = len(rows)
+    for start in range(0, total, batch_size):
+        batch = rows[start : start + batch_size]
+        write(batch)
+        result.count += len(batch)
+        result.batches += 1
+        logger.debug(f"Wrote {result.count}/{total} prerequisites")
+        if progress is not None:
+            progress(result.count, total)
+    return result
+
+
+def copy_prerequisites(
+    prerequisites: Iterable[Prerequisite],
+    targets: Iterable[models.Model],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None,
+) -> BulkWriteResult:
+    """
+    Attach a copy of every prerequisite to every target object.
+
+    A prerequisite is not copied onto the object it is already attached to.
+
+    Args:
+        prerequisites: Prerequisites to copy
+        targets: Objects to attach the copies to
+        batch_size: Rows per INSERT
+        progress: Optional callback invoked after each batch
+
+    Returns:
+        BulkWriteResult with the number of prerequisites created
+
+    Raises:
+        ValidationError: If a source prerequisite is invalid
+    """
+    prerequisites = list(prerequisites)
+    validate_requirements_once(p.requirements for p in prerequisites)
+    for description in {p.description for p in prerequisites}:
+        validate_description(description)
+
+    rows = []
+    content_types: Dict[type, ContentType] = {}
+    for target in targets:
+        model = type(target)
+        if model not in content_types:
+            content_types[model] = ContentType.objects.get_for_model(model)
+        content_type = content_types[model]
+        for prerequisite in prerequisites:
+            if (
+                prerequisite.content_type_id == content_type.pk
+                and prerequisite.object_id == target.pk
+            ):
+                continue
+            rows.append(
+                Prerequisite(
+                    description=prerequisite.description,
+                    requirements=prerequisite.requirements or {},
+                    content_type=content_type,
+                    object_id=target.pk,
+                )
+            )
+
+    with transaction.atomic():
+        return _write_in_batches(
+            lambda batch: Prerequisite.objects.bulk_create(batch),
+            rows,
+            batch_size,
+            progress,
+        )
+
+
+def set_prerequisites(
+    targets: Iterable[models.Model],
+    requirements: Dict[str, Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None,
+) -> BulkWriteResult:
+    """
+    Give every target object the same requirements.
+
+    Prerequisites already attached to a target are updated in place; targets
+    without one get a new prerequisite described after the object.
+
+    Args:
+        targets: Objects to update
+        requirements: Requirement structure to apply
+        batch_size: Rows per UPDATE/INSERT
+        progress: Optional callback invoked after each batch
+
+    Returns:
+        BulkWriteResult with the number of prerequisites written
+
+    Raises:
+        ValidationError: If the requirements are invalid
+    """
+    requirements = requirements or {}
+    validate_requirements_once([requirements])
+
+    targets = list(targets)
+    if not targets:
+        return BulkWriteResult()
+    model = type(targets[0])
+    content_type = ContentType.objects.get_for_model(model)
+
+    now = timezone.now()
+    existing = list(attached_prerequisites(model, [t.pk for t in targets]))
+    for prerequisite in existing:
+        prerequisite.requirements = requirements
+        # bulk_update does not apply auto_now
+        prerequisite.updated_at = now
+    covered = {prerequisite.object_id for prerequisite in existing}
+    new_rows = [
+        Prerequisite(
+            description=f"Prerequisites for {target}"[:500],
+            requirements=requirements,
+            content_type=content_type,
+            object_id=target.pk,
+        )
+        for target in targets
+        if target.pk not in covered
+    ]
+
+    total = len(existing) + len(new_rows)
+
+    def report_from(offset: int) -> ProgressCallback:
+        def report(done: int, _: int) -> None:
+            if progress is not None:
+                progress(offset + done, total)
+
+        return report
+
+    with transaction.atomic():
+        updated = _write_in_batches(
+            lambda batch: Prerequisite.objects.bulk_update(
+                batch, ["requirements", "updated_at"]
+            ),
+            existing,
+            batch_size,
+            report_from(0),
+        )
+        created = _write_in_batches(
+            lambda batch: Prerequisite.objects.bulk_create(batch),
+            new_rows,
+            batch_size,
+            report_from(updated.count),
+        )
+    return BulkWriteResult(
+        count=updated.count + created.count,
+        batches=updated.batches + created.batches,
+    )
+
+
+def clear_prerequisites(targets: Iterable[models.Model]) -> int:
+    """
+    Remove every prerequisite attached to the target objects.
+
+    Args:
+        targets: Objects of a single model
+
+    Returns:
+        Number of prerequisites deleted
+    """
+    targets = list(targets)
+    if not targets:
+        return 0
+    deleted, _ = attached_prerequisites(
+        type(targets[0]), [t.pk for t in targets]
+    ).delete()
+    return deleted
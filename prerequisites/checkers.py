@@ -6,7 +6,7 @@ meets specific requirements defined in JSON format.
 
 Key features:
 - Support for all requirement types (trait, has, any, all, count_tag)
-- Recursive checking for nested requirements
+- Recursive checking for nested requirements (compiled and cached, see compiler.py)
 - Efficient queries to minimize database hits
 - Extensible system for custom requirement types
 - Clear error handling and informative results
@@ -38,7 +38,7 @@ from typing import Any, Callable, Dict, List, Optional
 from django.core.exceptions import ValidationError
 from django.db import models
 
-from prerequisites import validators
+from prerequisites.tags import get_tag_lookup
 
 
 class RequirementCheckResult:
@@ -127,47 +127,37 @@ def check_requirement(
     if character is None:
         raise ValidationError("Character cannot be None")
 
-    if requirement is None:
-        raise ValidationError("Requirement cannot be None")
+    from prerequisites.compiler import compile_requirement
 
-    # Basic requirement structure validation
-    if not isinstance(requirement, dict):
-        raise ValidationError(
-            f"Requirement must be a dictionary, got {type(requirement).__name__}"
-        )
+    # Validation and dispatch happen once per distinct requirement
+    return compile_requirement(requirement).explain(character)
 
-    if not requirement:
-        raise ValidationError("Requirement cannot be empty")
 
-    requirement_types = list(requirement.keys())
-    if len(requirement_types) != 1:
-        raise ValidationError(
-            f"Requirement must contain exactly one requirement type, "
-            f"got {len(requirement_types)}: {requirement_types}"
-        )
+def meets_requirement(character: "models.Model", requirement: Dict[str, Any]) -> bool:
+    """
+    Return whether a character meets a requirement, without building messages.
 
-    # Extract requirement type and data
-    requirement_type = requirement_types[0]
-    requirement_data = requirement[requirement_type]
+    Uses the same compiled evaluator as check_requirement but short-circuits
+    any/all requirements and skips result construction, making it the cheaper
+    choice when only a yes/no answer is needed.
 
-    # Check if we have a registered checker
-    if requirement_type not in _REQUIREMENT_CHECKERS:
-        raise ValidationError(f"Unknown requirement type: {requirement_type}")
+    Args:
+        character: The character to check requirements against
+        requirement: JSON requirement structure to validate
 
-    # For built-in types, validate using the validators module
-    if requirement_type in ["trait", "has", "any", "all", "count_tag"]:
-        try:
-            validators.validate_requirements(requirement)
-        except ValidationError as e:
-            raise ValidationError(f"Invalid requirement structure: {e}")
+    Returns:
+        True if the requirement is satisfied
 
-    checker_func = _REQUIREMENT_CHECKERS[requirement_type]
+    Raises:
+        ValidationError: If character is None, requirement is invalid,
+                        or requirement type is unknown
+    """
+    if character is None:
+        raise ValidationError("Character cannot be None")
 
-    # Execute checker with error handling
-    try:
-        return checker_func(character, requirement_data)
-    except Exception as e:
-        raise ValidationError(f"Error checking requirement '{requirement_type}': {e}")
+    from prerequisites.compiler import compile_requirement
+
+    return compile_requirement(requirement).evaluate(character)
 
 
 def _check_trait_requirement(
@@ -300,14 +290,33 @@ def _check_has_requirement(
     # Extract search criteria (exclude field name)
     search_criteria = {k: v for k, v in requirement_data.items() if k != "field"}
 
+    # Use helper function to check ORM relationships
+    has_object = _check_has_requirement_orm(character, field, search_criteria)
+
+    return _has_requirement_result(requirement_data, has_object)
+
+
+def _has_requirement_result(
+    requirement_data: Dict[str, Any], has_object: bool
+) -> RequirementCheckResult:
+    """
+    Build the result of a has requirement from an already-known lookup.
+
+    Args:
+        requirement_data: Has requirement data with field and identifiers
+        has_object: Whether the character has a matching object
+
+    Returns:
+        RequirementCheckResult indicating success/failure with details
+    """
+    field = requirement_data["field"]
+    search_criteria = {k: v for k, v in requirement_data.items() if k != "field"}
+
     details = {
         "field": field,
         **search_criteria,
     }
 
-    # Use helper function to check ORM relationships
-    has_object = _check_has_requirement_orm(character, field, search_criteria)
-
     if has_object:
         criteria_desc = ", ".join(f"{k}={v}" for k, v in search_criteria.items())
         return RequirementCheckResult(
@@ -517,6 +526,25 @@ def _check_count_tag_requirement(
     # Get actual count using helper function
     actual_count = _count_objects_with_tag(character, model_name, tag)
 
+    return _count_tag_requirement_result(requirement_data, actual_count)
+
+
+def _count_tag_requirement_result(
+    requirement_data: Dict[str, Any], actual_count: int
+) -> RequirementCheckResult:
+    """
+    Build the result of a count_tag requirement from an already-known count.
+
+    Args:
+        requirement_data: Count requirement data with model, tag, and constraints
+        actual_count: Number of the character's objects carrying the tag
+
+    Returns:
+        RequirementCheckResult indicating success/failure with count details
+    """
+    model_name = requirement_data["model"]
+    tag = requirement_data["tag"]
+
     details = {
         "model": model_name,
         "tag": tag,
@@ -570,7 +598,9 @@ def _count_objects_with_tag(
     Helper function to count objects with a specific tag for a character.
 
     This function handles the actual database queries for count_tag requirements.
-    It can be mocked in tests to avoid database dependencies.
+    The tag field is resolved once per related model (see prerequisites.tags),
+    so this runs at most one query. It can be mocked in tests to avoid database
+    dependencies.
 
     Args:
         character: Character to count objects for
@@ -580,63 +610,29 @@ def _count_objects_with_tag(
     Returns:
         Number of objects with the specified tag
     """
-    try:
-        # Get the related manager for the model
-        if hasattr(character, model_name):
-            related_manager = getattr(character, model_name)
+    # Model/field doesn't exist
+    if not hasattr(character, model_name):
+        return 0
 
-            # Try to filter by tag using common tag field patterns
-            if hasattr(related_manager, "filter"):
-                # Try common tag field names
-                tag_fields = ["tag", "tags", "category", "type"]
-
-                for tag_field in tag_fields:
-                    try:
-                        # For single tag field
-                        count = related_manager.filter(**{tag_field: tag}).count()
-                        if count > 0:
-                            return count
-                    except Exception:
-                        pass
-
-                    try:
-                        # For ManyToMany tag field (tags__name)
-                        count = related_manager.filter(
-                            **{f"{tag_field}__name": tag}
-                        ).count()
-                        if count > 0:
-                            return count
-                    except Exception:
-                        pass
-
-                # If no tag field worked, return 0
-                return 0
-            else:
-                # Single related object - check if it has the tag
-                obj = related_manager
-                if obj is None:
-                    return 0
-
-                # Check common tag attributes
-                for tag_attr in ["tag", "tags", "category", "type"]:
-                    if hasattr(obj, tag_attr):
-                        attr_val = getattr(obj, tag_attr)
-                        if attr_val == tag:
-                            return 1
-                        elif (
-                            hasattr(attr_val, "filter")
-                            and attr_val.filter(name=tag).exists()
-                        ):
-                            return 1
-
-                return 0
-        else:
-            # Model/field doesn't exist
+    related = getattr(character, model_name)
+    if related is None:
+        return 0
+
+    if hasattr(related, "filter"):
+        # Related manager: one aggregate query on the resolved tag field
+        lookup = get_tag_lookup(related.model)
+        if lookup is None:
             return 0
+        return related.filter(**{lookup: tag}).count()
 
-    except Exception:
-        # Any error in counting means 0
+    # Single related object - check if it has the tag
+    if not isinstance(related, models.Model):
         return 0
+    lookup = get_tag_lookup(type(related))
+    if lookup is None:
+        return 0
+    tagged = type(related)._default_manager.filter(pk=related.pk, **{lookup: tag})
+    return int(tagged.exists())
 
 
 def register_requirement_checker(
@@ -662,6 +658,7 @@ def register_requirement_checker(
         register_requirement_checker("custom", custom_checker)
     """
     _REQUIREMENT_CHECKERS[requirement_type] = checker_func
+    _clear_compiled_requirements()
 
 
 def unregister_requirement_checker(requirement_type: str) -> bool:
@@ -674,7 +671,16 @@ def unregister_requirement_checker(requirement_type: str) -> bool:
     Returns:
         True if checker was removed, False if it didn't exist
     """
-    return _REQUIREMENT_CHECKERS.pop(requirement_type, None) is not None
+    removed = _REQUIREMENT_CHECKERS.pop(requirement_type, None) is not None
+    _clear_compiled_requirements()
+    return removed
+
+
+def _clear_compiled_requirements() -> None:
+    """Drop compiled evaluators that may reference a replaced checker."""
+    from prerequisites.compiler import clear_compiled_cache
+
+    clear_compiled_cache()
 
 
 def get_registered_checker_types() -> List[str]:
@@ -0,0 +1,629 @@
+"""
+Requirement compiler for the prerequisite checking engine.
+
+This module turns a validated JSON requirement into a reusable evaluator tree so
+the JSON does not have to be re-validated and re-dispatched on every check.
+
+Key features:
+- Requirements are validated once and compiled into node objects
+- Compiled evaluators are cached process-wide by the requirement's content hash
+- Fast boolean mode with short-circuit any/all and no result objects
+- Explain mode that produces the same RequirementCheckResult messages and
+  details as check_requirement
+- Custom checkers registered with register_requirement_checker are honoured
+
+Usage:
+    from prerequisites.compiler import compile_requirement
+    from prerequisites.helpers import trait_req
+
+    compiled = compile_requirement(trait_req("arete", minimum=3))
+
+    compiled.evaluate(character)  # Returns bool, cheapest path
+    compiled.explain(character)   # Returns RequirementCheckResult
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from prerequisites import checkers, validators
+
+# Maximum number of distinct compiled requirements kept per process
+COMPILED_CACHE_SIZE = 1024
+
+BUILTIN_REQUIREMENT_TYPES = ("trait", "has", "any", "all", "count_tag")
+
+_compiled_cache: "OrderedDict[str, CompiledRequirement]" = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+
+def requirement_hash(requirement: Dict[str, Any]) -> str:
+    """
+    Return a stable content hash for a requirement structure.
+
+    Key order does not affect the hash, so equal requirements stored in
+    different Prerequisite rows share one compiled evaluator.
+
+    Args:
+        requirement: JSON requirement structure
+
+    Returns:
+        Hex-encoded SHA-256 digest of the canonical JSON form
+
+    Raises:
+        TypeError: If the requirement is not JSON serializable
+    """
+    canonical = json.dumps(requirement, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PrefetchedLookups(Protocol):
+    """Source of pre-loaded relation lookups used during batch evaluation.
+
+    Each method returns None when the value was not prefetched, in which case
+    the node falls back to querying the database itself.
+    """
+
+    def has(
+        self, character: "models.Model", field: str, search_criteria: Dict[str, Any]
+    ) -> Optional[bool]:
+        """Return whether the character has a matching related object."""
+
+    def count_tag(
+        self, character: "models.Model", model_name: str, tag: str
+    ) -> Optional[int]:
+        """Return how many related objects carry the tag."""
+
+
+class RequirementNode:
+    """Base class for compiled requirement nodes."""
+
+    def __init__(self, requirement_type: str, requirement_data: Any):
+        self.requirement_type = requirement_type
+        self.requirement_data = requirement_data
+
+    def evaluate(
+        self,
+        character: "models.Model",
+        prefetched: Optional[PrefetchedLookups] = None,
+    ) -> bool:
+        """Return whether the character meets this node, without explanation."""
+        try:
+            return self._evaluate(character, prefetched)
+        except Exception as e:
+            raise ValidationError(
+                f"Error checking requirement '{self.requirement_type}': {e}"
+            )
+
+    def explain(
+        self,
+        character: "models.Model",
+        prefetched: Optional[PrefetchedLookups] = None,
+    ) -> checkers.RequirementCheckResult:
+        """Return the full RequirementCheckResult for this node."""
+        try:
+            return self._explain(character, prefetched)
+        except Exception as e:
+            raise ValidationError(
+                f"Error checking requirement '{self.requirement_type}': {e}"
+            )
+
+    def walk(self) -> Iterator["RequirementNode"]:
+        """Yield this node and every node below it."""
+        yield self
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        raise NotImplementedError
+
+    def _explain(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> checkers.RequirementCheckResult:
+        raise NotImplementedError
+
+
+class CheckerNode(RequirementNode):
+    """Node that delegates to a registered checker function.
+
+    Used for custom requirement types and for built-in leaves in explain mode,
+    so messages stay identical to the checker implementations.
+    """
+
+    def __init__(
+        self,
+        requirement_type: str,
+        requirement_data: Any,
+        checker_func: Callable[
+            ["models.Model", Dict[str, Any]], checkers.RequirementCheckResult
+        ],
+    ):
+        super().__init__(requirement_type, requirement_data)
+        self.checker_func = checker_func
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        return bool(self._explain(character, prefetched).success)
+
+    def _explain(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> checkers.RequirementCheckResult:
+        return self.checker_func(character, self.requirement_data)
+
+
+class TraitNode(CheckerNode):
+    """Compiled trait requirement."""
+
+    def __init__(self, requirement_data: Dict[str, Any]):
+        super().__init__("trait", requirement_data, checkers._check_trait_requirement)
+        self.trait_name = requirement_data["name"]
+        self.minimum = requirement_data.get("min")
+        self.maximum = requirement_data.get("max")
+        self.exact = requirement_data.get("exact")
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        actual_value = getattr(character, self.trait_name, 0)
+        if self.minimum is not None and actual_value < self.minimum:
+            return False
+        if self.maximum is not None and actual_value > self.maximum:
+            return False
+        if self.exact is not None and actual_value != self.exact:
+            return False
+        return True
+
+
+class HasNode(CheckerNode):
+    """Compiled has requirement."""
+
+    def __init__(self, requirement_data: Dict[str, Any]):
+        super().__init__("has", requirement_data, checkers._check_has_requirement)
+        self.field = requirement_data["field"]
+        self.search_criteria = {
+            k: v for k, v in requirement_data.items() if k != "field"
+        }
+
+    def _has_object(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        if prefetched is not None:
+            has_object = prefetched.has(character, self.field, self.search_criteria)
+            if has_object is not None:
+                return has_object
+        return bool(
+            checkers._check_has_requirement_orm(
+                character, self.field, self.search_criteria
+            )
+        )
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        return self._has_object(character, prefetched)
+
+    def _explain(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> checkers.RequirementCheckResult:
+        return checkers._has_requirement_result(
+            self.requirement_data, self._has_object(character, prefetched)
+        )
+
+
+class CountTagNode(CheckerNode):
+    """Compiled count_tag requirement."""
+
+    def __init__(self, requirement_data: Dict[str, Any]):
+        super().__init__(
+            "count_tag", requirement_data, checkers._check_count_tag_requirement
+        )
+        self.model_name = requirement_data["model"]
+        self.tag = requirement_data["tag"]
+        self.minimum = requirement_data.get("minimum")
+        self.maximum = requirement_data.get("maximum")
+
+    def _count(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> int:
+        if prefetched is not None:
+            actual_count = prefetched.count_tag(character, self.model_name, self.tag)
+            if actual_count is not None:
+                return actual_count
+        return checkers._count_objects_with_tag(character, self.model_name, self.tag)
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        actual_count = self._count(character, prefetched)
+        if self.minimum is not None and actual_count < self.minimum:
+            return False
+        if self.maximum is not None and actual_count > self.maximum:
+            return False
+        return True
+
+    def _explain(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> checkers.RequirementCheckResult:
+        return checkers._count_tag_requirement_result(
+            self.requirement_data, self._count(character, prefetched)
+        )
+
+
+class _LogicalNode(RequirementNode):
+    """Shared behaviour for any/all nodes."""
+
+    def __init__(
+        self,
+        requirement_type: str,
+        requirement_data: List[Dict[str, Any]],
+        children: List[RequirementNode],
+    ):
+        super().__init__(requirement_type, requirement_data)
+        self.children = children
+
+    def walk(self) -> Iterator[RequirementNode]:
+        """Yield this node and every node below it."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def _explain_children(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> List[Dict[str, Any]]:
+        sub_results = []
+        for i, child in enumerate(self.children):
+            try:
+                result = child.explain(character, prefetched)
+                sub_results.append(
+                    {
+                        "index": i,
+                        "success": result.success,
+                        "message": result.message,
+                        "details": result.details,
+                    }
+                )
+            except ValidationError as e:
+                # Sub-requirement failed validation
+                sub_results.append(
+                    {
+                        "index": i,
+                        "success": False,
+                        "message": f"Validation error: {e}",
+                        "details": {},
+                    }
+                )
+        return sub_results
+
+
+class AnyNode(_LogicalNode):
+    """Compiled any (logical OR) requirement."""
+
+    def __init__(
+        self, requirement_data: List[Dict[str, Any]], children: List[RequirementNode]
+    ):
+        super().__init__("any", requirement_data, children)
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        for child in self.children:
+            try:
+                if child.evaluate(character, prefetched):
+                    return True
+            except ValidationError:
+                continue
+        return False
+
+    def _explain(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> checkers.RequirementCheckResult:
+        sub_results = self._explain_children(character, prefetched)
+        details = {"sub_results": sub_results}
+        satisfied_count = sum(1 for r in sub_results if r["success"])
+
+        if satisfied_count:
+            return checkers.RequirementCheckResult(
+                success=True,
+                message=(
+                    f"At least one requirement satisfied "
+                    f"({satisfied_count}/{len(sub_results)})"
+                ),
+                details=details,
+            )
+        return checkers.RequirementCheckResult(
+            success=False,
+            message=f"No requirements satisfied (0/{len(sub_results)})",
+            details=details,
+        )
+
+
+class AllNode(_LogicalNode):
+    """Compiled all (logical AND) requirement."""
+
+    def __init__(
+        self, requirement_data: List[Dict[str, Any]], children: List[RequirementNode]
+    ):
+        super().__init__("all", requirement_data, children)
+
+    def _evaluate(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> bool:
+        for child in self.children:
+            try:
+                if not child.evaluate(character, prefetched):
+                    return False
+            except ValidationError:
+                return False
+        return True
+
+    def _explain(
+        self, character: "models.Model", prefetched: Optional[PrefetchedLookups]
+    ) -> checkers.RequirementCheckResult:
+        sub_results = self._explain_children(character, prefetched)
+        details = {"sub_results": sub_results}
+        satisfied_count = sum(1 for r in sub_results if r["success"])
+
+        if satisfied_count == len(sub_results):
+            return checkers.RequirementCheckResult(
+                success=True,
+                message=(
+                    f"All requirements satisfied "
+                    f"({len(sub_results)}/{len(sub_results)})"
+                ),
+                details=details,
+            )
+        return checkers.RequirementCheckResult(
+            success=False,
+            message=(
+                f"Not all requirements satisfied "
+                f"({satisfied_count}/{len(sub_results)})"
+            ),
+            details=details,
+        )
+
+
+class ErrorNode(RequirementNode):
+    """Node for a nested requirement that could not be compiled.
+
+    Raises the original ValidationError when evaluated, so any/all record it as
+    an unsatisfied sub-requirement exactly as check_requirement would.
+    """
+
+    def __init__(self, error: ValidationError):
+        super().__init__("error", None)
+        self.error = error
+
+    def evaluate(
+        self,
+        character: "models.Model",
+        prefetched: Optional[PrefetchedLookups] = None,
+    ) -> bool:
+        raise self.error
+
+    def explain(
+        self,
+        character: "models.Model",
+        prefetched: Optional[PrefetchedLookups] = None,
+    ) -> checkers.RequirementCheckResult:
+        raise self.error
+
+
+class CompiledRequirement:
+    """
+    A validated requirement compiled into an evaluator tree.
+
+    Instances are immutable and shared between callers through the
+    process-wide cache, so they must not hold per-character state.
+    """
+
+    def __init__(self, root: RequirementNode, content_hash: Optional[str]):
+        self.root = root
+        self.content_hash = content_hash
+
+    @property
+    def requirement_type(self) -> str:
+        """Return the root requirement type."""
+        return self.root.requirement_type
+
+    def evaluate(
+        self,
+        character: "models.Model",
+        prefetched: Optional[PrefetchedLookups] = None,
+    ) -> bool:
+        """Return whether the character meets the requirement.
+
+        Args:
+            character: The character to check
+            prefetched: Optional pre-loaded lookups from a batch evaluation
+
+        Returns:
+            True if the requirement is satisfied
+
+        Raises:
+            ValidationError: If a checker fails for the root requirement
+        """
+        return self.root.evaluate(character, prefetched)
+
+    def explain(
+        self,
+        character: "models.Model",
+        prefetched: Optional[PrefetchedLookups] = None,
+    ) -> checkers.RequirementCheckResult:
+        """Return the full result with messages and details.
+
+        Args:
+            character: The character to check
+            prefetched: Optional pre-loaded lookups from a batch evaluation
+
+        Returns:
+            RequirementCheckResult identical to check_requirement's output
+        """
+        return self.root.explain(character, prefetched)
+
+    def walk(self) -> Iterator[RequirementNode]:
+        """Yield every node in the compiled tree."""
+        return self.root.walk()
+
+    def __repr__(self) -> str:
+        """Return detailed string representation."""
+        return (
+            f"CompiledRequirement(type='{self.requirement_type}', "
+            f"hash='{self.content_hash}')"
+        )
+
+
+def split_requirement(requirement: Any) -> Tuple[str, Any]:
+    """
+    Return the (type, data) pair of a single-rooted requirement.
+
+    Args:
+        requirement: JSON requirement structure
+
+    Returns:
+        Tuple of requirement type and requirement data
+
+    Raises:
+        ValidationError: If the requirement is not a single-key dictionary
+    """
+    if requirement is None:
+        raise ValidationError("Requirement cannot be None")
+
+    if not isinstance(requirement, dict):
+        raise ValidationError(
+            f"Requirement must be a dictionary, got {type(requirement).__name__}"
+        )
+
+    if not requirement:
+        raise ValidationError("Requirement cannot be empty")
+
+    requirement_types = list(requirement.keys())
+    if len(requirement_types) != 1:
+        raise ValidationError(
+            f"Requirement must contain exactly one requirement type, "
+            f"got {len(requirement_types)}: {requirement_types}"
+        )
+
+    requirement_type = requirement_types[0]
+    return requirement_type, requirement[requirement_type]
+
+
+def _builtin_checkers() -> Dict[str, Callable]:
+    return {
+        "trait": checkers._check_trait_requirement,
+        "has": checkers._check_has_requirement,
+        "any": checkers._check_any_requirement,
+        "all": checkers._check_all_requirement,
+        "count_tag": checkers._check_count_tag_requirement,
+    }
+
+
+def _compile_node(requirement: Any) -> RequirementNode:
+    """Compile one (already validated) requirement into a node."""
+    requirement_type, requirement_data = split_requirement(requirement)
+
+    checker_func = checkers._REQUIREMENT_CHECKERS.get(requirement_type)
+    if checker_func is None:
+        raise ValidationError(f"Unknown requirement type: {requirement_type}")
+
+    # Overridden built-ins behave like custom types
+    if _builtin_checkers().get(requirement_type) is not checker_func:
+        return CheckerNode(requirement_type, requirement_data, checker_func)
+
+    if requirement_type == "trait":
+        return TraitNode(requirement_data)
+    if requirement_type == "has":
+        return HasNode(requirement_data)
+    if requirement_type == "count_tag":
+        return CountTagNode(requirement_data)
+
+    children = [_compile_child(child) for child in requirement_data]
+    if requirement_type == "any":
+        return AnyNode(requirement_data, children)
+    return AllNode(requirement_data, children)
+
+
+def _compile_child(requirement: Any) -> RequirementNode:
+    """Compile a nested requirement, deferring its errors to evaluation time."""
+    try:
+        if isinstance(requirement, dict) and len(requirement) == 1:
+            (requirement_type,) = requirement.keys()
+            if requirement_type in BUILTIN_REQUIREMENT_TYPES:
+                _validate(requirement)
+        return _compile_node(requirement)
+    except ValidationError as e:
+        return ErrorNode(e)
+
+
+def _validate(requirement: Dict[str, Any]) -> None:
+    try:
+        validators.validate_requirements(requirement)
+    except ValidationError as e:
+        raise ValidationError(f"Invalid requirement structure: {e}")
+
+
+def compile_requirement(requirement: Dict[str, Any]) -> CompiledRequirement:
+    """
+    Validate and compile a requirement, reusing a cached evaluator if possible.
+
+    Built-in requirement types are validated with the validators module once
+    per distinct requirement; the result is cached by content hash.
+
+    Args:
+        requirement: JSON requirement structure
+
+    Returns:
+        CompiledRequirement ready for evaluate() or explain()
+
+    Raises:
+        ValidationError: If the requirement is malformed, of an unknown type,
+                        or fails structural validation
+    """
+    requirement_type, _ = split_requirement(requirement)
+
+    if requirement_type not in checkers._REQUIREMENT_CHECKERS:
+        raise ValidationError(f"Unknown requirement type: {requirement_type}")
+
+    try:
+        content_hash: Optional[str] = requirement_hash(requirement)
+    except (TypeError, ValueError):
+        # Custom requirement data that is not JSON serializable is not cached
+        content_hash = None
+
+    if content_hash is not None:
+        with _compiled_cache_lock:
+            compiled = _compiled_cache.get(content_hash)
+            if compiled is not None:
+                _compiled_cache.move_to_end(content_hash)
+                return compiled
+
+    if requirement_type in BUILTIN_REQUIREMENT_TYPES:
+        _validate(requirement)
+
+    compiled = CompiledRequirement(_compile_node(requirement), content_hash)
+
+    if content_hash is not None:
+        with _compiled_cache_lock:
+            _compiled_cache[content_hash] = compiled
+            if len(_compiled_cache) > COMPILED_CACHE_SIZE:
+                _compiled_cache.popitem(last=False)
+
+    return compiled
+
+
+def clear_compiled_cache() -> None:
+    """Drop every cached evaluator (called when the checker registry changes)."""
+    with _compiled_cache_lock:
+        _compiled_cache.clear()
+
+
+def get_compiled_cache_size() -> int:
+    """Return the number of requirements currently held in the cache."""
+    return len(_compiled_cache)
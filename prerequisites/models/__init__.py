@@ -30,7 +30,7 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -39,6 +39,11 @@ from django.db import models
 
 from core.models import TimestampedMixin
 from prerequisites import validators
+from prerequisites.checkers import RequirementCheckResult
+from prerequisites.compiler import compile_requirement, requirement_hash
+
+if TYPE_CHECKING:
+    from prerequisites.compiler import CompiledRequirement
 
 
 def validate_description(value: str) -> None:
@@ -143,6 +148,76 @@ class Prerequisite(TimestampedMixin, models.Model):
         self.full_clean()
         super().save(*args, **kwargs)
 
+        # Requirements may have been edited in place, so rehash them
+        self._requirements_hash = None
+        # Keep the compiled evaluator warm for the checks that follow
+        self.get_compiled_requirements()
+
+    @property
+    def requirements_hash(self) -> str:
+        """
+        Return the content hash of the current requirements.
+
+        The hash is memoized for the requirements object it was computed from,
+        so it is recomputed when requirements are assigned, refreshed or saved.
+        """
+        requirements = self.requirements or {}
+        memo = getattr(self, "_requirements_hash", None)
+        if memo is None or memo[0] is not requirements:
+            memo = (requirements, requirement_hash(requirements))
+            self._requirements_hash = memo
+        return memo[1]
+
+    def get_compiled_requirements(self) -> Optional["CompiledRequirement"]:
+        """
+        Return the compiled evaluator for this prerequisite's requirements.
+
+        The compiled form is kept on the instance and reused until the
+        requirements change; equal requirements on other rows share the same
+        process-wide compiled evaluator.
+
+        Returns:
+            CompiledRequirement, or None when there are no requirements
+        """
+        if not self.requirements:
+            return None
+
+        compiled = getattr(self, "_compiled_requirements", None)
+        if compiled is None or compiled.content_hash != self.requirements_hash:
+            compiled = compile_requirement(self.requirements)
+            self._compiled_requirements = compiled
+        return compiled
+
+    def is_met_by(self, character: models.Model) -> bool:
+        """
+        Return whether a character meets this prerequisite.
+
+        Args:
+            character: The character to check
+
+        Returns:
+            True if the requirements are satisfied (or there are none)
+        """
+        compiled = self.get_compiled_requirements()
+        if compiled is None:
+            return True
+        return compiled.evaluate(character)
+
+    def check_character(self, character: models.Model) -> RequirementCheckResult:
+        """
+        Check a character against this prerequisite with full explanations.
+
+        Args:
+            character: The character to check
+
+        Returns:
+            RequirementCheckResult with messages for display
+        """
+        compiled = self.get_compiled_requirements()
+        if compiled is None:
+            return RequirementCheckResult(success=True, message="No requirements")
+        return compiled.explain(character)
+
 
 class PrerequisiteCheckResult(TimestampedMixin, models.Model):
     """
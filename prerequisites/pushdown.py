@@ -0,0 +1,282 @@
+"""
+SQL pushdown for prerequisite requirements.
+
+This module translates a requirement tree into a Django ``Q`` expression so
+"which characters meet this requirement" can be answered by the database
+instead of by calling check_requirement once per character.
+
+Translation rules:
+- trait: comparison on a concrete, non-null field of the queried model
+- has: ``EXISTS`` subquery on the named relation
+- count_tag: ``COUNT`` subquery on the named relation's tag field
+- any/all: OR/AND of the translated sub-requirements
+
+Nodes that cannot be expressed in SQL (custom checkers, traits that only exist
+on some subclasses, relations that are not many-valued) are evaluated in Python
+on the rows the SQL part has already narrowed down.
+
+Usage:
+    from prerequisites.helpers import all_of, has_item, trait_req
+
+    Character.objects.for_campaign(campaign).meeting(
+        all_of(trait_req("willpower", minimum=3), has_item("possessions", id=7))
+    )
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
+from django.db import models
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from prerequisites.compiler import (
+    AllNode,
+    AnyNode,
+    CountTagNode,
+    ErrorNode,
+    HasNode,
+    RequirementNode,
+    TraitNode,
+    compile_requirement,
+)
+from prerequisites.tags import get_tag_lookup
+
+# Matches no rows; used for sub-requirements that can never be satisfied
+_NEVER = Q(pk__in=[])
+
+
+def get_many_relation(
+    model: type[models.Model], accessor: str
+) -> Optional[Tuple[type[models.Model], str]]:
+    """
+    Resolve a related-manager accessor to (related model, back-reference).
+
+    Args:
+        model: Model the accessor is read from
+        accessor: Attribute name used in the requirement (e.g. "possessions")
+
+    Returns:
+        Tuple of the related model and the lookup on it that points back to
+        ``model``, or None if the accessor is not a many-valued relation
+    """
+    for field in model._meta.get_fields():
+        if field.auto_created and not field.concrete:
+            # Reverse relations are addressed by their accessor name
+            if not (field.one_to_many or field.many_to_many):
+                continue
+            if field.get_accessor_name() != accessor:
+                continue
+            return field.related_model, field.field.name
+        if field.many_to_many and field.name == accessor:
+            return field.related_model, field.related_query_name()
+    return None
+
+
+class PushdownPlan:
+    """
+    A requirement split into its SQL part and its Python residual.
+
+    A row meets the requirement exactly when it matches ``condition`` (with
+    ``aliases`` applied) and every node in ``residual`` evaluates true for it.
+    Subqueries are attached as annotations rather than embedded in the Q object
+    so that django-polymorphic's filter translation only ever sees field
+    lookups; plain aliases are not used because the polymorphic loader copies
+    every annotation onto the concrete instances.
+    """
+
+    def __init__(self, model: type[models.Model], root: RequirementNode):
+        self.model = model
+        self.model_meta = model._meta
+        self.root = root
+        self.aliases: Dict[str, Any] = {}
+        self.condition, self.residual = self._translate(root)
+
+    @property
+    def fully_pushed_down(self) -> bool:
+        """Return True when no node needs Python evaluation."""
+        return not self.residual
+
+    def apply(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Apply the SQL part of the plan to a queryset."""
+        if self.aliases:
+            queryset = queryset.annotate(**self.aliases)
+        if self.condition is not None:
+            queryset = queryset.filter(self.condition)
+        return queryset
+
+    def matches_residual(self, character: models.Model) -> bool:
+        """Evaluate the residual nodes for one character in Python."""
+        for node in self.residual:
+            try:
+                if not node.evaluate(character):
+                    return False
+            except ValidationError:
+                # Root checker errors surface as in check_requirement
+                if node is self.root:
+                    raise
+                return False
+        return True
+
+    def _alias(self, expression: Any) -> str:
+        name = f"prerequisite_{len(self.aliases)}"
+        self.aliases[name] = expression
+        return name
+
+    def _translate(
+        self, node: RequirementNode
+    ) -> Tuple[Optional[Q], List[RequirementNode]]:
+        condition: Optional[Q] = None
+        if isinstance(node, TraitNode):
+            condition = self._trait_condition(node)
+        elif isinstance(node, HasNode):
+            condition = self._has_condition(node)
+        elif isinstance(node, CountTagNode):
+            condition = self._count_tag_condition(node)
+        elif isinstance(node, AllNode):
+            combined = Q()
+            residual: List[RequirementNode] = []
+            for child in node.children:
+                if isinstance(child, ErrorNode):
+                    return _NEVER, []
+                child_condition, child_residual = self._translate(child)
+                if child_condition is not None:
+                    combined &= child_condition
+                residual.extend(child_residual)
+            return combined, residual
+        elif isinstance(node, AnyNode):
+            aliases = dict(self.aliases)
+            alternatives = [
+                self._translate(child)
+                for child in node.children
+                if not isinstance(child, ErrorNode)
+            ]
+            if all(not child_residual for _, child_residual in alternatives):
+                combined = _NEVER
+                for child_condition, _ in alternatives:
+                    combined |= child_condition
+                return combined, []
+            # The whole any node runs in Python; drop its unused subqueries
+            self.aliases = aliases
+
+        if condition is None:
+            return None, [node]
+        return condition, []
+
+    def _trait_condition(self, node: TraitNode) -> Optional[Q]:
+        try:
+            field = self.model_meta.get_field(node.trait_name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.is_relation or field.null:
+            return None
+
+        condition = Q()
+        if node.minimum is not None:
+            condition &= Q(**{f"{node.trait_name}__gte": node.minimum})
+        if node.maximum is not None:
+            condition &= Q(**{f"{node.trait_name}__lte": node.maximum})
+        if node.exact is not None:
+            condition &= Q(**{node.trait_name: node.exact})
+        return condition
+
+    def _has_condition(self, node: HasNode) -> Optional[Q]:
+        relation = get_many_relation(self.model, node.field)
+        if relation is None:
+            return None
+        related_model, back_reference = relation
+
+        try:
+            # Invalid criteria raise here rather than when the query runs
+            related = related_model._default_manager.filter(**node.search_criteria)
+        except (FieldError, ValueError, TypeError):
+            return None
+        name = self._alias(Exists(related.filter(**{back_reference: OuterRef("pk")})))
+        return Q(**{name: True})
+
+    def _count_tag_condition(self, node: CountTagNode) -> Optional[Q]:
+        relation = get_many_relation(self.model, node.model_name)
+        if relation is None:
+            return None
+        related_model, back_reference = relation
+
+        lookup = get_tag_lookup(related_model)
+        if lookup is None:
+            # No tag field: the Python checker always counts zero
+            satisfied = (node.minimum is None or node.minimum <= 0) and (
+                node.maximum is None or node.maximum >= 0
+            )
+            return Q() if satisfied else _NEVER
+
+        counts = (
+            related_model._default_manager.filter(
+                **{back_reference: OuterRef("pk"), lookup: node.tag}
+            )
+            .order_by()
+            .values(back_reference)
+            .annotate(tag_count=Count("pk"))
+            .values("tag_count")
+        )
+        name = self._alias(
+            Coalesce(Subquery(counts, output_field=models.IntegerField()), Value(0))
+        )
+
+        condition = Q()
+        if node.minimum is not None:
+            condition &= Q(**{f"{name}__gte": node.minimum})
+        if node.maximum is not None:
+            condition &= Q(**{f"{name}__lte": node.maximum})
+        return condition
+
+
+def plan_requirement(
+    model: type[models.Model], requirement: Dict[str, Any]
+) -> PushdownPlan:
+    """
+    Translate a requirement into a pushdown plan for ``model``.
+
+    Args:
+        model: Model being filtered (Character or a subclass)
+        requirement: JSON requirement structure
+
+    Returns:
+        PushdownPlan with the SQL condition and the Python residual
+
+    Raises:
+        ValidationError: If the requirement is invalid
+    """
+    return PushdownPlan(model, compile_requirement(requirement).root)
+
+
+def filter_meeting(
+    queryset: models.QuerySet, requirement: Dict[str, Any]
+) -> models.QuerySet:
+    """
+    Filter a queryset down to the rows that meet a requirement.
+
+    When the whole requirement can be pushed down this is a single lazy query.
+    Otherwise the SQL part narrows the candidates, the remaining nodes are
+    evaluated on them in Python, and the result is filtered by primary key.
+
+    Args:
+        queryset: Queryset of characters to filter
+        requirement: JSON requirement structure
+
+    Returns:
+        QuerySet of the rows meeting the requirement
+
+    Raises:
+        ValidationError: If the requirement is invalid, or if a checker fails
+                        for a root requirement that has to run in Python
+    """
+    plan = plan_requirement(queryset.model, requirement)
+    candidates = plan.apply(queryset)
+    if plan.fully_pushed_down:
+        return candidates
+
+    matching_ids = [
+        character.pk for character in candidates if plan.matches_residual(character)
+    ]
+    return queryset.filter(pk__in=matching_ids)
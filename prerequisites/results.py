@@ -0,0 +1,353 @@
+"""
+Memoized prerequisite results with version-based invalidation.
+
+Results are cached under ``(character_id, character version, requirement
+content hash)``. Anything that can change the outcome of a check bumps the
+character's version instead of deleting entries, so stale results are never
+served: they simply stop being addressed and expire on their own.
+
+Version bumps happen on:
+- Character.save (traits and status are read straight off the character)
+- Item.transfer_to and other changes to rows related to a character
+- Bulk updates that bypass save (see bump_character_versions)
+
+Bumps take effect when the surrounding transaction commits, so a concurrent
+check cannot store results computed from uncommitted state under the new
+version.
+
+Usage:
+    from prerequisites.results import prerequisite_result_cache
+
+    prerequisite_result_cache.is_met(character, prerequisite)
+    prerequisite_result_cache.is_met_many(characters, prerequisites)
+    prerequisite_result_cache.stats()  # {"hits": ..., "misses": ..., ...}
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
+
+from django.core.cache import cache
+from django.db import models, transaction
+
+if TYPE_CHECKING:
+    from prerequisites.models import Prerequisite
+
+VERSION_KEY_PREFIX = "prerequisites:character_version"
+RESULT_KEY_PREFIX = "prerequisites:result"
+
+# Results are only reachable while the version is current, so this is just
+# an upper bound on how long unreachable entries linger
+RESULT_TIMEOUT = 60 * 60
+
+# Related rows that never affect a requirement (and change on every save)
+IGNORED_RELATED_MODELS = (
+    "characters.CharacterAuditLog",
+    "prerequisites.PrerequisiteCheckResult",
+)
+
+
+def _version_key(character_id: Any) -> str:
+    return f"{VERSION_KEY_PREFIX}:{character_id}"
+
+
+def get_character_versions(character_ids: Iterable[Any]) -> Dict[Any, int]:
+    """
+    Return the current result-cache version of each character.
+
+    A character without a stored version gets a fresh one. Fresh versions are
+    time based, so a version lost to cache eviction is never reissued and
+    results stored under it cannot come back.
+
+    Args:
+        character_ids: IDs of the characters
+
+    Returns:
+        Dictionary mapping character ID to version
+    """
+    character_ids = list(character_ids)
+    keys = {_version_key(character_id): character_id for character_id in character_ids}
+    stored = cache.get_many(keys)
+
+    versions = {keys[key]: version for key, version in stored.items()}
+    for key, character_id in keys.items():
+        if character_id in versions:
+            continue
+        # Another process may have initialised the key in the meantime
+        cache.add(key, time.time_ns(), timeout=None)
+        versions[character_id] = cache.get(key)
+    return versions
+
+
+def bump_character_versions(*character_ids: Any) -> None:
+    """
+    Invalidate every cached prerequisite result for the given characters.
+
+    The versions are dropped once the current transaction commits (or
+    straight away outside a transaction).
+
+    Args:
+        *character_ids: IDs of characters whose checkable state changed;
+                        None values are ignored
+    """
+    keys = [
+        _version_key(character_id)
+        for character_id in character_ids
+        if character_id is not None
+    ]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class PrerequisiteResultCache:
+    """Cache of prerequisite outcomes with per-process hit statistics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _result_key(self, character_id: Any, version: int, content_hash: str) -> str:
+        return f"{RESULT_KEY_PREFIX}:{character_id}:{version}:{content_hash}"
+
+    def _record(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def is_met(self, character: models.Model, prerequisite: "Prerequisite") -> bool:
+        """
+        Return whether a character meets a prerequisite, using cached results.
+
+        Args:
+            character: The character to check
+            prerequisite: The prerequisite to check against
+
+        Returns:
+            True if the requirements are satisfied (or there are none)
+        """
+        return self.is_met_many([character], [prerequisite])[character.pk][
+            prerequisite.pk
+        ]
+
+    def is_met_many(
+        self,
+        characters: Iterable[models.Model],
+        prerequisites: Iterable["Prerequisite"],
+    ) -> Dict[Any, Dict[Any, bool]]:
+        """
+        Return the result matrix for many characters and prerequisites.
+
+        Cached cells are read with one ``get_many``; the rest are evaluated with
+        evaluate_many and written back with one ``set_many``.
+
+        Args:
+            characters: Characters to check
+            prerequisites: Saved Prerequisite instances
+
+        Returns:
+            Result matrix keyed by character ID, then prerequisite ID
+        """
+        from prerequisites.batch import evaluate_many
+
+        characters = list(characters)
+        prerequisites = list(prerequisites)
+        versions = get_character_versions(character.pk for character in characters)
+
+        keys: Dict[tuple, str] = {}
+        matrix: Dict[Any, Dict[Any, bool]] = {}
+        for character in characters:
+            row = matrix.setdefault(character.pk, {})
+            for prerequisite in prerequisites:
+                if not prerequisite.requirements:
+                    row[prerequisite.pk] = True
+                    continue
+                keys[(character.pk, prerequisite.pk)] = self._result_key(
+                    character.pk,
+                    versions[character.pk],
+                    prerequisite.requirements_hash,
+                )
+
+        cached = cache.get_many(keys.values())
+        missing: Dict[tuple, str] = {}
+        for cell, key in keys.items():
+            if key in cached:
+                matrix[cell[0]][cell[1]] = cached[key]
+            else:
+                missing[cell] = key
+        self._record(hits=len(keys) - len(missing), misses=len(missing))
+
+        if missing:
+            missing_character_ids = {character_id for character_id, _ in missing}
+            missing_prerequisite_ids = {prereq_id for _, prereq_id in missing}
+            computed = evaluate_many(
+                [c for c in characters if c.pk in missing_character_ids],
+                [p for p in prerequisites if p.pk in missing_prerequisite_ids],
+            )
+            to_store = {}
+            for (character_id, prereq_id), key in missing.items():
+                success = computed[character_id][prereq_id]
+                matrix[character_id][prereq_id] = success
+                to_store[key] = success
+            cache.set_many(to_store, timeout=RESULT_TIMEOUT)
+
+        return matrix
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and the hit ratio for this process."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+prerequisite_result_cache = PrerequisiteResultCache()
+
+
+def get_result_cache_stats() -> Dict[str, float]:
+    """Return hit statistics of the shared prerequisite result cache."""
+    return prerequisite_result_cache.stats()
+
+
+# Instance attribute holding the character IDs a row pointed to when loaded
+_LOADED_CHARACTER_IDS = "_prerequisites_loaded_character_ids"
+
+
+def _remember_character_ids(instance: models.Model) -> None:
+    """Record the character IDs a row points to, for bumping after a move."""
+    setattr(
+        instance,
+        _LOADED_CHARACTER_IDS,
+        {
+            # Read __dict__ so deferred foreign keys are not loaded
+            field_name: instance.__dict__.get(field_name)
+            for field_name in _CHARACTER_FOREIGN_KEYS.get(type(instance), ())
+        },
+    )
+
+
+def _relation_loaded(sender: Any, instance: models.Model, **kwargs: Any) -> None:
+    """Remember which characters a freshly loaded related row points to."""
+    _remember_character_ids(instance)
+
+
+def _relation_changed(sender: Any, instance: models.Model, **kwargs: Any) -> None:
+    """
+    Bump the versions of characters an added/changed/removed row points to.
+
+    Rows moved to another character bump the previous character as well.
+    """
+    loaded = getattr(instance, _LOADED_CHARACTER_IDS, {})
+    for field_name in _CHARACTER_FOREIGN_KEYS.get(sender, ()):
+        bump_character_versions(
+            loaded.get(field_name), getattr(instance, field_name, None)
+        )
+    _remember_character_ids(instance)
+
+
+def _m2m_relation_changed(
+    sender: Any,
+    instance: models.Model,
+    action: str,
+    reverse: bool,
+    model: type[models.Model],
+    pk_set: Any,
+    **kwargs: Any,
+) -> None:
+    """Bump character versions when a many-to-many relation to them changes."""
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    character_model = _CHARACTER_M2M_THROUGH.get(sender)
+    if character_model is None:
+        return
+    if isinstance(instance, character_model):
+        bump_character_versions(instance.pk)
+    elif pk_set:
+        bump_character_versions(*pk_set)
+    elif action == "pre_clear":
+        # Clearing from the other side: capture the characters before removal
+        related = getattr(instance, _CHARACTER_M2M_ACCESSOR[sender])
+        bump_character_versions(*related.values_list("pk", flat=True))
+
+
+_CHARACTER_FOREIGN_KEYS: Dict[type, List[str]] = {}
+_CHARACTER_M2M_THROUGH: Dict[type, type] = {}
+_CHARACTER_M2M_ACCESSOR: Dict[type, str] = {}
+
+
+def connect_relation_invalidation(character_model: type[models.Model]) -> None:
+    """
+    Bump character versions whenever a related row changes.
+
+    Connects save/delete handlers for every model with a foreign key to the
+    character model (items, messages, locations, ...) and m2m handlers for every
+    many-to-many relation, i.e. everything a has or count_tag requirement can
+    reference. The foreign keys of loaded rows are remembered so that moving a
+    row to another character also bumps the previous one.
+
+    Args:
+        character_model: The base character model
+    """
+    from django.db.models.signals import (
+        m2m_changed,
+        post_delete,
+        post_init,
+        post_save,
+    )
+
+    for field in character_model._meta.get_fields():
+        if field.related_model and field.related_model._meta.label in (
+            IGNORED_RELATED_MODELS
+        ):
+            continue
+        if field.one_to_many and field.auto_created:
+            related_model = field.related_model
+            _CHARACTER_FOREIGN_KEYS.setdefault(related_model, []).append(
+                field.field.attname
+            )
+            post_init.connect(
+                _relation_loaded,
+                sender=related_model,
+                dispatch_uid=(
+                    f"prerequisites_relation_loaded_{related_model._meta.label}"
+                ),
+            )
+            post_save.connect(
+                _relation_changed,
+                sender=related_model,
+                dispatch_uid=(
+                    f"prerequisites_relation_saved_{related_model._meta.label}"
+                ),
+            )
+            post_delete.connect(
+                _relation_changed,
+                sender=related_model,
+                dispatch_uid=(
+                    f"prerequisites_relation_deleted_{related_model._meta.label}"
+                ),
+            )
+        elif field.many_to_many:
+            if field.auto_created:
+                through = field.through
+                accessor = field.field.name
+            else:
+                through = field.remote_field.through
+                accessor = field.remote_field.get_accessor_name()
+            _CHARACTER_M2M_THROUGH[through] = character_model
+            _CHARACTER_M2M_ACCESSOR[through] = accessor
+            m2m_changed.connect(
+                _m2m_relation_changed,
+                sender=through,
+                dispatch_uid=f"prerequisites_m2m_changed_{through._meta.label}",
+            )
@@ -0,0 +1,114 @@
+"""
+Tag-field resolution for count_tag requirements.
+
+Works out, once per related model, which lookup filters that model by tag so a
+count_tag requirement becomes exactly one aggregate query (or none, when the
+batch evaluator has prefetched the counts).
+
+Resolution order:
+1. A lookup registered with register_tag_field
+2. The first of ``tag``, ``tags``, ``category`` and ``type`` found in the
+   model's ``_meta``; relations resolve to ``<field>__name`` when the related
+   model has a ``name`` field
+
+Usage:
+    from prerequisites.tags import get_tag_lookup, register_tag_field
+
+    register_tag_field(Spell, "school__slug")
+    get_tag_lookup(Spell)  # "school__slug"
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+# Conventional tag field names, in resolution order
+TAG_FIELD_NAMES = ("tag", "tags", "category", "type")
+
+_registered_lookups: Dict[type, Optional[str]] = {}
+_resolved_lookups: Dict[type, Optional[str]] = {}
+_lock = threading.Lock()
+
+
+def register_tag_field(model: type[models.Model], lookup: Optional[str]) -> None:
+    """
+    Set the lookup used to filter a model by tag.
+
+    Args:
+        model: Model whose instances carry tags
+        lookup: ORM lookup compared against the tag (e.g. "tags__name"),
+                or None to declare that the model has no tags
+    """
+    with _lock:
+        _registered_lookups[model] = lookup
+        _resolved_lookups.pop(model, None)
+
+
+def unregister_tag_field(model: type[models.Model]) -> bool:
+    """
+    Remove a registered tag lookup so the model is introspected again.
+
+    Args:
+        model: Model to unregister
+
+    Returns:
+        True if a lookup was registered, False otherwise
+    """
+    with _lock:
+        _resolved_lookups.pop(model, None)
+        return _registered_lookups.pop(model, None) is not None
+
+
+def _introspect_tag_lookup(model: type[models.Model]) -> Optional[str]:
+    """Return the tag lookup found in the model's fields, if any."""
+    for name in TAG_FIELD_NAMES:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if not field.is_relation:
+            return name
+        try:
+            field.related_model._meta.get_field("name")
+        except FieldDoesNotExist:
+            continue
+        return f"{name}__name"
+    return None
+
+
+def get_tag_lookup(model: type[models.Model]) -> Optional[str]:
+    """
+    Return the lookup that filters ``model`` by tag.
+
+    The answer is cached per model for the life of the process.
+
+    Args:
+        model: Related model counted by a count_tag requirement
+
+    Returns:
+        ORM lookup to compare with the tag, or None if the model has no tags
+    """
+    try:
+        return _resolved_lookups[model]
+    except KeyError:
+        pass
+
+    with _lock:
+        for klass in model.__mro__:
+            if klass in _registered_lookups:
+                lookup = _registered_lookups[klass]
+                break
+        else:
+            lookup = _introspect_tag_lookup(model)
+        _resolved_lookups[model] = lookup
+    return lookup
+
+
+def clear_tag_lookup_cache() -> None:
+    """Forget introspected lookups (registered lookups are kept)."""
+    with _lock:
+        _resolved_lookups.clear()
@@ -23,24 +23,27 @@ implement admin interface to make tests pass.
 
 import json
 from datetime import datetime
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from django.contrib.admin import ModelAdmin
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import models, transaction
 from django.test import TestCase, TransactionTestCase
-from django.test.client import Client
+from django.test.client import Client, RequestFactory
 from django.urls import reverse
 
 from campaigns.models import Campaign, CampaignMembership
 from characters.models import Character
 from items.models import Item
 from locations.models import Location
-from prerequisites.admin import PrerequisiteAdmin
+from prerequisites.admin import PrerequisiteAdmin, PrerequisiteAdminMixin
+from prerequisites.bulk import copy_prerequisites
 from prerequisites.helpers import all_of, any_of, count_with_tag, has_item, trait_req
 from prerequisites.models import Prerequisite
+from prerequisites.validators import validate_requirements
 from prerequisites.widgets import PrerequisiteBuilderWidget
 
 User = get_user_model()
@@ -832,6 +835,190 @@ class BulkOperationsTests(TestCase):
         self.assertEqual(errors, 0)
 
 
+class BulkWriteActionsTests(TestCase):
+    """Test the set-based bulk prerequisite actions."""
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            username="admin", email="admin@test.com", password="testpass123"
+        )
+        self.client = Client()
+        self.client.login(username="admin", password="testpass123")
+        self.factory = RequestFactory()
+
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign", description="Test", game_system="WOD", owner=self.user
+        )
+        self.items = [
+            Item.objects.create(
+                name=f"Item {i}", campaign=self.campaign, created_by=self.user
+            )
+            for i in range(3)
+        ]
+        self.item_admin = type(
+            "ItemPrerequisiteAdmin", (PrerequisiteAdminMixin, ModelAdmin), {}
+        )(Item, AdminSite())
+        self.item_admin.message_user = Mock()
+
+    def _post(self, data):
+        request = self.factory.post("/", data)
+        request.user = self.user
+        return request
+
+    def _attached(self, item):
+        return Prerequisite.objects.filter(
+            content_type=ContentType.objects.get_for_model(Item), object_id=item.pk
+        )
+
+    def test_copy_to_objects_validates_each_requirement_once(self):
+        """Test that copies are bulk created after one validation per requirement."""
+        shared = trait_req("arete", minimum=3)
+        prereqs = [
+            Prerequisite.objects.create(description=f"Arete {i}", requirements=shared)
+            for i in range(2)
+        ]
+        url = reverse("admin:prerequisites_prerequisite_changelist")
+
+        with patch(
+            "prerequisites.validators.validate_requirements",
+            wraps=validate_requirements,
+        ) as validate:
+            response = self.client.post(
+                url,
+                {
+                    "action": "copy_to_objects_action",
+                    "_selected_action": [p.pk for p in prereqs],
+                    "content_type": ContentType.objects.get_for_model(Item).pk,
+                    "object_ids": ", ".join(str(item.pk) for item in self.items),
+                    "apply": "1",
+                },
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(validate.call_count, 1)
+        for item in self.items:
+            self.assertEqual(
+                sorted(self._attached(item).values_list("description", flat=True)),
+                ["Arete 0", "Arete 1"],
+            )
+
+    def test_copy_to_objects_rejects_stale_content_type(self):
+        """Test that a content type without a model is a form error."""
+        prereq = Prerequisite.objects.create(
+            description="Arete", requirements=trait_req("arete", minimum=3)
+        )
+        stale = ContentType.objects.create(app_label="removed", model="gone")
+
+        response = self.client.post(
+            reverse("admin:prerequisites_prerequisite_changelist"),
+            {
+                "action": "copy_to_objects_action",
+                "_selected_action": [prereq.pk],
+                "content_type": stale.pk,
+                "object_ids": "1",
+                "apply": "1",
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Choose a content type")
+        self.assertEqual(Prerequisite.objects.count(), 1)
+
+    def test_bulk_actions_only_where_prerequisites_can_attach(self):
+        """Test that mixin admins offer the actions only for attachable models."""
+        from django.contrib import admin
+        from django.contrib.sessions.models import Session
+
+        request = self._post({})
+        bulk_actions = {
+            "update_prerequisites",
+            "clear_prerequisites",
+            "copy_prerequisites",
+        }
+        mixin_admins = [
+            model_admin
+            for model_admin in admin.site._registry.values()
+            if isinstance(model_admin, PrerequisiteAdminMixin)
+        ]
+
+        for model_admin in [*mixin_admins, self.item_admin]:
+            with self.subTest(model=model_admin.model.__name__):
+                # Without a requirements field the actions attach
+                # Prerequisite rows through the GenericForeignKey
+                if not hasattr(model_admin.model, "requirements"):
+                    self.assertIsInstance(
+                        model_admin.model._meta.pk, models.IntegerField
+                    )
+                self.assertLessEqual(
+                    bulk_actions, set(model_admin.get_actions(request))
+                )
+
+        session_admin = type(
+            "SessionPrerequisiteAdmin", (PrerequisiteAdminMixin, ModelAdmin), {}
+        )(Session, AdminSite())
+        self.assertFalse(bulk_actions & set(session_admin.get_actions(request)))
+
+    def test_copy_from_source_object(self):
+        """Test copying attached prerequisites from one object to the others."""
+        source, *targets = self.items
+        Prerequisite.objects.create(
+            description="Needs a wand",
+            requirements=has_item("foci", name="Wand"),
+            content_object=source,
+        )
+        queryset = Item.objects.filter(pk__in=[item.pk for item in self.items])
+
+        self.item_admin.copy_prerequisites_action(
+            self._post({"apply": "1", "source_id": source.pk}), queryset
+        )
+
+        self.assertEqual(self._attached(source).count(), 1)
+        for item in targets:
+            self.assertEqual(
+                self._attached(item).get().requirements,
+                has_item("foci", name="Wand"),
+            )
+
+    def test_update_and_clear_attached_prerequisites(self):
+        """Test updating existing and missing attachments, then clearing them."""
+        existing = Prerequisite.objects.create(
+            description="Old", requirements={}, content_object=self.items[0]
+        )
+        queryset = Item.objects.filter(pk__in=[item.pk for item in self.items])
+        requirements = trait_req("strength", minimum=2)
+
+        self.item_admin.update_prerequisites_action(
+            self._post({"apply": "1", "requirements": json.dumps(requirements)}),
+            queryset,
+        )
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.requirements, requirements)
+        for item in self.items:
+            self.assertEqual(self._attached(item).get().requirements, requirements)
+
+        self.item_admin.clear_prerequisites_action(self._post({}), queryset)
+        self.assertFalse(Prerequisite.objects.filter(object_id__isnull=False).exists())
+
+    def test_large_selections_report_batches(self):
+        """Test that progress is reported after every batch."""
+        source = Prerequisite.objects.create(
+            description="Strength", requirements=trait_req("strength", minimum=1)
+        )
+        progress = []
+
+        result = copy_prerequisites(
+            [source],
+            self.items,
+            batch_size=2,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual(result.count, 3)
+        self.assertEqual(result.batches, 2)
+        self.assertEqual(progress, [(2, 3), (3, 3)])
+
+
 class SecurityTests(TestCase):
     """Test security features in admin interface."""
 
@@ -0,0 +1,135 @@
+"""
+Tests for batched prerequisite evaluation.
+
+Test coverage:
+1. Result matrix matches per-character check_requirement results
+2. Relation lookups are loaded once for all characters
+3. Optional persistence to PrerequisiteCheckResult with bulk_create
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from campaigns.models import Campaign
+from characters.models import MageCharacter
+from items.models import Item
+from prerequisites.batch import evaluate_many
+from prerequisites.checkers import check_requirement
+from prerequisites.helpers import all_of, any_of, count_with_tag, has_item, trait_req
+from prerequisites.models import Prerequisite, PrerequisiteCheckResult
+from users.models import User
+
+
+class EvaluateManyTest(TestCase):
+    """Test evaluate_many across several characters and prerequisites."""
+
+    def setUp(self):
+        """Set up characters, items and prerequisites."""
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign",
+            owner=self.user,
+            game_system="Mage: The Ascension",
+            max_characters_per_player=0,
+        )
+        self.characters = [
+            MageCharacter.objects.create(
+                name=f"Mage {arete}",
+                campaign=self.campaign,
+                player_owner=self.user,
+                game_system="Mage: The Ascension",
+                arete=arete,
+                willpower=arete + 2,
+            )
+            for arete in (1, 3, 5)
+        ]
+        Item.objects.create(
+            name="Wand",
+            campaign=self.campaign,
+            owner=self.characters[1],
+            created_by=self.user,
+        )
+        Item.objects.create(
+            name="Staff",
+            campaign=self.campaign,
+            owner=self.characters[2],
+            created_by=self.user,
+        )
+        self.prerequisites = [
+            Prerequisite.objects.create(
+                description="Wand or Staff",
+                requirements=any_of(
+                    has_item("possessions", name="Wand"),
+                    has_item("possessions", name="Staff"),
+                ),
+            ),
+            Prerequisite.objects.create(
+                description="Arete 3 with a Wand",
+                requirements=all_of(
+                    trait_req("arete", minimum=3), has_item("possessions", name="Wand")
+                ),
+                content_object=self.campaign,
+            ),
+            Prerequisite.objects.create(
+                description="Two magical items",
+                requirements=count_with_tag("possessions", "magical", minimum=2),
+            ),
+            Prerequisite.objects.create(description="Anyone", requirements={}),
+        ]
+
+    def test_matrix_matches_check_requirement(self):
+        """Test that every cell agrees with a per-character check."""
+        matrix = evaluate_many(self.characters, self.prerequisites)
+
+        for character in self.characters:
+            for prerequisite in self.prerequisites:
+                expected = (
+                    check_requirement(character, prerequisite.requirements).success
+                    if prerequisite.requirements
+                    else True
+                )
+                self.assertEqual(
+                    matrix[character.pk][prerequisite.pk], expected, prerequisite
+                )
+
+    def test_lookups_are_loaded_once(self):
+        """Test that queries scale with distinct lookups, not with characters."""
+        with CaptureQueriesContext(connection) as queries:
+            evaluate_many(self.characters, self.prerequisites)
+
+        # One query per distinct has lookup; count_tag has no tag field to query
+        self.assertEqual(len(queries), 2)
+
+    def test_persist_records_results_in_bulk(self):
+        """Test that persisted results carry failure reasons and checked objects."""
+        matrix = evaluate_many(self.characters, self.prerequisites, persist=True)
+
+        self.assertEqual(
+            PrerequisiteCheckResult.objects.count(),
+            len(self.characters) * len(self.prerequisites),
+        )
+        novice_result = PrerequisiteCheckResult.objects.get(
+            character=self.characters[0],
+            content_type=ContentType.objects.get_for_model(Campaign),
+            object_id=self.campaign.pk,
+        )
+        self.assertFalse(novice_result.result)
+        self.assertFalse(matrix[self.characters[0].pk][self.prerequisites[1].pk])
+        self.assertEqual(
+            novice_result.failure_reasons,
+            [
+                "Character has insufficient arete: 1 < 3",
+                "Character does not have required object in possessions (name=Wand)",
+            ],
+        )
+        standalone = PrerequisiteCheckResult.objects.get(
+            character=self.characters[1],
+            content_type=ContentType.objects.get_for_model(Prerequisite),
+            object_id=self.prerequisites[0].pk,
+        )
+        self.assertTrue(standalone.result)
+        self.assertEqual(standalone.failure_reasons, [])
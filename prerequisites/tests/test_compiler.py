@@ -0,0 +1,217 @@
+"""
+Tests for the requirement compiler.
+
+Test coverage:
+1. Compiled evaluators are cached by content hash
+2. Boolean evaluation short-circuits any/all requirements
+3. Explain mode matches check_requirement results
+4. Checker registry changes invalidate compiled evaluators
+5. Prerequisite keeps its compiled form warm
+"""
+
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from campaigns.models import Campaign
+from characters.models import MageCharacter
+from prerequisites.checkers import (
+    RequirementCheckResult,
+    _check_trait_requirement,
+    check_requirement,
+    meets_requirement,
+    register_requirement_checker,
+)
+from prerequisites.compiler import (
+    clear_compiled_cache,
+    compile_requirement,
+    requirement_hash,
+)
+from prerequisites.helpers import all_of, any_of, has_item, trait_req
+from prerequisites.models import Prerequisite
+from users.models import User
+
+
+class CompilerTestMixin:
+    """Shared fixtures for compiler tests."""
+
+    def setUp(self):
+        """Set up test data."""
+        clear_compiled_cache()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign", description="Test", owner=self.user
+        )
+        self.character = MageCharacter.objects.create(
+            name="Test Mage",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+            arete=3,
+            willpower=5,
+        )
+
+
+class CompileRequirementTest(CompilerTestMixin, TestCase):
+    """Test compile_requirement and the compiled evaluators."""
+
+    def test_equal_requirements_share_compiled_evaluator(self):
+        """Test that key order does not defeat the content-hash cache."""
+        first = compile_requirement({"trait": {"name": "arete", "min": 2, "max": 5}})
+        second = compile_requirement({"trait": {"max": 5, "min": 2, "name": "arete"}})
+
+        self.assertIs(first, second)
+        self.assertEqual(
+            first.content_hash,
+            requirement_hash({"trait": {"name": "arete", "max": 5, "min": 2}}),
+        )
+
+    def test_invalid_requirement_is_rejected_at_compile_time(self):
+        """Test that structural validation still happens."""
+        with self.assertRaises(ValidationError) as cm:
+            compile_requirement({"trait": {"min": 2}})
+        self.assertIn("Invalid requirement structure", str(cm.exception))
+
+        with self.assertRaises(ValidationError) as cm:
+            compile_requirement({"unknown": {}})
+        self.assertIn("Unknown requirement type: unknown", str(cm.exception))
+
+    @patch("prerequisites.checkers._check_has_requirement_orm")
+    def test_evaluate_short_circuits_any(self, mock_orm_check):
+        """Test that boolean mode stops at the first satisfied alternative."""
+        mock_orm_check.return_value = True
+        requirement = any_of(has_item("foci", id=1), has_item("foci", id=2))
+
+        self.assertTrue(meets_requirement(self.character, requirement))
+        self.assertEqual(mock_orm_check.call_count, 1)
+
+    @patch("prerequisites.checkers._check_has_requirement_orm")
+    def test_evaluate_short_circuits_all(self, mock_orm_check):
+        """Test that boolean mode stops at the first unmet requirement."""
+        mock_orm_check.return_value = False
+        requirement = all_of(has_item("foci", id=1), has_item("foci", id=2))
+
+        self.assertFalse(meets_requirement(self.character, requirement))
+        self.assertEqual(mock_orm_check.call_count, 1)
+
+    def test_explain_matches_check_requirement(self):
+        """Test that explain mode reproduces the existing messages."""
+        requirement = all_of(
+            trait_req("arete", minimum=4),
+            any_of(trait_req("willpower", minimum=3), trait_req("arete", exact=3)),
+        )
+
+        result = compile_requirement(requirement).explain(self.character)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.message, "Not all requirements satisfied (1/2)")
+        sub_results = result.details["sub_results"]
+        self.assertEqual(
+            sub_results[0]["message"], "Character has insufficient arete: 3 < 4"
+        )
+        self.assertEqual(
+            sub_results[1]["message"], "At least one requirement satisfied (2/2)"
+        )
+        self.assertEqual(
+            check_requirement(self.character, requirement).details, result.details
+        )
+
+    def test_evaluate_agrees_with_explain(self):
+        """Test that both modes give the same answer for trait constraints."""
+        requirements = [
+            trait_req("arete", minimum=3),
+            trait_req("arete", maximum=2),
+            trait_req("arete", exact=3),
+            trait_req("missing_trait", minimum=1),
+            any_of(trait_req("arete", minimum=5), trait_req("willpower", maximum=4)),
+        ]
+        for requirement in requirements:
+            compiled = compile_requirement(requirement)
+            self.assertEqual(
+                compiled.evaluate(self.character),
+                compiled.explain(self.character).success,
+                requirement,
+            )
+
+    def test_registry_change_recompiles(self):
+        """Test that overriding a built-in checker takes effect immediately."""
+        requirement = trait_req("arete", minimum=10)
+        self.assertFalse(meets_requirement(self.character, requirement))
+
+        def always_pass(character, requirement_data):
+            return RequirementCheckResult(success=True, message="Override")
+
+        register_requirement_checker("trait", always_pass)
+        try:
+            self.assertTrue(meets_requirement(self.character, requirement))
+        finally:
+            register_requirement_checker("trait", _check_trait_requirement)
+
+        self.assertFalse(meets_requirement(self.character, requirement))
+
+
+class PrerequisiteCompiledTest(CompilerTestMixin, TestCase):
+    """Test compiled evaluation through the Prerequisite model."""
+
+    def test_save_warms_compiled_requirements(self):
+        """Test that saving keeps the compiled evaluator on the instance."""
+        prereq = Prerequisite.objects.create(
+            description="Arete 3", requirements=trait_req("arete", minimum=3)
+        )
+
+        self.assertIs(
+            prereq._compiled_requirements,
+            compile_requirement(trait_req("arete", minimum=3)),
+        )
+        self.assertTrue(prereq.is_met_by(self.character))
+        self.assertEqual(
+            prereq.check_character(self.character).message,
+            "Character meets arete requirement (minimum 3): 3",
+        )
+
+    def test_changed_requirements_are_recompiled(self):
+        """Test that editing requirements replaces the compiled evaluator."""
+        prereq = Prerequisite.objects.create(
+            description="Arete 3", requirements=trait_req("arete", minimum=3)
+        )
+        prereq.requirements = trait_req("arete", minimum=4)
+
+        self.assertFalse(prereq.is_met_by(self.character))
+
+    def test_requirements_hash_is_memoized(self):
+        """Test that repeated evaluations hash the requirements only once."""
+        prereq = Prerequisite.objects.create(
+            description="Arete 3", requirements=trait_req("arete", minimum=3)
+        )
+
+        with patch(
+            "prerequisites.models.requirement_hash", wraps=requirement_hash
+        ) as hash_requirements:
+            for _ in range(3):
+                self.assertTrue(prereq.is_met_by(self.character))
+
+        self.assertEqual(hash_requirements.call_count, 1)
+
+    def test_requirements_edited_in_place_are_rehashed_on_save(self):
+        """Test that saving rehashes requirements that were mutated."""
+        prereq = Prerequisite.objects.create(
+            description="Arete 3", requirements=trait_req("arete", minimum=3)
+        )
+        prereq.requirements["trait"]["min"] = 4
+        prereq.save()
+
+        self.assertEqual(
+            prereq.requirements_hash, requirement_hash(trait_req("arete", minimum=4))
+        )
+        self.assertFalse(prereq.is_met_by(self.character))
+
+    def test_empty_requirements_are_met(self):
+        """Test that a prerequisite without requirements always passes."""
+        prereq = Prerequisite.objects.create(description="Anyone", requirements={})
+
+        self.assertIsNone(prereq.get_compiled_requirements())
+        self.assertTrue(prereq.is_met_by(self.character))
+        self.assertTrue(prereq.check_character(self.character).success)
@@ -0,0 +1,192 @@
+"""
+Tests for SQL pushdown of prerequisite requirements.
+
+Test coverage:
+1. Trait, has and count_tag requirements translate to SQL
+2. any/all combine translated sub-requirements
+3. Untranslatable nodes fall back to Python evaluation
+4. Character.objects.meeting agrees with check_requirement
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from campaigns.models import Campaign
+from characters.models import Character, MageCharacter
+from items.models import Item
+from prerequisites.checkers import (
+    RequirementCheckResult,
+    check_requirement,
+    register_requirement_checker,
+    unregister_requirement_checker,
+)
+from prerequisites.helpers import all_of, any_of, count_with_tag, has_item, trait_req
+from prerequisites.pushdown import plan_requirement
+from users.models import User
+
+
+class CharacterMeetingTest(TestCase):
+    """Test Character.objects.meeting and the pushdown translator."""
+
+    def setUp(self):
+        """Set up a roster of characters with different traits and items."""
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign",
+            owner=self.user,
+            game_system="Mage: The Ascension",
+            max_characters_per_player=0,
+        )
+        self.novice = MageCharacter.objects.create(
+            name="Novice",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+            arete=1,
+            willpower=3,
+        )
+        self.adept = MageCharacter.objects.create(
+            name="Adept",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+            arete=3,
+            willpower=6,
+        )
+        self.master = MageCharacter.objects.create(
+            name="Master",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+            arete=5,
+            willpower=8,
+        )
+        self.wand = Item.objects.create(
+            name="Wand",
+            campaign=self.campaign,
+            owner=self.adept,
+            created_by=self.user,
+        )
+        self.roster = MageCharacter.objects.filter(campaign=self.campaign)
+
+    def assertMatchesPython(self, queryset, requirement):
+        """Assert that meeting() selects exactly the characters Python selects."""
+        expected = {
+            character.pk
+            for character in queryset
+            if check_requirement(character, requirement).success
+        }
+        self.assertEqual(
+            set(queryset.meeting(requirement).values_list("pk", flat=True)), expected
+        )
+        return expected
+
+    def test_trait_requirement_runs_as_single_query(self):
+        """Test that trait comparisons are pushed down to SQL."""
+        requirement = trait_req("arete", minimum=2, maximum=4)
+
+        with CaptureQueriesContext(connection) as queries:
+            names = list(
+                self.roster.meeting(requirement).values_list("name", flat=True)
+            )
+
+        self.assertEqual(names, ["Adept"])
+        self.assertEqual(len(queries), 1)
+
+    def test_has_requirement_uses_exists(self):
+        """Test that has requirements become EXISTS subqueries."""
+        requirement = has_item("possessions", name="Wand")
+        plan = plan_requirement(MageCharacter, requirement)
+
+        self.assertTrue(plan.fully_pushed_down)
+        self.assertIn("EXISTS", str(plan.apply(self.roster).query))
+        self.assertEqual(list(self.roster.meeting(requirement)), [self.adept])
+        self.assertEqual(
+            self.assertMatchesPython(self.roster, requirement), {self.adept.pk}
+        )
+
+    def test_soft_deleted_items_do_not_count(self):
+        """Test that the subquery uses the same manager as the related manager."""
+        self.wand.is_deleted = True
+        self.wand.save()
+
+        self.assertEqual(
+            self.assertMatchesPython(
+                self.roster, has_item("possessions", id=self.wand.pk)
+            ),
+            set(),
+        )
+
+    def test_logical_requirements_combine(self):
+        """Test any/all requirements with mixed node types."""
+        requirements = [
+            any_of(trait_req("arete", minimum=5), has_item("possessions", name="Wand")),
+            all_of(trait_req("willpower", minimum=4), trait_req("arete", maximum=3)),
+            any_of(
+                all_of(trait_req("arete", exact=1), trait_req("willpower", minimum=3)),
+                trait_req("arete", minimum=5),
+            ),
+        ]
+        for requirement in requirements:
+            plan = plan_requirement(MageCharacter, requirement)
+            self.assertTrue(plan.fully_pushed_down, requirement)
+            self.assertMatchesPython(self.roster, requirement)
+
+    def test_count_tag_without_tag_field_is_constant(self):
+        """Test that count_tag on an untagged relation needs no subquery."""
+        plan = plan_requirement(
+            MageCharacter, count_with_tag("possessions", "magical", minimum=1)
+        )
+
+        self.assertTrue(plan.fully_pushed_down)
+        self.assertEqual(plan.aliases, {})
+        self.assertFalse(plan.apply(self.roster).exists())
+
+    def test_subclass_traits_fall_back_to_python_on_base_model(self):
+        """Test that traits missing from the base model are checked in Python."""
+        requirement = trait_req("arete", minimum=3)
+        plan = plan_requirement(Character, requirement)
+
+        self.assertIsNone(plan.condition)
+        self.assertEqual(len(plan.residual), 1)
+        self.assertMatchesPython(
+            Character.objects.filter(campaign=self.campaign), requirement
+        )
+
+    def test_mixed_requirement_narrows_in_sql_then_python(self):
+        """Test that pushable siblings still filter in SQL when others cannot."""
+        requirement = all_of(
+            has_item("possessions", name="Wand"), trait_req("arete", minimum=3)
+        )
+        plan = plan_requirement(Character, requirement)
+
+        self.assertEqual(len(plan.aliases), 1)
+        self.assertEqual(len(plan.residual), 1)
+        self.assertEqual(
+            self.assertMatchesPython(
+                Character.objects.filter(campaign=self.campaign), requirement
+            ),
+            {self.adept.pk},
+        )
+
+    def test_custom_checker_is_evaluated_in_python(self):
+        """Test that custom requirement types are evaluated in Python."""
+
+        def named_master(character, requirement_data):
+            return RequirementCheckResult(
+                success=character.name == "Master", message="Named master check"
+            )
+
+        register_requirement_checker("named_master", named_master)
+        try:
+            requirement = {"named_master": {}}
+            plan = plan_requirement(MageCharacter, requirement)
+
+            self.assertIsNone(plan.condition)
+            self.assertEqual(len(plan.residual), 1)
+            self.assertEqual(list(self.roster.meeting(requirement)), [self.master])
+        finally:
+            unregister_requirement_checker("named_master")
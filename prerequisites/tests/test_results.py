@@ -0,0 +1,185 @@
+"""
+Tests for memoized prerequisite results.
+
+Test coverage:
+1. Repeated checks are served from the cache
+2. Character saves, item transfers and relation changes invalidate results
+   once their transaction commits
+3. Hit ratio reporting
+"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from campaigns.models import Campaign
+from characters.models import Character, MageCharacter
+from characters.services import CharacterStatusService
+from items.models import Item
+from prerequisites.helpers import has_item, trait_req
+from prerequisites.models import Prerequisite
+from prerequisites.results import (
+    PrerequisiteResultCache,
+    bump_character_versions,
+    get_character_versions,
+)
+from scenes.models import Scene
+from users.models import User
+
+
+class PrerequisiteResultCacheTest(TestCase):
+    """Test the prerequisite result cache and its invalidation."""
+
+    def setUp(self):
+        """Set up characters, an item and prerequisites."""
+        cache.clear()
+        self.result_cache = PrerequisiteResultCache()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign",
+            owner=self.user,
+            game_system="Mage: The Ascension",
+            max_characters_per_player=0,
+        )
+        self.mage = MageCharacter.objects.create(
+            name="Mage",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+            arete=2,
+        )
+        self.apprentice = MageCharacter.objects.create(
+            name="Apprentice",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+            arete=1,
+        )
+        self.wand = Item.objects.create(
+            name="Wand", campaign=self.campaign, owner=self.mage, created_by=self.user
+        )
+        self.arete_prereq = Prerequisite.objects.create(
+            description="Arete 3", requirements=trait_req("arete", minimum=3)
+        )
+        self.wand_prereq = Prerequisite.objects.create(
+            description="Needs a wand",
+            requirements=has_item("possessions", name="Wand"),
+        )
+
+    def test_repeated_checks_are_served_from_cache(self):
+        """Test that a second check needs no queries and counts as a hit."""
+        self.assertTrue(self.result_cache.is_met(self.mage, self.wand_prereq))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(self.result_cache.is_met(self.mage, self.wand_prereq))
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(
+            self.result_cache.stats(), {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+        )
+
+    def test_character_save_invalidates(self):
+        """Test that saving a character bumps its version."""
+        self.assertFalse(self.result_cache.is_met(self.mage, self.arete_prereq))
+
+        self.mage.arete = 3
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mage.save()
+
+        self.assertTrue(self.result_cache.is_met(self.mage, self.arete_prereq))
+        self.assertEqual(self.result_cache.misses, 2)
+
+    def test_item_transfer_invalidates_both_owners(self):
+        """Test that transferring an item invalidates giver and receiver."""
+        matrix = self.result_cache.is_met_many(
+            [self.mage, self.apprentice], [self.wand_prereq]
+        )
+        self.assertEqual(
+            matrix,
+            {
+                self.mage.pk: {self.wand_prereq.pk: True},
+                self.apprentice.pk: {self.wand_prereq.pk: False},
+            },
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.wand.transfer_to(self.apprentice)
+
+        matrix = self.result_cache.is_met_many(
+            [self.mage, self.apprentice], [self.wand_prereq]
+        )
+        self.assertEqual(
+            matrix,
+            {
+                self.mage.pk: {self.wand_prereq.pk: False},
+                self.apprentice.pk: {self.wand_prereq.pk: True},
+            },
+        )
+        self.assertEqual(self.result_cache.hits, 0)
+
+    def test_relation_changes_bump_versions(self):
+        """Test that related-row and m2m changes bump character versions."""
+        versions = get_character_versions([self.mage.pk, self.apprentice.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Item.objects.create(
+                name="Staff",
+                campaign=self.campaign,
+                owner=self.apprentice,
+                created_by=self.user,
+            )
+            scene = Scene.objects.create(
+                name="Scene", campaign=self.campaign, created_by=self.user
+            )
+            scene.participants.add(self.mage)
+
+        new_versions = get_character_versions([self.mage.pk, self.apprentice.pk])
+        self.assertNotEqual(new_versions[self.mage.pk], versions[self.mage.pk])
+        self.assertNotEqual(
+            new_versions[self.apprentice.pk], versions[self.apprentice.pk]
+        )
+
+    def test_bulk_status_transition_invalidates(self):
+        """Test that set-based updates that bypass save still bump versions."""
+        Character.objects.filter(pk=self.mage.pk).update(status="SUBMITTED")
+        version = get_character_versions([self.mage.pk])[self.mage.pk]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CharacterStatusService(self.campaign).bulk_transition(
+                self.user, [self.mage.pk], "approve"
+            )
+
+        self.assertNotEqual(
+            get_character_versions([self.mage.pk])[self.mage.pk], version
+        )
+
+    def test_moving_item_with_save_invalidates_previous_owner(self):
+        """Test that reassigning an item with save() bumps both owners."""
+        item = Item.objects.get(pk=self.wand.pk)
+        self.assertTrue(self.result_cache.is_met(self.mage, self.wand_prereq))
+
+        item.owner = self.apprentice
+        with self.captureOnCommitCallbacks(execute=True):
+            item.save()
+
+        self.assertFalse(self.result_cache.is_met(self.mage, self.wand_prereq))
+        self.assertTrue(self.result_cache.is_met(self.apprentice, self.wand_prereq))
+
+    def test_versions_are_bumped_on_commit(self):
+        """Test that a bump inside a transaction waits for the commit."""
+        version = get_character_versions([self.mage.pk])[self.mage.pk]
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            bump_character_versions(self.mage.pk)
+            self.assertEqual(
+                get_character_versions([self.mage.pk])[self.mage.pk], version
+            )
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(
+            get_character_versions([self.mage.pk])[self.mage.pk], version
+        )
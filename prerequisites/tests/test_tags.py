@@ -0,0 +1,121 @@
+"""
+Tests for tag-field resolution used by count_tag requirements.
+
+Test coverage:
+1. Introspection and registry resolution, cached per model
+2. count_tag runs a single aggregate query
+3. Pushdown and batch evaluation use the resolved lookup
+4. Real query errors are reported instead of counting zero
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from campaigns.models import Campaign
+from characters.models import MageCharacter
+from items.models import Item
+from prerequisites.batch import BatchLookups
+from prerequisites.checkers import check_requirement
+from prerequisites.compiler import compile_requirement
+from prerequisites.helpers import count_with_tag
+from prerequisites.pushdown import plan_requirement
+from prerequisites.tags import get_tag_lookup, register_tag_field, unregister_tag_field
+from users.models import Theme, User
+
+
+class TagLookupResolutionTest(TestCase):
+    """Test get_tag_lookup introspection and registry."""
+
+    def tearDown(self):
+        """Remove registered lookups."""
+        unregister_tag_field(Item)
+
+    def test_models_without_tag_fields_resolve_to_none(self):
+        """Test that untagged models need no query at all."""
+        self.assertIsNone(get_tag_lookup(Item))
+
+    def test_conventional_field_is_introspected(self):
+        """Test that a plain ``category`` field is found in _meta."""
+        self.assertEqual(get_tag_lookup(Theme), "category")
+
+    def test_registered_lookup_wins(self):
+        """Test that registry entries override introspection."""
+        register_tag_field(Item, "name")
+
+        self.assertEqual(get_tag_lookup(Item), "name")
+
+        unregister_tag_field(Item)
+        self.assertIsNone(get_tag_lookup(Item))
+
+
+class CountTagQueryTest(TestCase):
+    """Test count_tag evaluation with a resolved tag lookup."""
+
+    def setUp(self):
+        """Set up a character owning tagged items."""
+        register_tag_field(Item, "description")
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass"
+        )
+        self.campaign = Campaign.objects.create(
+            name="Test Campaign",
+            owner=self.user,
+            game_system="Mage: The Ascension",
+            max_characters_per_player=0,
+        )
+        self.mage = MageCharacter.objects.create(
+            name="Mage",
+            campaign=self.campaign,
+            player_owner=self.user,
+            game_system="Mage: The Ascension",
+        )
+        for name in ("Wand", "Staff"):
+            Item.objects.create(
+                name=name,
+                description="focus",
+                campaign=self.campaign,
+                owner=self.mage,
+                created_by=self.user,
+            )
+        self.requirement = count_with_tag("possessions", "focus", minimum=2)
+
+    def tearDown(self):
+        """Remove registered lookups."""
+        unregister_tag_field(Item)
+
+    def test_count_tag_runs_one_query(self):
+        """Test that a count_tag check is a single COUNT query."""
+        with CaptureQueriesContext(connection) as queries:
+            result = check_requirement(self.mage, self.requirement)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.details["actual_count"], 2)
+        self.assertEqual(len(queries), 1)
+
+    def test_batch_prefetch_needs_no_query_per_check(self):
+        """Test that prefetched counts are used without further queries."""
+        compiled = compile_requirement(self.requirement)
+        lookups = BatchLookups([self.mage], [compiled])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(compiled.evaluate(self.mage, lookups))
+        self.assertEqual(len(queries), 0)
+
+    def test_pushdown_uses_resolved_lookup(self):
+        """Test that the SQL plan counts with the registered lookup."""
+        plan = plan_requirement(MageCharacter, self.requirement)
+
+        self.assertTrue(plan.fully_pushed_down)
+        self.assertEqual(
+            list(MageCharacter.objects.meeting(self.requirement)), [self.mage]
+        )
+
+    def test_invalid_lookup_is_reported(self):
+        """Test that query errors surface instead of counting zero."""
+        register_tag_field(Item, "no_such_field")
+
+        with self.assertRaises(ValidationError) as cm:
+            check_requirement(self.mage, self.requirement)
+        self.assertIn("Error checking requirement 'count_tag'", str(cm.exception))
@@ -11,6 +11,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
 from core.rate_limiting import chat_rate_limiter
+from core.safety_screening import ScreeningProfile, chat_safety_screener
 
 from .models import Message, Scene
 
@@ -26,6 +27,7 @@ class SceneChatConsumer(AsyncWebsocketConsumer):
         self.scene_id: Optional[int] = None
         self.scene: Optional[Scene] = None
         self.room_group_name: Optional[str] = None
+        self.safety_profile: Optional[ScreeningProfile] = None
         self.user = None
 
     async def connect(self):
@@ -60,6 +62,10 @@ class SceneChatConsumer(AsyncWebsocketConsumer):
                 await self.close()
                 return
 
+            # Load the safety profile before the first message needs it
+            self.safety_profile = ScreeningProfile(self.scene.campaign)
+            await chat_safety_screener.warm(self.safety_profile)
+
             # Join room group
             self.room_group_name = f"scene_chat_{self.scene_id}"
             await self.channel_layer.group_add(self.room_group_name, self.channel_name)
@@ -149,6 +155,21 @@ class SceneChatConsumer(AsyncWebsocketConsumer):
                 await self.send_error("Message contains inappropriate content")
                 return
 
+            # Lines & Veils screening against everyone in the campaign
+            screening = await self.screen_content_safety(content)
+            if not screening.screened:
+                await self.send_error(
+                    "Message could not be checked against this campaign's "
+                    "lines and veils; please try again"
+                )
+                return
+            if screening.blocked:
+                await self.send_error(
+                    "Message crosses a line set for this campaign: "
+                    f"{', '.join(screening.lines_violated)}"
+                )
+                return
+
             # Get character if provided
             character = None
             if character_id:
@@ -180,12 +201,14 @@ class SceneChatConsumer(AsyncWebsocketConsumer):
                 recipients=recipients,
             )
 
-            # Send message to room group
+            # Send message to room group, with any veils it touches
+            serialized = await self.serialize_message(message)
+            serialized["veil_warnings"] = screening.veils_triggered
             await self.channel_layer.group_send(
                 self.room_group_name,
                 {
                     "type": "chat.message.send",
-                    "message": await self.serialize_message(message),
+                    "message": serialized,
                 },
             )
 
@@ -210,6 +233,7 @@ class SceneChatConsumer(AsyncWebsocketConsumer):
                         "recipients": message.get("recipients", []),
                         "timestamp": message["timestamp"],
                         "id": message["id"],
+                        "veil_warnings": message.get("veil_warnings", []),
                     }
                 )
             )
@@ -269,6 +293,15 @@ class SceneChatConsumer(AsyncWebsocketConsumer):
 
         return False
 
+    async def screen_content_safety(self, content: str):
+        """
+        Screen message content against campaign members' lines and veils.
+
+        Uses this connection's copy of the campaign's safety profile, so it
+        adds no per-message queries.
+        """
+        return await chat_safety_screener.screen(self.safety_profile, content)
+
     @database_sync_to_async
     def get_scene(self):
         """Get scene from database."""
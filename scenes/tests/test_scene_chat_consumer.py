@@ -9,6 +9,7 @@ from django.test import TransactionTestCase, override_settings
 
 from campaigns.models import Campaign
 from characters.models import Character
+from core.safety_screening import chat_safety_screener
 from scenes.models import Scene
 
 User = get_user_model()
@@ -766,3 +767,186 @@ class SceneChatConsumerTestCase(TransactionTestCase):
         # This is optional functionality that could be implemented
 
         await communicator.disconnect()
+
+    async def _connect_with_safety_preferences(self):
+        """Give user2 a line and a veil, then connect user1."""
+        from scenes.consumers import SceneChatConsumer
+        from users.models.safety import UserSafetyPreferences
+
+        await database_sync_to_async(UserSafetyPreferences.objects.create)(
+            user=self.user2, lines=["Torture"], veils=["Spiders"]
+        )
+
+        communicator = WebsocketCommunicator(
+            SceneChatConsumer.as_asgi(), f"/ws/scenes/{self.scene.id}/chat/"
+        )
+        communicator.scope["user"] = self.user1
+
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def test_message_crossing_a_line_is_blocked(self):
+        """Test that messages violating a member's line are not sent."""
+        await self._setup_test_data()
+        communicator = await self._connect_with_safety_preferences()
+
+        await communicator.send_json_to(
+            {
+                "type": "chat_message",
+                "message": {
+                    "message_type": "OOC",
+                    "content": "Time for some torture",
+                },
+            }
+        )
+        response = await communicator.receive_json_from()
+
+        self.assertEqual(response["type"], "error")
+        self.assertIn("Torture", response["error"])
+        from scenes.models import Message
+
+        self.assertFalse(
+            await database_sync_to_async(
+                Message.objects.filter(scene=self.scene).exists
+            )()
+        )
+
+        await communicator.disconnect()
+
+    async def test_message_touching_a_veil_carries_warning(self):
+        """Test that veils touched by a message are attached to the broadcast."""
+        await self._setup_test_data()
+        communicator = await self._connect_with_safety_preferences()
+
+        await communicator.send_json_to(
+            {
+                "type": "chat_message",
+                "message": {
+                    "message_type": "OOC",
+                    "content": "The cellar is full of spiders",
+                },
+            }
+        )
+        response = await communicator.receive_json_from()
+
+        self.assertEqual(response["type"], "chat.message")
+        self.assertEqual(response["veil_warnings"], ["Spiders"])
+
+        await communicator.disconnect()
+
+    async def test_safety_screening_over_budget_still_screens(self):
+        """Test that slow screens are counted but still block the message."""
+        await self._setup_test_data()
+        communicator = await self._connect_with_safety_preferences()
+        timed_out = chat_safety_screener.metrics.timed_out
+
+        with patch.object(chat_safety_screener, "budget_ms", 0):
+            await communicator.send_json_to(
+                {
+                    "type": "chat_message",
+                    "message": {
+                        "message_type": "OOC",
+                        "content": "Time for some torture",
+                    },
+                }
+            )
+            response = await communicator.receive_json_from()
+
+        self.assertEqual(response["type"], "error")
+        self.assertIn("Torture", response["error"])
+        self.assertEqual(chat_safety_screener.metrics.timed_out, timed_out + 1)
+
+        await communicator.disconnect()
+
+    async def test_message_is_not_sent_when_screening_fails(self):
+        """Test that a message that cannot be screened is not sent."""
+        from scenes.models import Message
+
+        await self._setup_test_data()
+        communicator = await self._connect_with_safety_preferences()
+
+        with patch.object(
+            chat_safety_screener.service,
+            "match_campaign_profile",
+            side_effect=RuntimeError("matcher unavailable"),
+        ):
+            await communicator.send_json_to(
+                {
+                    "type": "chat_message",
+                    "message": {"message_type": "OOC", "content": "Hello"},
+                }
+            )
+            response = await communicator.receive_json_from()
+
+        self.assertEqual(response["type"], "error")
+        self.assertIn("try again", response["error"])
+        self.assertFalse(
+            await database_sync_to_async(
+                Message.objects.filter(scene=self.scene).exists
+            )()
+        )
+
+        await communicator.disconnect()
+
+    async def test_enabling_safety_tools_applies_without_reconnecting(self):
+        """Test that turning safety tools on mid-session takes effect."""
+        await self._setup_test_data()
+        await database_sync_to_async(
+            Campaign.objects.filter(pk=self.campaign.pk).update
+        )(safety_tools_enabled=False)
+        communicator = await self._connect_with_safety_preferences()
+        message = {
+            "type": "chat_message",
+            "message": {"message_type": "OOC", "content": "Time for some torture"},
+        }
+
+        await communicator.send_json_to(message)
+        self.assertEqual(
+            (await communicator.receive_json_from())["type"], "chat.message"
+        )
+
+        self.campaign.safety_tools_enabled = True
+        await database_sync_to_async(self.campaign.save)()
+        await communicator.send_json_to(message)
+        response = await communicator.receive_json_from()
+
+        self.assertEqual(response["type"], "error")
+        self.assertIn("Torture", response["error"])
+
+        await communicator.disconnect()
+
+    def _give_user2_line(self, line):
+        """Replace user2's lines with the given one."""
+        preferences = self.user2.safety_preferences
+        preferences.lines = [line]
+        preferences.save()
+
+    async def test_safety_profile_is_reused_until_it_changes(self):
+        """Test messages reuse the connection's profile until it is invalidated."""
+        await self._setup_test_data()
+        communicator = await self._connect_with_safety_preferences()
+        message = {
+            "type": "chat_message",
+            "message": {"message_type": "OOC", "content": "Here be dragons"},
+        }
+
+        with patch.object(
+            chat_safety_screener.service,
+            "get_campaign_profile",
+            wraps=chat_safety_screener.service.get_campaign_profile,
+        ) as get_profile:
+            await communicator.send_json_to(message)
+            response = await communicator.receive_json_from()
+            self.assertEqual(response["type"], "chat.message")
+            get_profile.assert_not_called()
+
+            await database_sync_to_async(self._give_user2_line)("Dragons")
+            await communicator.send_json_to(message)
+            response = await communicator.receive_json_from()
+
+        self.assertEqual(response["type"], "error")
+        self.assertIn("Dragons", response["error"])
+        get_profile.assert_called_once()
+
+        await communicator.disconnect()
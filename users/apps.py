@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        """Keep cached theme data in sync with themes and preferences."""
+        from .signals import connect_theme_cache_invalidation
+
+        connect_theme_cache_invalidation()
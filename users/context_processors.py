@@ -4,18 +4,29 @@ Context processors for the users app.
 Provides user-specific context variables to all templates.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from django.http import HttpRequest
 
 from .models import User
+from .theme_registry import (
+    ThemeRegistry,
+    get_theme_preference_version,
+    get_theme_registry_version,
+    theme_registry,
+)
+
+# Session key holding the theme resolved for the logged-in user
+THEME_SESSION_KEY = "_resolved_theme"
 
 
 def theme_context(request: HttpRequest) -> Dict[str, Any]:
     """
     Add user theme to template context.
 
-    Returns both the theme name and theme object (if available).
+    Returns both the theme name and theme object (if available). Themes come
+    from the process-wide registry, and the theme resolved for a user is
+    kept in their session, so rendering normally makes no theme queries.
     """
     # Handle edge cases: missing user attribute or None user
     if not hasattr(request, "user") or request.user is None:
@@ -25,47 +36,85 @@ def theme_context(request: HttpRequest) -> Dict[str, Any]:
             "available_themes": [],
         }
 
+    registry_version = get_theme_registry_version()
+    registry = theme_registry.ensure_current(registry_version)
+
     # Handle unauthenticated users
     if not request.user.is_authenticated:
         return {
             "user_theme": "light",
             "theme_object": None,
-            "available_themes": _get_available_themes(),
+            "available_themes": list(registry.available_themes),
         }
 
-    # Get user theme with new system
-    theme_name = request.user.get_theme_name()
-    theme_object = request.user.get_theme_object()
-
-    # Validate theme name against active themes
-    available_themes = _get_available_themes()
-    active_theme_names = [theme.name for theme in available_themes]
-
-    # If no Theme objects exist (like in tests), fallback to legacy validation
-    if not available_themes:
-        valid_themes = [choice[0] for choice in User.THEME_CHOICES]
-        if theme_name not in valid_themes:
-            theme_name = "light"
-    elif theme_name not in active_theme_names:
-        theme_name = "light"
+    user = request.user
+    fingerprint = {
+        "user_id": user.pk,
+        "registry_version": registry_version,
+        "preference_version": get_theme_preference_version(user.pk),
+        "legacy_theme": user.theme,
+    }
+    session = getattr(request, "session", None)
+    stored = session.get(THEME_SESSION_KEY) if session is not None else None
+
+    # Without versions from the cache a stored theme could be stale
+    reusable = None not in (registry_version, fingerprint["preference_version"])
+    if reusable and stored and stored["fingerprint"] == fingerprint:
+        theme_name = stored["name"]
+        theme_object = registry.get(stored["theme_id"])
+    else:
+        theme_name, theme_object = _resolve_user_theme(user, registry)
+        if session is not None:
+            session[THEME_SESSION_KEY] = {
+                "fingerprint": fingerprint,
+                "name": theme_name,
+                "theme_id": theme_object.pk if theme_object else None,
+            }
 
     return {
         "user_theme": theme_name,
         "theme_object": theme_object,
-        "available_themes": _get_available_themes(),
+        "available_themes": list(registry.available_themes),
     }
 
 
-def _get_available_themes() -> list:
+def _resolve_user_theme(user: User, registry: ThemeRegistry) -> Tuple[str, Any]:
     """
-    Get list of available themes.
+    Resolve a user's theme name and Theme object.
 
-    Returns empty list if Theme model is not available (during migrations).
+    Follows User.get_theme_name() and User.get_theme_object(), looking themes
+    up in the registry, then validates the name against active themes.
     """
+    preferred_theme = registry.get(_preferred_theme_id(user))
+    legacy_name = user.theme or "light"
+
+    # Get user theme with new system
+    theme_name = preferred_theme.name if preferred_theme else legacy_name
+    theme_object = (
+        preferred_theme or registry.get_active(legacy_name) or registry.default_theme
+    )
+
+    # If no Theme objects exist (like in tests), fallback to legacy validation
+    if not registry.available_themes:
+        valid_themes = [choice[0] for choice in User.THEME_CHOICES]
+        if theme_name not in valid_themes:
+            theme_name = "light"
+    elif not registry.is_active(theme_name):
+        theme_name = "light"
+
+    return theme_name, theme_object
+
+
+def _preferred_theme_id(user: User) -> Optional[int]:
+    """Return the ID of the user's preferred theme, if they have one."""
     try:
-        from .models import Theme
+        from .models import UserThemePreference
 
-        return list(Theme.get_available_themes())
+        return (
+            UserThemePreference.objects.filter(user=user)
+            .values_list("current_theme_id", flat=True)
+            .first()
+        )
     except Exception:
-        # During migrations or if Theme model doesn't exist yet
-        return []
+        # During migrations or if the preference table doesn't exist yet
+        return None
@@ -0,0 +1,54 @@
+"""
+Management command to deactivate expired user sessions.
+
+Run it from cron or another scheduler rather than on the request path:
+
+    python manage.py cleanup_sessions --batch-size 1000
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from users.models.session_models import UserSession
+
+
+class Command(BaseCommand):
+    help = "Deactivate expired user sessions in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "SESSION_CLEANUP_BATCH_SIZE", 1000),
+            help="Number of sessions deactivated per query (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many sessions would be deactivated without changes",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        verbose = options["verbosity"] >= 1
+
+        if options["dry_run"]:
+            count = UserSession.objects.expired().filter(is_active=True).count()
+            if verbose:
+                self.stdout.write(f"{count} expired sessions would be deactivated")
+            return
+
+        def report(total):
+            if verbose:
+                self.stdout.write(f"Deactivated {total} sessions...")
+
+        count = UserSession.objects.cleanup_expired(
+            batch_size=batch_size, progress=report
+        )
+        if verbose:
+            self.stdout.write(
+                self.style.SUCCESS(f"Deactivated {count} expired sessions")
+            )
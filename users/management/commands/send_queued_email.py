@@ -0,0 +1,56 @@
+"""
+Management command to deliver queued outbound email.
+
+Run it once from cron, or keep it running as a worker:
+
+    python manage.py send_queued_email --loop --interval 10
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from users.services.email_queue import email_queue
+
+
+class Command(BaseCommand):
+    help = "Send queued outbound email in batches over one connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "EMAIL_QUEUE_BATCH_SIZE", 100),
+            help="Maximum emails sent per connection (default: 100)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, sending emails as they become due",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=10,
+            help="Seconds to wait when no emails are due in --loop mode",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        verbose = options["verbosity"] >= 1
+
+        while True:
+            sent, failed = email_queue.send_due(batch_size=batch_size)
+            if verbose and (sent or failed or not options["loop"]):
+                self.stdout.write(f"Sent {sent} emails, {failed} failed")
+
+            if not options["loop"]:
+                return
+
+            # Keep going straight away while there is a backlog
+            if sent + failed < batch_size:
+                time.sleep(options["interval"])
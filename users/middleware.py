@@ -7,14 +7,17 @@ activity patterns.
 """
 
 import logging
+from functools import partial
 from typing import Optional
 
 from django.contrib.auth import get_user_model
-from django.contrib.sessions.models import Session
 from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
 
 from .models.session_models import UserSession
+from .services.session_activity import session_activity_tracker
 from .services.session_security import SessionSecurityService
+from .services.session_tracking import TrackedSession, user_session_resolver
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -29,6 +32,10 @@ class SessionTrackingMiddleware(MiddlewareMixin):
     2. Updates session activity timestamps
     3. Monitors for suspicious activity
     4. Handles session security events
+
+    Activity is recorded through the session activity tracker, which batches
+    last_activity writes; the database is only written per request when the
+    IP address or user agent changed.
     """
 
     def __init__(self, get_response):
@@ -46,39 +53,42 @@ class SessionTrackingMiddleware(MiddlewareMixin):
         if not hasattr(request, "session") or not request.session.session_key:
             return None
 
-        # Get or create UserSession
-        user_session = self._get_or_create_user_session(request)
-        if not user_session:
+        # Get or create UserSession; terminated sessions are not tracked
+        tracked = self._get_or_create_user_session(request)
+        if not tracked or not tracked.is_active:
             return None
 
-        # Store user_session on request for views to access
-        request.user_session = user_session
+        # Store user_session on request for views to access; it is only
+        # loaded from the database if a view uses it
+        request.user_session_id = tracked.id
+        request.user_session = SimpleLazyObject(
+            partial(UserSession.objects.get, pk=tracked.id)
+        )
 
         # Check for suspicious activity
-        self._check_session_security(request, user_session)
+        self._check_session_security(request, tracked)
 
         return None
 
     def process_response(self, request, response):
-        """Process outgoing response to update session activity."""
-        # Update session activity if we have a user session
-        if hasattr(request, "user_session") and request.user_session:
-            try:
-                request.user_session.update_activity()
-            except Exception as e:
-                logger.error(f"Error updating session activity: {e}")
+        """Process outgoing response to record session activity."""
+        # Record session activity if we have a user session
+        user_session_id = getattr(request, "user_session_id", None)
+        if user_session_id:
+            session_activity_tracker.record(user_session_id)
 
         return response
 
-    def _get_or_create_user_session(self, request) -> Optional[UserSession]:
-        """Get or create UserSession for the current request."""
+    def _get_or_create_user_session(self, request) -> Optional[TrackedSession]:
+        """Get or create the tracked UserSession for the current request."""
+        session_key = request.session.session_key
         try:
-            # Try to get existing UserSession
-            django_session = Session.objects.get(
-                session_key=request.session.session_key
-            )
+            tracked = user_session_resolver.resolve(session_key, request.user.id)
+            if tracked:
+                return tracked
+
             user_session, created = UserSession.objects.get_or_create(
-                session=django_session,
+                session_id=session_key,
                 defaults={
                     "user": request.user,
                     "ip_address": self._get_client_ip(request),
@@ -87,6 +97,9 @@ class SessionTrackingMiddleware(MiddlewareMixin):
                     ],  # Truncate if too long
                 },
             )
+            if user_session.user_id != request.user.id:
+                logger.warning(f"Session key {session_key} is tracked for another user")
+                return None
 
             if created:
                 # Parse device information for new sessions
@@ -95,13 +108,8 @@ class SessionTrackingMiddleware(MiddlewareMixin):
                     f"Created new UserSession {user_session.id} for user {request.user.id}"
                 )
 
-            return user_session
+            return user_session_resolver.remember(session_key, user_session)
 
-        except Session.DoesNotExist:
-            logger.warning(
-                f"Django session not found for key {request.session.session_key}"
-            )
-            return None
         except Exception as e:
             logger.error(f"Error getting/creating UserSession: {e}")
             return None
@@ -131,12 +139,20 @@ class SessionTrackingMiddleware(MiddlewareMixin):
                 f"Error populating device info for UserSession {user_session.id}: {e}"
             )
 
-    def _check_session_security(self, request, user_session: UserSession):
+    def _check_session_security(self, request, tracked: TrackedSession):
         """Check for suspicious session activity."""
         try:
             ip_address = self._get_client_ip(request)
             user_agent = request.META.get("HTTP_USER_AGENT", "")
 
+            # Nothing to check or write when the client looks the same;
+            # activity is recorded in process_response
+            if tracked.ip_address == ip_address and tracked.user_agent == user_agent:
+                return
+
+            user_session = UserSession.objects.select_related("user").get(pk=tracked.id)
+            request.user_session = user_session
+
             # Let the security service handle the check
             security_result = self.session_service.handle_request_security_check(
                 user_session=user_session, new_ip=ip_address, new_user_agent=user_agent
@@ -153,6 +169,16 @@ class SessionTrackingMiddleware(MiddlewareMixin):
                 )
                 # Note: We don't actually log out here as that would interfere with the response
                 # The session has been deactivated, so subsequent requests will fail
+                request.user_session_id = None
+
+            # Remember the outcome so later requests from this client, or on
+            # the terminated session, need no further reads or checks
+            user_session_resolver.remember(
+                request.session.session_key,
+                user_session,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
 
         except Exception as e:
             logger.error(f"Error checking session security: {e}")
@@ -173,40 +199,3 @@ class SessionTrackingMiddleware(MiddlewareMixin):
 
         # Fallback to REMOTE_ADDR
         return request.META.get("REMOTE_ADDR", "127.0.0.1")
-
-
-class SessionCleanupMiddleware(MiddlewareMixin):
-    """
-    Middleware to periodically clean up expired sessions.
-
-    This runs cleanup operations occasionally to remove expired UserSessions
-    and their associated Django sessions.
-    """
-
-    def __init__(self, get_response):
-        """Initialize the middleware."""
-        super().__init__(get_response)
-        self.cleanup_counter = 0
-        self.cleanup_frequency = 100  # Run cleanup every 100 requests
-
-    def process_response(self, request, response):
-        """Occasionally run session cleanup."""
-        self.cleanup_counter += 1
-
-        if self.cleanup_counter >= self.cleanup_frequency:
-            self.cleanup_counter = 0
-            try:
-                self._cleanup_expired_sessions()
-            except Exception as e:
-                logger.error(f"Error during session cleanup: {e}")
-
-        return response
-
-    def _cleanup_expired_sessions(self):
-        """Clean up expired UserSessions."""
-        try:
-            cleaned_count = UserSession.objects.cleanup_expired()
-            if cleaned_count > 0:
-                logger.info(f"Cleaned up {cleaned_count} expired UserSessions")
-        except Exception as e:
-            logger.error(f"Error cleaning up expired sessions: {e}")
@@ -1,3 +1,4 @@
+from .email_queue import OutboundEmail
 from .email_verification import EmailVerification
 from .password_reset import PasswordReset
 from .safety import UserSafetyPreferences
@@ -12,6 +13,7 @@ __all__ = [
     "UserSafetyPreferences",
     "EmailVerification",
     "PasswordReset",
+    "OutboundEmail",
     "UserSession",
     "SessionSecurityLog",
     "SessionSecurityEvent",
@@ -0,0 +1,104 @@
+"""
+Outbound email queue.
+
+Emails are stored here on the request path and delivered later by the
+send_queued_email management command, so a slow mail relay does not hold
+up registration or password reset requests.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+
+class OutboundEmailManager(models.Manager):
+    """Manager for OutboundEmail with queue helpers."""
+
+    def pending(self) -> models.QuerySet:
+        """Get emails still waiting to be delivered."""
+        return self.filter(status=OutboundEmail.STATUS_PENDING)
+
+    def due(self, now=None) -> models.QuerySet:
+        """
+        Get pending emails whose next delivery attempt is due.
+
+        Args:
+            now: Time to compare against (defaults to the current time)
+
+        Returns:
+            QuerySet: Due emails, oldest first
+        """
+        return self.pending().filter(next_attempt_at__lte=now or timezone.now())
+
+
+class OutboundEmail(models.Model):
+    """
+    An email waiting to be sent, or the record of one that was.
+
+    Failed deliveries are retried with exponential backoff until the
+    maximum number of attempts is reached, after which the email is marked
+    as failed.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    subject = models.CharField(max_length=998, help_text="Email subject")
+
+    body = models.TextField(help_text="Plain text body")
+
+    html_body = models.TextField(blank=True, help_text="Optional HTML body")
+
+    from_email = models.CharField(max_length=254, help_text="Sender address")
+
+    recipients = models.JSONField(default=list, help_text="Recipient addresses")
+
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        help_text="Delivery status",
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0, help_text="Number of failed delivery attempts"
+    )
+
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, help_text="When delivery should next be attempted"
+    )
+
+    last_error = models.TextField(
+        blank=True, help_text="Error from the last failed attempt"
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True, help_text="When the email was queued"
+    )
+
+    sent_at = models.DateTimeField(
+        null=True, blank=True, help_text="When the email was delivered"
+    )
+
+    objects = OutboundEmailManager()
+
+    class Meta:
+        db_table = "users_outbound_email"
+        ordering = ["created_at"]
+        verbose_name = "Outbound Email"
+        verbose_name_plural = "Outbound Emails"
+
+        indexes = [
+            # For picking up due emails
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self) -> str:
+        """Return a readable description of the email."""
+        return f"{self.subject} to {', '.join(self.recipients)} ({self.status})"
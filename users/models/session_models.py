@@ -6,12 +6,15 @@ and security events related to session management.
 """
 
 import hashlib
-from datetime import timedelta
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional
 
 from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
 from django.contrib.sessions.models import Session
 from django.db import models
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
 
@@ -74,8 +77,21 @@ class UserSessionQuerySet(models.QuerySet):
         return self.filter(user=user)
 
     def expired(self):
-        """Return expired sessions based on Django session expiry."""
-        return self.filter(session__expire_date__lt=timezone.now())
+        """
+        Return expired sessions based on Django session expiry.
+
+        Sessions without a django_session row (cache-backed session engines)
+        have no stored expiry; they count as expired once they have been
+        inactive for longer than SESSION_COOKIE_AGE, after which the session
+        store has dropped them too.
+        """
+        now = timezone.now()
+        max_age = timedelta(seconds=settings.SESSION_COOKIE_AGE)
+        sessions = Session.objects.filter(pk=OuterRef("session_id"))
+        return self.filter(
+            Q(Exists(sessions.filter(expire_date__lt=now)))
+            | Q(~Exists(sessions), last_activity__lt=now - max_age)
+        )
 
 
 class UserSessionManager(models.Manager):
@@ -97,17 +113,41 @@ class UserSessionManager(models.Manager):
         """Return expired sessions based on Django session expiry."""
         return self.get_queryset().expired()
 
-    def cleanup_expired(self):
-        """Clean up expired sessions by deactivating them."""
+    def cleanup_expired(
+        self,
+        batch_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Clean up expired sessions by deactivating them.
+
+        Sessions are deactivated with one UPDATE per batch, so each batch
+        holds its locks only briefly.
+
+        Args:
+            batch_size: Maximum number of sessions updated per query
+            progress: Called with the running total after each batch
+
+        Returns:
+            Number of sessions deactivated
+        """
         expired_sessions = self.expired().filter(is_active=True)
-        count = expired_sessions.count()
+        ended_at = timezone.now()
+        total = 0
 
         # Deactivate expired UserSessions instead of deleting
         # This preserves audit records for security analysis
-        for session in expired_sessions:
-            session.deactivate()
+        while True:
+            batch = list(expired_sessions.values_list("pk", flat=True)[:batch_size])
+            if not batch:
+                break
+            total += self.filter(pk__in=batch, is_active=True).update(
+                is_active=False, ended_at=ended_at
+            )
+            if progress:
+                progress(total)
 
-        return count
+        return total
 
 
 class UserSession(models.Model):
@@ -125,10 +165,13 @@ class UserSession(models.Model):
         help_text="The user this session belongs to",
     )
 
+    # Keyed by session key without a database constraint: with cache-backed
+    # session engines there is no django_session row to point at
     session = models.OneToOneField(
         Session,
         on_delete=models.CASCADE,
         unique=True,
+        db_constraint=False,
         help_text="Associated Django session",
     )
 
@@ -269,16 +312,77 @@ class UserSession(models.Model):
         self.ended_at = timezone.now()
         self.save(update_fields=["is_active", "ended_at"])
 
-    def extend_expiry(self, hours: int = 24) -> None:
+    def get_session_store(self) -> SessionBase:
+        """Return a store for the Django session under the configured engine."""
+        engine = import_module(settings.SESSION_ENGINE)
+        return engine.SessionStore(session_key=self.session_id)
+
+    def _get_django_session(self) -> Optional[Session]:
+        """
+        Return the django_session row, or None if there is none.
+
+        Cache-backed session engines keep no rows; the session then lives
+        only in the session store.
+        """
+        if not hasattr(self, "_django_session"):
+            try:
+                self._django_session = self.session
+            except Session.DoesNotExist:
+                self._django_session = None
+        return self._django_session
+
+    def get_expiry_date(self, session_store: Optional[SessionBase] = None) -> datetime:
+        """
+        Return when the Django session expires.
+
+        Sessions that no longer exist in the session store count as expired
+        now.
+
+        Args:
+            session_store: The live session of the current request, if this
+                is its UserSession; it may hold changes not yet saved
+        """
+        if session_store is not None:
+            return session_store.get_expiry_date()
+
+        django_session = self._get_django_session()
+        if django_session is not None:
+            return django_session.expire_date
+
+        store = self.get_session_store()
+        expiry = store.get_expiry_date()
+        # The store drops its key when the session is not found
+        return expiry if store.session_key else timezone.now()
+
+    def end_django_session(self) -> None:
+        """Delete the Django session so its cookie no longer logs anyone in."""
+        self.get_session_store().delete(self.session_id)
+
+    def extend_expiry(
+        self, hours: int = 24, session_store: Optional[SessionBase] = None
+    ) -> None:
         """
         Extend session expiry time.
 
         Args:
             hours: Number of hours to extend the session
+            session_store: The live session of the current request; it is
+                saved by SessionMiddleware with the new expiry
         """
         # Extend from the current expiry date, not current time
-        self.session.expire_date = self.session.expire_date + timedelta(hours=hours)
-        self.session.save(update_fields=["expire_date"])
+        extension = timedelta(hours=hours)
+        if session_store is not None:
+            session_store.set_expiry(session_store.get_expiry_date() + extension)
+        else:
+            django_session = self._get_django_session()
+            if django_session is not None:
+                django_session.expire_date = django_session.expire_date + extension
+                django_session.save(update_fields=["expire_date"])
+            else:
+                store = self.get_session_store()
+                if store.exists(self.session_id):
+                    store.set_expiry(store.get_expiry_date() + extension)
+                    store.save()
 
         # Log the extension
         SessionSecurityLog.objects.create(
@@ -290,13 +394,25 @@ class UserSession(models.Model):
             details={"extension_hours": hours},
         )
 
-    def extend_for_remember_me(self) -> None:
+    def extend_for_remember_me(
+        self, session_store: Optional[SessionBase] = None
+    ) -> None:
         """Extend session for remember me functionality (30 days)."""
-        self.extend_expiry(hours=24 * 30)  # 30 days
+        self.extend_expiry(hours=24 * 30, session_store=session_store)  # 30 days
+
+    @property
+    def session_key(self) -> str:
+        """Return the key of the associated Django session."""
+        return self.session_id
 
     def save(self, *args, **kwargs):
         """Override save to validate IP address field."""
-        self.full_clean()
+        # Validate everything full_clean() would except that the session row
+        # exists, which it need not with cache-backed session engines
+        self.clean_fields(exclude=["session"])
+        self.clean()
+        self.validate_unique()
+        self.validate_constraints()
         super().save(*args, **kwargs)
 
 
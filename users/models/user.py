@@ -1,6 +1,6 @@
 import zoneinfo
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
 
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.core.exceptions import ValidationError
@@ -43,6 +43,20 @@ def validate_timezone(value: str) -> None:
         raise ValidationError(f"'{value}' is not a valid timezone identifier.")
 
 
+def _involves_user(user) -> models.Q:
+    """
+    Return a Campaign filter for campaigns a user owns or is a member of.
+
+    Membership is checked with an EXISTS subquery, so combining filters for
+    several users does not multiply joined rows.
+    """
+    from campaigns.models import CampaignMembership
+
+    return models.Q(owner=user) | models.Exists(
+        CampaignMembership.objects.filter(campaign=models.OuterRef("pk"), user=user)
+    )
+
+
 class CustomUserManager(UserManager):
     """Custom User manager with email verification methods."""
 
@@ -70,6 +84,60 @@ class CustomUserManager(UserManager):
             email_verification_sent_at__lt=timezone.now() - timedelta(hours=24),
         )
 
+    def resolve_profile_visibility(
+        self, users: Iterable["User"], viewer_user: Optional["User"] = None
+    ) -> Dict[int, bool]:
+        """
+        Resolve whether a viewer can see each of several user profiles.
+
+        Gives the same answers as User.can_view_profile(), but checks
+        campaign membership for all "members" profiles with one query.
+        Intended for rosters and participant lists.
+
+        Args:
+            users: Users whose profiles are being viewed
+            viewer_user: The user viewing the profiles (None for anonymous)
+
+        Returns:
+            dict: Visibility keyed by user ID
+        """
+        from campaigns.models import Campaign, CampaignMembership
+
+        visibility = {}
+        members_only = []
+        for user in users:
+            if viewer_user and viewer_user.id == user.id:
+                visibility[user.id] = True
+            elif user.profile_visibility == "members" and viewer_user:
+                members_only.append(user.id)
+            else:
+                visibility[user.id] = user.profile_visibility == "public"
+
+        if members_only:
+            viewer_campaigns = Campaign.objects.filter(
+                _involves_user(viewer_user)
+            ).values("pk")
+            shared = set(
+                self.filter(pk__in=members_only)
+                .filter(
+                    models.Exists(
+                        Campaign.objects.filter(
+                            owner=models.OuterRef("pk"), pk__in=viewer_campaigns
+                        )
+                    )
+                    | models.Exists(
+                        CampaignMembership.objects.filter(
+                            user=models.OuterRef("pk"), campaign__in=viewer_campaigns
+                        )
+                    )
+                )
+                .values_list("pk", flat=True)
+            )
+            for user_id in members_only:
+                visibility[user_id] = user_id in shared
+
+        return visibility
+
 
 class User(AbstractUser):
     """Custom User model extending Django's AbstractUser."""
@@ -309,43 +377,29 @@ class User(AbstractUser):
             return False
 
         # Import here to avoid circular imports
-        from campaigns.models import Campaign, CampaignMembership
-
-        # Get campaigns where self is a member (through membership) or owner
-        my_campaigns = set(
-            CampaignMembership.objects.filter(user=self).values_list(
-                "campaign_id", flat=True
-            )
-        )
-        my_owned_campaigns = set(
-            Campaign.objects.filter(owner=self).values_list("id", flat=True)
-        )
-        my_all_campaigns = my_campaigns | my_owned_campaigns
+        from campaigns.models import Campaign
 
-        # Get campaigns where other_user is a member (through membership) or owner
-        their_campaigns = set(
-            CampaignMembership.objects.filter(user=other_user).values_list(
-                "campaign_id", flat=True
-            )
-        )
-        their_owned_campaigns = set(
-            Campaign.objects.filter(owner=other_user).values_list("id", flat=True)
-        )
-        their_all_campaigns = their_campaigns | their_owned_campaigns
-
-        return len(my_all_campaigns & their_all_campaigns) > 0
+        # One EXISTS query for a campaign both users own or are members of
+        return Campaign.objects.filter(
+            _involves_user(self), _involves_user(other_user)
+        ).exists()
 
-    def get_public_profile_data(self, viewer_user=None) -> dict:
+    def get_public_profile_data(self, viewer_user=None, can_view=None) -> dict:
         """
         Get profile data that can be shown to a specific viewer based on privacy settings.
 
         Args:
             viewer_user: The user viewing the profile
+            can_view: Visibility already resolved, e.g. by
+                User.objects.resolve_profile_visibility(); checked if None
 
         Returns:
             dict: Profile data filtered by privacy settings  # noqa: E501
         """
-        if not self.can_view_profile(viewer_user):
+        if can_view is None:
+            can_view = self.can_view_profile(viewer_user)
+
+        if not can_view:
             # Return minimal public data
             return {
                 "username": self.username,
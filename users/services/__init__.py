@@ -5,8 +5,16 @@ This module contains service classes that implement business logic
 for user management, security, and related functionality.
 """
 
+from .email_queue import EmailQueue
 from .email_verification import EmailVerificationService
 from .password_reset import PasswordResetService
+from .session_activity import SessionActivityTracker
 from .session_security import SessionSecurityService
 
-__all__ = ["EmailVerificationService", "PasswordResetService", "SessionSecurityService"]
+__all__ = [
+    "EmailQueue",
+    "EmailVerificationService",
+    "PasswordResetService",
+    "SessionActivityTracker",
+    "SessionSecurityService",
+]
@@ -0,0 +1,203 @@
+"""
+Background delivery of outbound email.
+
+With EMAIL_QUEUE_ENABLED, services store emails in the OutboundEmail table
+instead of talking to the mail relay during the request. The
+send_queued_email management command delivers them in batches over a
+single reused backend connection, retrying failures with exponential
+backoff.
+"""
+
+import logging
+from datetime import timedelta
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from ..models.email_queue import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+class EmailQueue:
+    """Queues outbound emails and delivers them in batches."""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether emails should be queued instead of sent immediately."""
+        return getattr(settings, "EMAIL_QUEUE_ENABLED", False)
+
+    def enqueue(
+        self,
+        subject: str,
+        message: str,
+        from_email: str,
+        recipient_list: List[str],
+        html_message: Optional[str] = None,
+    ) -> OutboundEmail:
+        """
+        Store an email for background delivery.
+
+        Args:
+            subject: Email subject
+            message: Plain text body
+            from_email: Sender address
+            recipient_list: Recipient addresses
+            html_message: Optional HTML body
+
+        Returns:
+            OutboundEmail: The queued email
+        """
+        return OutboundEmail.objects.create(
+            subject=subject,
+            body=message,
+            html_body=html_message or "",
+            from_email=from_email,
+            recipients=list(recipient_list),
+        )
+
+    def send_due(
+        self, batch_size: Optional[int] = None, connection=None
+    ) -> Tuple[int, int]:
+        """
+        Deliver one batch of due emails over a single connection.
+
+        Args:
+            batch_size: Maximum emails to send (defaults to EMAIL_QUEUE_BATCH_SIZE)
+            connection: Email backend connection (defaults to EMAIL_BACKEND)
+
+        Returns:
+            tuple: (number sent, number that failed)
+        """
+        emails = self._claim(
+            batch_size or getattr(settings, "EMAIL_QUEUE_BATCH_SIZE", 100)
+        )
+        if not emails:
+            return 0, 0
+
+        connection = connection or get_connection(fail_silently=False)
+        sent = failed = 0
+        try:
+            connection.open()
+        except Exception as e:
+            # Each send below will try to connect again and record the error
+            logger.warning(f"Error opening email connection: {e}")
+
+        try:
+            for email in emails:
+                if not self._renew_lease(email):
+                    # Our lease ran out and another worker took the email
+                    continue
+
+                message = EmailMultiAlternatives(
+                    subject=email.subject,
+                    body=email.body,
+                    from_email=email.from_email,
+                    to=email.recipients,
+                    connection=connection,
+                )
+                if email.html_body:
+                    message.attach_alternative(email.html_body, "text/html")
+
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    failed += 1
+                    self._record_failure(email, e)
+                    self._reconnect(connection)
+                    continue
+
+                sent += 1
+                OutboundEmail.objects.filter(pk=email.pk).update(
+                    status=OutboundEmail.STATUS_SENT, sent_at=timezone.now()
+                )
+        finally:
+            connection.close()
+
+        logger.info(f"Sent {sent} queued emails, {failed} failed")
+        return sent, failed
+
+    def _claim(self, batch_size: int) -> List[OutboundEmail]:
+        """
+        Take a batch of due emails for this worker.
+
+        The claimed emails are not due again until EMAIL_QUEUE_CLAIM_TIMEOUT
+        seconds have passed, so concurrent workers skip them, and emails
+        claimed by a worker that dies are picked up again later. Each
+        email's next_attempt_at is set to the lease expiry, which
+        _renew_lease uses to tell whether the lease is still ours.
+        """
+        now = timezone.now()
+        lease_until = now + timedelta(seconds=self._claim_timeout())
+        with transaction.atomic():
+            emails = list(
+                OutboundEmail.objects.due(now)
+                .select_for_update(skip_locked=True)
+                .order_by("next_attempt_at", "pk")[:batch_size]
+            )
+            OutboundEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+                next_attempt_at=lease_until
+            )
+        for email in emails:
+            email.next_attempt_at = lease_until
+        return emails
+
+    def _renew_lease(self, email: OutboundEmail) -> bool:
+        """
+        Extend the lease on a claimed email just before sending it.
+
+        A slow relay can make a batch outlast the claim timeout, after which
+        another worker may claim the rest of it. The lease is only extended
+        if nobody has claimed the email since, so it is never sent twice.
+
+        Returns:
+            bool: True if this worker still holds the email
+        """
+        lease_until = timezone.now() + timedelta(seconds=self._claim_timeout())
+        renewed = OutboundEmail.objects.filter(
+            pk=email.pk,
+            status=OutboundEmail.STATUS_PENDING,
+            next_attempt_at=email.next_attempt_at,
+        ).update(next_attempt_at=lease_until)
+        if renewed:
+            email.next_attempt_at = lease_until
+        return bool(renewed)
+
+    def _claim_timeout(self) -> int:
+        """Seconds a worker holds the emails it has claimed."""
+        return getattr(settings, "EMAIL_QUEUE_CLAIM_TIMEOUT", 300)
+
+    def _record_failure(self, email: OutboundEmail, error: Exception) -> None:
+        """Schedule a retry with exponential backoff, or give up."""
+        attempts = email.attempts + 1
+        max_attempts = getattr(settings, "EMAIL_QUEUE_MAX_ATTEMPTS", 5)
+        retry_delay = getattr(settings, "EMAIL_QUEUE_RETRY_DELAY", 60)
+
+        updates = {"attempts": attempts, "last_error": str(error)}
+        if attempts >= max_attempts:
+            updates["status"] = OutboundEmail.STATUS_FAILED
+            logger.error(
+                f"Giving up on email {email.pk} after {attempts} attempts: {error}"
+            )
+        else:
+            updates["next_attempt_at"] = timezone.now() + timedelta(
+                seconds=retry_delay * 2 ** (attempts - 1)
+            )
+            logger.warning(f"Error sending email {email.pk}, will retry: {error}")
+
+        OutboundEmail.objects.filter(pk=email.pk).update(**updates)
+
+    def _reconnect(self, connection) -> None:
+        """Replace a connection that may have been dropped by the relay."""
+        try:
+            connection.close()
+            connection.open()
+        except Exception as e:
+            logger.warning(f"Error reopening email connection: {e}")
+
+
+# Global instance
+email_queue = EmailQueue()
@@ -13,6 +13,8 @@ from django.contrib.auth import get_user_model
 
 from users.models import EmailVerification
 
+from .email_queue import email_queue
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
@@ -182,6 +184,8 @@ class EmailVerificationService:
         """
         Internal method to send verification email. Separated for easier testing.
 
+        With EMAIL_QUEUE_ENABLED the email is queued for background delivery.
+
         Args:
             user (User): The user to send email to
             verification (EmailVerification): The verification instance
@@ -211,13 +215,24 @@ class EmailVerificationService:
         )
         body = render_to_string("emails/verification_email.txt", context)
 
+        from_email = getattr(
+            settings, "EMAIL_VERIFICATION_FROM_EMAIL", None
+        ) or getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@example.com")
+
+        # Leave delivery to the queue worker when the queue is enabled
+        if email_queue.enabled:
+            email_queue.enqueue(
+                subject=subject,
+                message=body,
+                from_email=from_email,
+                recipient_list=[user.email],
+            )
+            return
+
         send_mail(
             subject=subject,
             message=body,
-            from_email=(
-                getattr(settings, "EMAIL_VERIFICATION_FROM_EMAIL", None)
-                or getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@example.com")
-            ),
+            from_email=from_email,
             recipient_list=[user.email],
             fail_silently=False,
         )
@@ -0,0 +1,147 @@
+"""
+Local GeoIP lookups for session security.
+
+Locations come from a MaxMind-format (MMDB) database file on disk, opened
+memory-mapped, so lookups make no network calls. Results are kept in a
+per-process LRU. Without GEOIP_DATABASE_PATH, or without the maxminddb
+package, lookups return None and callers fall back to coarser rules.
+"""
+
+import logging
+import math
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def distance_km(first: Dict[str, Any], second: Dict[str, Any]) -> float:
+    """
+    Return the great-circle distance between two locations.
+
+    Args:
+        first: Location with latitude and longitude
+        second: Location with latitude and longitude
+
+    Returns:
+        Distance in kilometres
+    """
+    lat1, lon1 = math.radians(first["latitude"]), math.radians(first["longitude"])
+    lat2, lon2 = math.radians(second["latitude"]), math.radians(second["longitude"])
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def has_coordinates(location: Optional[Dict[str, Any]]) -> bool:
+    """Whether a location has latitude and longitude."""
+    return bool(
+        location
+        and location.get("latitude") is not None
+        and location.get("longitude") is not None
+    )
+
+
+class GeoIPLookup:
+    """Looks up IP addresses in a local MMDB database through an LRU."""
+
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        reader: Any = None,
+        cache_size: Optional[int] = None,
+    ):
+        """
+        Initialize the lookup; the database is opened on first use.
+
+        Args:
+            database_path: MMDB file (defaults to GEOIP_DATABASE_PATH)
+            reader: Already opened reader with a get(ip) method
+            cache_size: Maximum cached lookups (defaults to GEOIP_CACHE_SIZE)
+        """
+        self.database_path = database_path or getattr(
+            settings, "GEOIP_DATABASE_PATH", None
+        )
+        self.cache_size = cache_size or getattr(settings, "GEOIP_CACHE_SIZE", 4096)
+        self._reader = reader
+        self._opened = reader is not None
+        self._lock = threading.Lock()
+        self._cached_lookup = lru_cache(maxsize=self.cache_size)(self._lookup)
+
+    def lookup(self, ip_address: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an IP address, using the LRU.
+
+        Args:
+            ip_address: IP address to look up
+
+        Returns:
+            Dictionary with country, region, city, latitude and longitude, or
+            None if the address is not in the database
+        """
+        return self._cached_lookup(ip_address)
+
+    def _lookup(self, ip_address: str) -> Optional[Dict[str, Any]]:
+        """Read one address from the database."""
+        reader = self._get_reader()
+        if reader is None:
+            return None
+
+        try:
+            record = reader.get(ip_address)
+        except ValueError:
+            # Not a valid IP address
+            return None
+        if not record:
+            return None
+
+        country = record.get("country") or record.get("registered_country") or {}
+        subdivisions = record.get("subdivisions") or [{}]
+        city = record.get("city") or {}
+        location = record.get("location") or {}
+        return {
+            "country": country.get("iso_code", "Unknown"),
+            "region": subdivisions[0].get("names", {}).get("en", "Unknown"),
+            "city": city.get("names", {}).get("en", "Unknown"),
+            "latitude": location.get("latitude"),
+            "longitude": location.get("longitude"),
+        }
+
+    def _get_reader(self) -> Any:
+        """Return the database reader, opening it on first use."""
+        if not self._opened:
+            with self._lock:
+                if not self._opened:
+                    self._reader = self._open_reader()
+                    self._opened = True
+        return self._reader
+
+    def _open_reader(self) -> Any:
+        """Open the MMDB database memory-mapped, or return None."""
+        if not self.database_path:
+            return None
+
+        try:
+            import maxminddb
+        except ImportError:
+            logger.warning("GEOIP_DATABASE_PATH is set but maxminddb is not installed")
+            return None
+
+        try:
+            return maxminddb.open_database(
+                str(self.database_path), mode=maxminddb.MODE_MMAP
+            )
+        except (OSError, ValueError) as e:
+            logger.error(f"Error opening GeoIP database {self.database_path}: {e}")
+            return None
+
+
+# Global instance
+geoip_lookup = GeoIPLookup()
@@ -11,6 +11,8 @@ import logging
 from django.conf import settings
 from django.contrib.auth import get_user_model
 
+from .email_queue import email_queue
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
@@ -107,6 +109,8 @@ Your Application Team
         """
         Internal method to send email. Separated for easier testing.
 
+        With EMAIL_QUEUE_ENABLED the email is queued for background delivery.
+
         Args:
             subject (str): Email subject
             message (str): Email message body
@@ -116,6 +120,17 @@ Your Application Team
         """
         from django.core.mail import send_mail
 
+        # Leave delivery to the queue worker when the queue is enabled
+        if email_queue.enabled:
+            email_queue.enqueue(
+                subject=subject,
+                message=message,
+                from_email=from_email,
+                recipient_list=recipient_list,
+                html_message=html_message,
+            )
+            return
+
         send_mail(
             subject=subject,
             message=message,
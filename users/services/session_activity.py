@@ -0,0 +1,120 @@
+"""
+Coalesced last-activity tracking for user sessions.
+
+Recording activity on every request would cost an UPDATE per hit. Instead,
+the latest activity time of each session is kept in process memory and
+written to the database in one batched update once per flush interval by a
+background thread, so no request pays for the write. Whatever is still
+buffered when the process exits is flushed then. ``UserSession.last_activity``
+may lag by up to the interval.
+"""
+
+import atexit
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from ..models.session_models import UserSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionActivityTracker:
+    """Buffers session activity timestamps and flushes them in batches."""
+
+    def __init__(self):
+        """Initialize the tracker with an empty buffer."""
+        # Seconds between database flushes; 0 writes on every request
+        self.flush_interval = getattr(settings, "SESSION_ACTIVITY_FLUSH_INTERVAL", 60)
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def record(self, session_id: int, when: Optional[datetime] = None) -> None:
+        """
+        Record activity for a session.
+
+        The first call starts the background flusher; with an interval of
+        zero the activity is written straight away instead.
+
+        Args:
+            session_id: Primary key of the UserSession
+            when: Activity time (defaults to now)
+        """
+        with self._lock:
+            self._pending[session_id] = when or timezone.now()
+            if self.flush_interval > 0 and self._flusher is None:
+                self._start_flusher()
+
+        if self.flush_interval <= 0:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered activity times to the database.
+
+        Returns:
+            Number of sessions written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        try:
+            # bulk_update skips save(), so neither full_clean() nor auto_now run
+            UserSession.objects.bulk_update(
+                [
+                    UserSession(pk=session_id, last_activity=when)
+                    for session_id, when in pending.items()
+                ],
+                ["last_activity"],
+            )
+        except Exception as e:
+            logger.error(f"Error flushing session activity: {e}")
+            return 0
+
+        return len(pending)
+
+    def stop(self) -> None:
+        """Stop the background flusher and write whatever is still buffered."""
+        self._stopping.set()
+        self.flush()
+
+    def _start_flusher(self) -> None:
+        """Start the flush thread and stop it on exit (call with the lock held)."""
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="session-activity-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+        atexit.register(self.stop)
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer once per interval until stopped."""
+        while not self._stopping.wait(self.flush_interval):
+            self.flush()
+            # This thread's connection would otherwise stay open between flushes
+            connection.close()
+
+    def pending_count(self) -> int:
+        """Return the number of sessions waiting to be flushed."""
+        with self._lock:
+            return len(self._pending)
+
+    def clear(self) -> None:
+        """Drop buffered activity without writing it."""
+        with self._lock:
+            self._pending.clear()
+
+
+# Global instance
+session_activity_tracker = SessionActivityTracker()
@@ -13,12 +13,20 @@ import hashlib
 import ipaddress
 import logging
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from datetime import timezone as dt_timezone
+from functools import lru_cache, reduce
+from itertools import combinations
+from operator import or_
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
+from django.core.cache import cache
 from django.core.mail import send_mail
+from django.db.models import Case, Count, IntegerField, Min, Q, Value, When
+from django.db.models.functions import ExtractMinute, TruncHour
+from django.db.models.lookups import GreaterThanOrEqual
 from django.template.loader import render_to_string
 from django.utils import timezone
 
@@ -27,10 +35,69 @@ from ..models.session_models import (
     SessionSecurityLog,
     UserSession,
 )
+from .geoip import distance_km, geoip_lookup, has_coordinates
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+SECURITY_DASHBOARD_KEY_PREFIX = "users:security_dashboard"
+
+
+def _security_dashboard_key(user_id: Any) -> str:
+    return f"{SECURITY_DASHBOARD_KEY_PREFIX}:{user_id}"
+
+
+# Distinct user agents remembered by the parse cache; browsers send the same
+# string on every request, so a small cache covers the active sessions
+USER_AGENT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=USER_AGENT_CACHE_SIZE)
+def _parsed_user_agent(user_agent: str) -> Tuple[str, str, str]:
+    """Parse a user agent into (device type, browser, OS)."""
+    # Simplified user agent parsing
+    # In production, use a library like user-agents or ua-parser
+
+    device_type, browser, os_name = "desktop", "Unknown", "Unknown"
+
+    user_agent_lower = user_agent.lower()
+
+    # Detect device type - check specific devices first
+    if any(tablet in user_agent_lower for tablet in ["tablet", "ipad"]):
+        device_type = "tablet"
+    elif any(mobile in user_agent_lower for mobile in ["mobile", "android", "iphone"]):
+        device_type = "mobile"
+
+    # Detect browser
+    if "chrome" in user_agent_lower:
+        browser = "Chrome"
+    elif "firefox" in user_agent_lower:
+        browser = "Firefox"
+    elif "safari" in user_agent_lower:
+        browser = "Safari"
+    elif "edge" in user_agent_lower:
+        browser = "Edge"
+
+    # Detect OS - order matters for iOS detection
+    if "windows" in user_agent_lower:
+        os_name = "Windows"
+    elif (
+        "iphone" in user_agent_lower
+        or "ipad" in user_agent_lower
+        or "ipod" in user_agent_lower
+    ):
+        os_name = "iOS"
+    elif "mac os" in user_agent_lower:
+        os_name = "macOS"
+    elif "linux" in user_agent_lower:
+        os_name = "Linux"
+    elif "android" in user_agent_lower:
+        os_name = "Android"
+    elif "ios" in user_agent_lower:
+        os_name = "iOS"
+
+    return device_type, browser, os_name
+
 
 class SessionSecurityService:
     """Service for managing session security monitoring and alerts."""
@@ -45,6 +112,18 @@ class SessionSecurityService:
         self.auto_terminate_threshold = getattr(
             settings, "AUTO_TERMINATE_THRESHOLD", 9.0
         )
+        # Dashboards are not invalidated on new events, so keep this short
+        self.dashboard_cache_timeout = getattr(
+            settings, "SECURITY_DASHBOARD_CACHE_TIMEOUT", 60
+        )
+        # Distances used when GeoIP coordinates are available
+        self.geographic_anomaly_km = getattr(
+            settings, "GEOGRAPHIC_ANOMALY_DISTANCE_KM", 500
+        )
+        self.impossible_travel_km = getattr(
+            settings, "IMPOSSIBLE_TRAVEL_DISTANCE_KM", 1000
+        )
+        self.geoip = geoip_lookup
 
     def _are_ips_same_subnet(self, ip1: str, ip2: str, subnet_mask: int = 24) -> bool:
         """
@@ -131,14 +210,20 @@ class SessionSecurityService:
             return False
 
     def create_user_session(
-        self, user: User, session: Session, ip_address: str, user_agent: str, **kwargs
+        self,
+        user: User,
+        session: Session | str,
+        ip_address: str,
+        user_agent: str,
+        **kwargs,
     ) -> UserSession:
         """
         Create a new UserSession with device information.
 
         Args:
             user: User instance
-            session: Django Session instance
+            session: Django Session instance, or the session key when the
+                session engine keeps no django_session rows
             ip_address: Client IP address
             user_agent: Browser user agent string
             **kwargs: Additional session data
@@ -152,9 +237,13 @@ class SessionSecurityService:
         # Get geolocation information
         location = self._get_location_from_ip(ip_address)
 
+        if isinstance(session, Session):
+            kwargs["session"] = session
+        else:
+            kwargs["session_id"] = session
+
         user_session = UserSession.objects.create(
             user=user,
-            session=session,
             ip_address=ip_address,
             user_agent=user_agent,
             device_type=device_info.get("device_type", ""),
@@ -292,6 +381,10 @@ class SessionSecurityService:
         if not old_location or not new_location:
             return True
 
+        # With coordinates, judge by distance
+        if has_coordinates(old_location) and has_coordinates(new_location):
+            return distance_km(old_location, new_location) > self.geographic_anomaly_km
+
         # Check for different countries
         if old_location.get("country") != new_location.get("country"):
             return True
@@ -608,31 +701,52 @@ class SessionSecurityService:
         """
         Get security dashboard data for user.
 
+        Results are cached per user for SECURITY_DASHBOARD_CACHE_TIMEOUT
+        seconds.
+
         Args:
             user: User to get data for
 
         Returns:
             Dictionary with security dashboard data
         """
+        key = _security_dashboard_key(user.pk)
+        data = cache.get(key)
+        if data is None:
+            data = self._build_security_dashboard_data(user)
+            cache.set(key, data, timeout=self.dashboard_cache_timeout)
+        return data
+
+    def _build_security_dashboard_data(self, user: User) -> Dict[str, Any]:
+        """Compute security dashboard data for user from the database."""
         now = timezone.now()
+        is_security_event = Q(event_type__in=SessionSecurityEvent.get_security_events())
 
         # Get recent security events
         recent_events = SessionSecurityLog.objects.filter(
             user=user, timestamp__gte=now - timedelta(days=30)
         )
 
-        security_events = recent_events.filter(
-            event_type__in=SessionSecurityEvent.get_security_events()
+        # All event counts in one conditional aggregate
+        counts = recent_events.aggregate(
+            total_events=Count("pk"),
+            security_events=Count("pk", filter=is_security_event),
+            recent_logins=Count(
+                "pk", filter=Q(event_type=SessionSecurityEvent.LOGIN_SUCCESS)
+            ),
         )
 
-        # Get active sessions
-        active_sessions = UserSession.objects.active().for_user(user)
+        latest_security_events = list(
+            recent_events.filter(is_security_event).values(
+                "event_type", "timestamp", "ip_address", "details"
+            )[:10]
+        )
 
         # Calculate risk level
         recent_risk_scores = [
-            log.details.get("risk_score", 0)
-            for log in security_events[:10]
-            if "risk_score" in log.details
+            event["details"].get("risk_score", 0)
+            for event in latest_security_events
+            if "risk_score" in event["details"]
         ]
 
         avg_risk_score = (
@@ -648,23 +762,11 @@ class SessionSecurityService:
             risk_level = "medium"
 
         return {
-            "total_events": recent_events.count(),
-            "security_events": security_events.count(),
-            "recent_logins": recent_events.filter(
-                event_type=SessionSecurityEvent.LOGIN_SUCCESS
-            ).count(),
-            "active_sessions": active_sessions.count(),
+            **counts,
+            "active_sessions": UserSession.objects.active().for_user(user).count(),
             "risk_level": risk_level,
             "average_risk_score": avg_risk_score,
-            "recent_security_events": [
-                {
-                    "event_type": log.event_type,
-                    "timestamp": log.timestamp,
-                    "ip_address": log.ip_address,
-                    "details": log.details,
-                }
-                for log in security_events[:5]
-            ],
+            "recent_security_events": latest_security_events[:5],
         }
 
     def correlate_security_events(
@@ -673,6 +775,9 @@ class SessionSecurityService:
         """
         Correlate related security events.
 
+        Events are grouped by IP address and 30-minute window in the database;
+        only events in groups of two or more are loaded.
+
         Args:
             user: User to analyze
             hours: Time window for correlation
@@ -684,58 +789,103 @@ class SessionSecurityService:
         since = timezone.now() - timedelta(hours=hours)
         events = SessionSecurityLog.objects.filter(
             user=user, timestamp__gte=since
+        ).annotate(
+            # 30-minute windows: the UTC hour plus which half of it
+            window_hour=TruncHour("timestamp", tzinfo=dt_timezone.utc),
+            window_half=Case(
+                When(
+                    GreaterThanOrEqual(
+                        ExtractMinute("timestamp", tzinfo=dt_timezone.utc), 30
+                    ),
+                    then=Value(1),
+                ),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+        )
+
+        # Group events by IP address and time proximity
+        groups = list(
+            events.order_by()
+            .values("ip_address", "window_hour", "window_half")
+            .annotate(
+                event_count=Count("pk"),
+                security_event_count=Count(
+                    "pk",
+                    filter=Q(event_type__in=SessionSecurityEvent.get_security_events()),
+                ),
+                first_timestamp=Min("timestamp"),
+            )
+            .filter(event_count__gt=1)
+            .order_by("first_timestamp")
+        )
+        if not groups:
+            return []
+
+        group_events = {}
+        grouped_events = events.filter(
+            reduce(
+                or_,
+                (
+                    Q(
+                        ip_address=group["ip_address"],
+                        window_hour=group["window_hour"],
+                        window_half=group["window_half"],
+                    )
+                    for group in groups
+                ),
+            )
         ).order_by("timestamp")
+        for event in grouped_events.values(
+            "event_type",
+            "timestamp",
+            "ip_address",
+            "details",
+            "window_hour",
+            "window_half",
+        ):
+            group_key = (
+                event["ip_address"],
+                event["window_hour"],
+                event["window_half"],
+            )
+            group_events.setdefault(group_key, []).append(
+                {
+                    "event_type": event["event_type"],
+                    "timestamp": event["timestamp"],
+                    "ip_address": event["ip_address"],
+                    "details": event["details"],
+                }
+            )
 
         correlated_events = []
 
-        # Group events by IP address and time proximity
-        event_groups = {}
-
-        for event in events:
-            # Create group key based on IP and time window (30-minute windows)
-            time_window = event.timestamp.replace(
-                minute=(event.timestamp.minute // 30) * 30, second=0, microsecond=0
+        # Calculate correlation scores
+        for group in groups:
+            ip_address = group["ip_address"]
+            time_window = group["window_hour"] + timedelta(
+                minutes=30 * group["window_half"]
             )
-            group_key = f"{event.ip_address}_{time_window}"
 
-            if group_key not in event_groups:
-                event_groups[group_key] = []
+            # Higher correlation score for more events in same time/location
+            correlation_score = min(group["event_count"] / 5.0, 1.0)
+
+            # Boost score for security events
+            if group["security_event_count"] > 0:
+                correlation_score += 0.3
 
-            event_groups[group_key].append(
+            correlated_events.append(
                 {
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp,
-                    "ip_address": event.ip_address,
-                    "details": event.details,
+                    "group_key": f"{ip_address}_{time_window}",
+                    "events": group_events.get(
+                        (ip_address, group["window_hour"], group["window_half"]), []
+                    ),
+                    "correlation_score": min(correlation_score, 1.0),
+                    "event_count": group["event_count"],
+                    "security_event_count": group["security_event_count"],
                 }
             )
 
-        # Calculate correlation scores
-        for group_key, group_events in event_groups.items():
-            if len(group_events) > 1:
-                # Higher correlation score for more events in same time/location
-                correlation_score = min(len(group_events) / 5.0, 1.0)
-
-                # Boost score for security events
-                security_event_count = sum(
-                    1
-                    for event in group_events
-                    if event["event_type"] in SessionSecurityEvent.get_security_events()
-                )
-
-                if security_event_count > 0:
-                    correlation_score += 0.3
-
-                correlated_events.append(
-                    {
-                        "group_key": group_key,
-                        "events": group_events,
-                        "correlation_score": min(correlation_score, 1.0),
-                        "event_count": len(group_events),
-                        "security_event_count": security_event_count,
-                    }
-                )
-
         # Sort by correlation score descending
         correlated_events.sort(key=lambda x: x["correlation_score"], reverse=True)
 
@@ -770,10 +920,12 @@ class SessionSecurityService:
         Returns:
             Dictionary with location info or None
         """
-        # In a real implementation, this would use a geolocation service
-        # like MaxMind GeoIP, IP-API, or similar
+        # Local GeoIP database lookup (memory-mapped, cached)
+        location = self.geoip.lookup(ip_address)
+        if location:
+            return dict(location)
 
-        # For testing, return mock data
+        # Without a database entry, fall back to coarse placeholder data
         if ip_address.startswith("192.168.") or ip_address.startswith("10."):
             return {"country": "US", "region": "CA", "city": "Local"}
         elif ip_address.startswith("203.0.113."):
@@ -791,50 +943,8 @@ class SessionSecurityService:
         Returns:
             Dictionary with parsed device info
         """
-        # Simplified user agent parsing
-        # In production, use a library like user-agents or ua-parser
-
-        device_info = {"device_type": "desktop", "browser": "Unknown", "os": "Unknown"}
-
-        user_agent_lower = user_agent.lower()
-
-        # Detect device type - check specific devices first
-        if any(tablet in user_agent_lower for tablet in ["tablet", "ipad"]):
-            device_info["device_type"] = "tablet"
-        elif any(
-            mobile in user_agent_lower for mobile in ["mobile", "android", "iphone"]
-        ):
-            device_info["device_type"] = "mobile"
-
-        # Detect browser
-        if "chrome" in user_agent_lower:
-            device_info["browser"] = "Chrome"
-        elif "firefox" in user_agent_lower:
-            device_info["browser"] = "Firefox"
-        elif "safari" in user_agent_lower:
-            device_info["browser"] = "Safari"
-        elif "edge" in user_agent_lower:
-            device_info["browser"] = "Edge"
-
-        # Detect OS - order matters for iOS detection
-        if "windows" in user_agent_lower:
-            device_info["os"] = "Windows"
-        elif (
-            "iphone" in user_agent_lower
-            or "ipad" in user_agent_lower
-            or "ipod" in user_agent_lower
-        ):
-            device_info["os"] = "iOS"
-        elif "mac os" in user_agent_lower:
-            device_info["os"] = "macOS"
-        elif "linux" in user_agent_lower:
-            device_info["os"] = "Linux"
-        elif "android" in user_agent_lower:
-            device_info["os"] = "Android"
-        elif "ios" in user_agent_lower:
-            device_info["os"] = "iOS"
-
-        return device_info
+        device_type, browser, os_name = _parsed_user_agent(user_agent)
+        return {"device_type": device_type, "browser": browser, "os": os_name}
 
     def _get_location_from_ip(self, ip_address: str) -> str:
         """
@@ -910,10 +1020,15 @@ class SessionSecurityService:
         Returns:
             True if impossible travel detected
         """
-        # Simplified version - in production would calculate
-        # geographic distances and time between accesses
+        locations = [self.get_geolocation(ip) for ip in set(ip_addresses)]
+
+        # With coordinates for every address, judge by distance
+        if len(locations) >= 2 and all(has_coordinates(loc) for loc in locations):
+            return any(
+                distance_km(first, second) > self.impossible_travel_km
+                for first, second in combinations(locations, 2)
+            )
 
-        locations = [self.get_geolocation(ip) for ip in ip_addresses]
         countries = set(
             loc["country"] for loc in locations if loc and loc["country"] != "Unknown"
         )
@@ -0,0 +1,143 @@
+"""
+Session key resolution for request-time session tracking.
+
+UserSession rows reference Django sessions by session key only, so tracking
+works the same whether the session engine stores rows in django_session
+(db, cached_db) or keeps sessions purely in the cache. Resolved sessions are
+remembered in a per-process LRU, so requests on a known session cost no
+database reads. Entries expire after SESSION_TRACKING_CACHE_TTL seconds, so
+sessions terminated by another process stop being tracked here too.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+
+from django.conf import settings
+
+from ..models.session_models import UserSession
+
+
+@dataclass(frozen=True)
+class TrackedSession:
+    """
+    The UserSession fields needed to track a request.
+
+    ip_address and user_agent are those of the client last checked by the
+    session security checks, which may differ from the stored session's.
+    """
+
+    id: int
+    user_id: int
+    ip_address: str
+    user_agent: str
+    is_active: bool
+
+    @classmethod
+    def from_user_session(cls, user_session: UserSession) -> "TrackedSession":
+        """Build a snapshot of a UserSession."""
+        return cls(
+            id=user_session.pk,
+            user_id=user_session.user_id,
+            ip_address=user_session.ip_address,
+            user_agent=user_session.user_agent,
+            is_active=user_session.is_active,
+        )
+
+
+class UserSessionResolver:
+    """Resolves session keys to tracked UserSessions through a per-process LRU."""
+
+    def __init__(self):
+        """Initialize the resolver with an empty LRU."""
+        self.max_entries = getattr(settings, "SESSION_TRACKING_CACHE_SIZE", 10000)
+        self.ttl = getattr(settings, "SESSION_TRACKING_CACHE_TTL", 60)
+        self._entries: "OrderedDict[str, Tuple[TrackedSession, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, session_key: str, user_id: int) -> Optional[TrackedSession]:
+        """
+        Find the tracked session for a session key.
+
+        Args:
+            session_key: Django session key
+            user_id: ID of the authenticated user
+
+        Returns:
+            TrackedSession, or None if the key is not tracked for this user
+        """
+        tracked = None
+        with self._lock:
+            entry = self._entries.get(session_key)
+            if entry is not None and entry[1] > time.monotonic():
+                tracked = entry[0]
+                self._entries.move_to_end(session_key)
+
+        if tracked is None:
+            row = (
+                UserSession.objects.filter(session_id=session_key)
+                .values("id", "user_id", "ip_address", "user_agent", "is_active")
+                .first()
+            )
+            if row is None:
+                return None
+            tracked = TrackedSession(**row)
+            self._store(session_key, tracked)
+
+        if tracked.user_id != user_id:
+            return None
+        return tracked
+
+    def remember(
+        self,
+        session_key: str,
+        user_session: UserSession,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> TrackedSession:
+        """
+        Add a UserSession to the LRU, replacing any previous entry.
+
+        Args:
+            session_key: Django session key
+            user_session: The session as it is now
+            ip_address: IP address of the client last checked, if not the
+                session's own
+            user_agent: User agent of the client last checked, if not the
+                session's own
+
+        Returns:
+            The stored TrackedSession
+        """
+        tracked = TrackedSession.from_user_session(user_session)
+        tracked = replace(
+            tracked,
+            ip_address=ip_address or tracked.ip_address,
+            user_agent=user_agent or tracked.user_agent,
+        )
+        self._store(session_key, tracked)
+        return tracked
+
+    def forget(self, session_key: str) -> None:
+        """Drop a session key from the LRU."""
+        with self._lock:
+            self._entries.pop(session_key, None)
+
+    def clear(self) -> None:
+        """Drop all remembered session keys."""
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, session_key: str, tracked: TrackedSession) -> None:
+        """Insert an entry, evicting the least recently used past the limit."""
+        with self._lock:
+            self._entries[session_key] = (tracked, time.monotonic() + self.ttl)
+            self._entries.move_to_end(session_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Global instance
+user_session_resolver = UserSessionResolver()
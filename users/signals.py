@@ -0,0 +1,40 @@
+"""
+Signal handlers keeping cached theme data fresh.
+
+The theme registry and the themes resolved for sessions are cached (see
+users.theme_registry); changes to themes or theme preferences bump the
+versions those caches are checked against.
+"""
+
+from typing import Any
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .theme_registry import invalidate_theme_preferences, invalidate_theme_registry
+
+
+def theme_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the theme registry when a theme is saved or deleted."""
+    invalidate_theme_registry()
+
+
+def theme_preference_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the resolved theme of a user whose preference changed."""
+    invalidate_theme_preferences(instance.user_id)
+
+
+def connect_theme_cache_invalidation() -> None:
+    """Connect handlers for themes and theme preferences."""
+    handlers = [
+        (apps.get_model("users", "Theme"), theme_changed),
+        (apps.get_model("users", "UserThemePreference"), theme_preference_changed),
+    ]
+    for model, handler in handlers:
+        label = model._meta.label
+        post_save.connect(
+            handler, sender=model, dispatch_uid=f"theme_cache_saved_{label}"
+        )
+        post_delete.connect(
+            handler, sender=model, dispatch_uid=f"theme_cache_deleted_{label}"
+        )
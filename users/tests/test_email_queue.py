@@ -0,0 +1,251 @@
+"""Tests for the outbound email queue and the send_queued_email command."""
+
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPRecipientsRefused
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import OutboundEmail
+from users.services import EmailVerificationService
+from users.services.email_queue import email_queue
+
+User = get_user_model()
+
+
+class StandInSMTPBackend(EmailBackend):
+    """Locmem backend that tracks connections and rejects some recipients."""
+
+    opened = 0
+    closed = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connected = False
+
+    def open(self):
+        if self.connected:
+            return False
+        StandInSMTPBackend.opened += 1
+        self.connected = True
+        return True
+
+    def close(self):
+        if self.connected:
+            StandInSMTPBackend.closed += 1
+        self.connected = False
+
+    def send_messages(self, messages):
+        for message in messages:
+            rejected = [address for address in message.to if "bounce" in address]
+            if rejected:
+                raise SMTPRecipientsRefused(
+                    {address: (550, b"") for address in rejected}
+                )
+        return super().send_messages(messages)
+
+
+class SlowRelayBackend(StandInSMTPBackend):
+    """Stand-in whose first send outlasts the lease on the rest of the batch."""
+
+    def send_messages(self, messages):
+        if not mail.outbox:
+            # Meanwhile the leases expire and another worker claims the emails
+            OutboundEmail.objects.pending().update(
+                next_attempt_at=timezone.now() - timedelta(seconds=1)
+            )
+            email_queue._claim(batch_size=10)
+        return super().send_messages(messages)
+
+
+STAND_IN_BACKEND = "users.tests.test_email_queue.StandInSMTPBackend"
+
+
+@override_settings(
+    EMAIL_QUEUE_ENABLED=True,
+    EMAIL_BACKEND=STAND_IN_BACKEND,
+    EMAIL_QUEUE_MAX_ATTEMPTS=3,
+    EMAIL_QUEUE_RETRY_DELAY=60,
+)
+class EmailQueueTest(TestCase):
+    """Test queueing on the request path and batched delivery."""
+
+    def setUp(self):
+        """Reset the stand-in backend's connection counters."""
+        StandInSMTPBackend.opened = StandInSMTPBackend.closed = 0
+        self.user = User.objects.create_user(
+            username="queueuser", email="queue@example.com", password="TestPass123!"
+        )
+
+    def _enqueue(self, recipient, subject="Hello"):
+        return email_queue.enqueue(
+            subject=subject,
+            message="Body",
+            from_email="test@example.com",
+            recipient_list=[recipient],
+        )
+
+    def test_password_reset_request_only_enqueues(self):
+        """Test the password reset API queues the email without sending it."""
+        response = APIClient().post(
+            reverse("api:auth:password_reset_request"),
+            {"email": "queue@example.com"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(StandInSMTPBackend.opened, 0)
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.recipients, ["queue@example.com"])
+        self.assertEqual(queued.status, OutboundEmail.STATUS_PENDING)
+
+        call_command("send_queued_email", stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "Password Reset Request")
+
+    def test_verification_email_is_queued(self):
+        """Test verification emails are queued and sent_at is recorded."""
+        self.assertTrue(EmailVerificationService().send_verification_email(self.user))
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.pending().count(), 1)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.email_verification_sent_at)
+
+    def test_batch_reuses_one_connection(self):
+        """Test a batch is sent over a single connection."""
+        for i in range(5):
+            self._enqueue(f"user{i}@example.com")
+
+        self.assertEqual(email_queue.send_due(), (5, 0))
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(StandInSMTPBackend.opened, 1)
+        self.assertEqual(StandInSMTPBackend.closed, 1)
+        self.assertFalse(OutboundEmail.objects.pending().exists())
+        self.assertTrue(
+            all(email.sent_at for email in OutboundEmail.objects.all()),
+        )
+
+    def test_batch_size_limits_delivery(self):
+        """Test only one batch is sent per call, oldest first."""
+        for i in range(3):
+            self._enqueue(f"user{i}@example.com", subject=f"Email {i}")
+
+        self.assertEqual(email_queue.send_due(batch_size=2), (2, 0))
+
+        self.assertEqual(
+            [message.subject for message in mail.outbox], ["Email 0", "Email 1"]
+        )
+        self.assertEqual(OutboundEmail.objects.pending().count(), 1)
+
+    def test_batch_is_leased_per_email(self):
+        """Test emails claimed by another worker mid-batch are not resent."""
+        for i in range(3):
+            self._enqueue(f"user{i}@example.com", subject=f"Email {i}")
+
+        self.assertEqual(email_queue.send_due(connection=SlowRelayBackend()), (1, 0))
+
+        self.assertEqual([message.subject for message in mail.outbox], ["Email 0"])
+        self.assertEqual(OutboundEmail.objects.pending().count(), 2)
+        self.assertFalse(OutboundEmail.objects.due().exists())
+
+    def test_sending_extends_the_lease(self):
+        """Test each email's lease is renewed right before it is sent."""
+        email = self._enqueue("ok@example.com")
+        [claimed] = email_queue._claim(batch_size=1)
+
+        self.assertTrue(email_queue._renew_lease(claimed))
+        self.assertGreaterEqual(
+            claimed.next_attempt_at,
+            timezone.now() + timedelta(seconds=290),
+        )
+
+        # A stale lease held by another worker is not renewed
+        email.refresh_from_db()
+        email.next_attempt_at -= timedelta(seconds=1)
+        self.assertFalse(email_queue._renew_lease(email))
+
+    def test_html_body_is_attached(self):
+        """Test HTML bodies are sent as an alternative part."""
+        email_queue.enqueue(
+            subject="Hello",
+            message="Body",
+            from_email="test@example.com",
+            recipient_list=["html@example.com"],
+            html_message="<p>Body</p>",
+        )
+
+        email_queue.send_due()
+
+        self.assertEqual(mail.outbox[0].alternatives[0][0], "<p>Body</p>")
+
+    def test_failures_retry_with_backoff(self):
+        """Test failed emails are retried later with growing delays."""
+        bounced = self._enqueue("bounce@example.com")
+        self._enqueue("ok@example.com")
+
+        self.assertEqual(email_queue.send_due(), (1, 1))
+
+        # The connection is reopened after the failure for the next email
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(StandInSMTPBackend.opened, 2)
+        bounced.refresh_from_db()
+        self.assertEqual(bounced.status, OutboundEmail.STATUS_PENDING)
+        self.assertEqual(bounced.attempts, 1)
+        self.assertIn("bounce@example.com", bounced.last_error)
+        first_delay = bounced.next_attempt_at - timezone.now()
+        self.assertAlmostEqual(first_delay.total_seconds(), 60, delta=5)
+
+        # Not due again until the backoff has passed
+        self.assertEqual(email_queue.send_due(), (0, 0))
+
+        OutboundEmail.objects.filter(pk=bounced.pk).update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        email_queue.send_due()
+        bounced.refresh_from_db()
+        second_delay = bounced.next_attempt_at - timezone.now()
+        self.assertAlmostEqual(second_delay.total_seconds(), 120, delta=5)
+
+    def test_gives_up_after_max_attempts(self):
+        """Test emails are marked failed once attempts are exhausted."""
+        bounced = self._enqueue("bounce@example.com")
+
+        for _ in range(3):
+            OutboundEmail.objects.filter(pk=bounced.pk).update(
+                next_attempt_at=timezone.now()
+            )
+            email_queue.send_due()
+
+        bounced.refresh_from_db()
+        self.assertEqual(bounced.status, OutboundEmail.STATUS_FAILED)
+        self.assertEqual(bounced.attempts, 3)
+        self.assertFalse(OutboundEmail.objects.due().exists())
+
+    def test_command_reports_results(self):
+        """Test the command sends due emails and reports the counts."""
+        self._enqueue("ok@example.com")
+        self._enqueue("bounce@example.com")
+        out = StringIO()
+
+        call_command("send_queued_email", batch_size=10, stdout=out)
+
+        self.assertIn("Sent 1 emails, 1 failed", out.getvalue())
+
+    @override_settings(EMAIL_QUEUE_ENABLED=False)
+    def test_disabled_queue_sends_immediately(self):
+        """Test emails are sent during the request when the queue is off."""
+        EmailVerificationService().send_verification_email(self.user)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(OutboundEmail.objects.exists())
@@ -0,0 +1,142 @@
+"""Tests for local GeoIP lookups and cached user agent parsing."""
+
+from django.test import TestCase
+
+from users.services import SessionSecurityService
+from users.services.geoip import GeoIPLookup, distance_km
+from users.services.session_security import _parsed_user_agent
+
+
+def _record(country, region, city, latitude, longitude):
+    return {
+        "country": {"iso_code": country},
+        "subdivisions": [{"names": {"en": region}}],
+        "city": {"names": {"en": city}},
+        "location": {"latitude": latitude, "longitude": longitude},
+    }
+
+
+class FakeReader:
+    """Dictionary-backed stand-in for an opened MMDB reader."""
+
+    def __init__(self, records):
+        self.records = records
+        self.reads = 0
+
+    def get(self, ip_address):
+        self.reads += 1
+        if ip_address == "not-an-ip":
+            raise ValueError(ip_address)
+        return self.records.get(ip_address)
+
+
+RECORDS = {
+    "198.51.100.1": _record("US", "New York", "New York", 40.71, -74.01),
+    "198.51.100.2": _record("US", "New Jersey", "Newark", 40.74, -74.17),
+    "198.51.100.3": _record("US", "California", "San Francisco", 37.77, -122.42),
+    "198.51.100.4": _record("CA", "Ontario", "Niagara Falls", 43.09, -79.08),
+    "198.51.100.5": _record("US", "New York", "Niagara Falls", 43.09, -79.06),
+}
+
+
+class GeoIPLookupTest(TestCase):
+    """Test GeoIPLookup against an in-memory reader."""
+
+    def setUp(self):
+        """Set up a lookup over the fake reader."""
+        self.reader = FakeReader(RECORDS)
+        self.geoip = GeoIPLookup(reader=self.reader, cache_size=2)
+
+    def test_lookup_returns_location_with_coordinates(self):
+        """Test records are flattened into a location."""
+        self.assertEqual(
+            self.geoip.lookup("198.51.100.1"),
+            {
+                "country": "US",
+                "region": "New York",
+                "city": "New York",
+                "latitude": 40.71,
+                "longitude": -74.01,
+            },
+        )
+
+    def test_lookups_are_cached(self):
+        """Test repeated lookups read the database once, up to the LRU size."""
+        for _ in range(3):
+            self.geoip.lookup("198.51.100.1")
+        self.assertEqual(self.reader.reads, 1)
+
+        self.geoip.lookup("198.51.100.2")
+        self.geoip.lookup("198.51.100.3")
+        self.geoip.lookup("198.51.100.1")
+        self.assertEqual(self.reader.reads, 4)
+
+    def test_unknown_and_invalid_addresses(self):
+        """Test addresses missing from the database return None."""
+        self.assertIsNone(self.geoip.lookup("192.0.2.1"))
+        self.assertIsNone(self.geoip.lookup("not-an-ip"))
+
+    def test_without_database_lookups_return_none(self):
+        """Test no database configured disables lookups."""
+        self.assertIsNone(GeoIPLookup(database_path="").lookup("198.51.100.1"))
+
+    def test_distance(self):
+        """Test great-circle distance between two locations."""
+        new_york = self.geoip.lookup("198.51.100.1")
+        san_francisco = self.geoip.lookup("198.51.100.3")
+
+        self.assertAlmostEqual(distance_km(new_york, san_francisco), 4130, delta=20)
+
+
+class SessionSecurityGeoIPTest(TestCase):
+    """Test geographic checks use GeoIP coordinates when available."""
+
+    def setUp(self):
+        """Set up the service with a fake GeoIP database."""
+        self.service = SessionSecurityService()
+        self.service.geoip = GeoIPLookup(reader=FakeReader(RECORDS))
+
+    def test_geolocation_prefers_database(self):
+        """Test database results are used, with placeholders as fallback."""
+        self.assertEqual(self.service.get_geolocation("198.51.100.3")["country"], "US")
+        self.assertEqual(
+            self.service.get_geolocation("203.0.113.1"),
+            {"country": "GB", "region": "London", "city": "London"},
+        )
+
+    def test_geographic_anomaly_by_distance(self):
+        """Test nearby regions are fine while distant ones are flagged."""
+        session = type("Session", (), {"ip_address": "198.51.100.1"})()
+
+        self.assertFalse(
+            self.service.detect_geographic_anomaly(session, "198.51.100.2")
+        )
+        self.assertTrue(self.service.detect_geographic_anomaly(session, "198.51.100.3"))
+
+    def test_impossible_travel_by_distance(self):
+        """Test travel is judged by distance rather than country."""
+        self.assertFalse(
+            self.service._detect_impossible_travel(["198.51.100.4", "198.51.100.5"])
+        )
+        self.assertTrue(
+            self.service._detect_impossible_travel(["198.51.100.1", "198.51.100.3"])
+        )
+
+
+class UserAgentParsingCacheTest(TestCase):
+    """Test user agent parsing is cached."""
+
+    def test_repeated_user_agents_are_cached(self):
+        """Test the same user agent is parsed once."""
+        user_agent = "Mozilla/5.0 (iPhone; CPU iPhone OS 14_0) Mobile Safari/604.1"
+        service = SessionSecurityService()
+        _parsed_user_agent.cache_clear()
+
+        first = service._parse_user_agent(user_agent)
+        first["browser"] = "changed"
+        second = service._parse_user_agent(user_agent)
+
+        self.assertEqual(
+            second, {"device_type": "mobile", "browser": "Safari", "os": "iOS"}
+        )
+        self.assertEqual(_parsed_user_agent.cache_info().hits, 1)
@@ -325,3 +325,102 @@ class UserPrivacyTest(TestCase):
         self.assertNotIn("first_name", data)
         self.assertNotIn("last_name", data)
         self.assertNotIn("last_login", data)
+
+
+class ProfileVisibilityQueryTest(TestCase):
+    """Test shared-campaign checks and bulk profile visibility resolution."""
+
+    def setUp(self):
+        self.viewer = User.objects.create_user(
+            username="viewer", email="viewer@example.com", password="testpass123"
+        )
+        self.owner = User.objects.create_user(
+            username="gm", email="gm@example.com", password="testpass123"
+        )
+        self.co_player = User.objects.create_user(
+            username="coplayer", email="coplayer@example.com", password="testpass123"
+        )
+        self.stranger = User.objects.create_user(
+            username="outsider", email="outsider@example.com", password="testpass123"
+        )
+        self.public_user = User.objects.create_user(
+            username="open",
+            email="open@example.com",
+            password="testpass123",
+            profile_visibility="public",
+        )
+        self.private_user = User.objects.create_user(
+            username="closed",
+            email="closed@example.com",
+            password="testpass123",
+            profile_visibility="private",
+        )
+
+        campaign = Campaign.objects.create(
+            name="Shared Campaign", owner=self.owner, game_system="Test System"
+        )
+        for user in (self.viewer, self.co_player, self.private_user):
+            CampaignMembership.objects.create(
+                campaign=campaign, user=user, role="PLAYER"
+            )
+        Campaign.objects.create(
+            name="Other Campaign", owner=self.stranger, game_system="Test System"
+        )
+
+    def test_are_campaign_members_uses_one_query(self):
+        """Test the pairwise check is a single query."""
+        with self.assertNumQueries(1):
+            self.assertTrue(self.viewer.are_campaign_members(self.co_player))
+        with self.assertNumQueries(1):
+            self.assertTrue(self.owner.are_campaign_members(self.viewer))
+        with self.assertNumQueries(1):
+            self.assertFalse(self.viewer.are_campaign_members(self.stranger))
+
+    def test_resolve_profile_visibility_matches_can_view_profile(self):
+        """Test bulk resolution agrees with can_view_profile for every user."""
+        users = list(User.objects.order_by("pk"))
+
+        for viewer in users + [None]:
+            visibility = User.objects.resolve_profile_visibility(
+                users, viewer_user=viewer
+            )
+            for user in users:
+                self.assertEqual(
+                    visibility[user.id],
+                    user.can_view_profile(viewer),
+                    f"{user} viewed by {viewer}",
+                )
+
+    def test_resolve_profile_visibility_uses_one_query(self):
+        """Test bulk resolution is one query regardless of list size."""
+        users = list(User.objects.order_by("pk"))
+
+        with self.assertNumQueries(1):
+            visibility = User.objects.resolve_profile_visibility(
+                users, viewer_user=self.viewer
+            )
+
+        self.assertEqual(
+            visibility,
+            {
+                self.viewer.id: True,
+                self.owner.id: True,
+                self.co_player.id: True,
+                self.stranger.id: False,
+                self.public_user.id: True,
+                self.private_user.id: False,
+            },
+        )
+
+    def test_profile_data_with_resolved_visibility(self):
+        """Test precomputed visibility skips the membership query."""
+        visibility = User.objects.resolve_profile_visibility(
+            [self.co_player], viewer_user=self.viewer
+        )
+
+        with self.assertNumQueries(0):
+            data = self.co_player.get_public_profile_data(
+                viewer_user=self.viewer, can_view=visibility[self.co_player.id]
+            )
+
+        self.assertTrue(data["profile_visible"])
@@ -0,0 +1,266 @@
+"""Tests for session resolution and coalesced activity tracking."""
+
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.models import Session
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from users.middleware import SessionTrackingMiddleware
+from users.models.session_models import (
+    SessionSecurityEvent,
+    SessionSecurityLog,
+    UserSession,
+)
+from users.services.session_activity import (
+    SessionActivityTracker,
+    session_activity_tracker,
+)
+from users.services.session_tracking import UserSessionResolver, user_session_resolver
+
+User = get_user_model()
+
+
+class SessionActivityTestMixin:
+    """Create a user with two tracked sessions."""
+
+    def setUp(self):
+        """Set up a user and sessions."""
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.sessions = [self._create_session(f"activity_{i}") for i in range(2)]
+
+    def _create_session(self, session_key):
+        django_session = Session.objects.create(
+            session_key=session_key,
+            session_data="data",
+            expire_date=timezone.now() + timedelta(days=1),
+        )
+        return UserSession.objects.create(
+            user=self.user,
+            session=django_session,
+            ip_address="192.168.1.100",
+            user_agent="Chrome/91.0 Desktop",
+        )
+
+
+class SessionActivityTrackerTest(SessionActivityTestMixin, TestCase):
+    """Test buffering and flushing of activity timestamps."""
+
+    @override_settings(SESSION_ACTIVITY_FLUSH_INTERVAL=3600)
+    def test_record_buffers_until_interval(self):
+        """Recording activity does not write before the interval passes."""
+        tracker = SessionActivityTracker()
+
+        with self.assertNumQueries(0):
+            for user_session in self.sessions:
+                tracker.record(user_session.pk)
+                tracker.record(user_session.pk)
+
+        self.assertEqual(tracker.pending_count(), 2)
+
+    def test_flush_writes_all_sessions_in_one_query(self):
+        """Buffered sessions are written with a single batched update."""
+        tracker = SessionActivityTracker()
+        later = timezone.now() + timedelta(minutes=5)
+        for user_session in self.sessions:
+            tracker.record(user_session.pk, when=later)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(tracker.flush(), 2)
+
+        for user_session in self.sessions:
+            user_session.refresh_from_db()
+            self.assertEqual(user_session.last_activity, later)
+        self.assertEqual(tracker.pending_count(), 0)
+
+    @override_settings(SESSION_ACTIVITY_FLUSH_INTERVAL=0)
+    def test_zero_interval_flushes_every_record(self):
+        """An interval of zero writes each activity immediately."""
+        tracker = SessionActivityTracker()
+        later = timezone.now() + timedelta(minutes=5)
+
+        tracker.record(self.sessions[0].pk, when=later)
+
+        self.sessions[0].refresh_from_db()
+        self.assertEqual(self.sessions[0].last_activity, later)
+
+    @override_settings(SESSION_ACTIVITY_FLUSH_INTERVAL=0.01)
+    def test_buffer_is_flushed_in_the_background(self):
+        """A background thread flushes the buffer without another request."""
+        with patch("users.services.session_activity.atexit.register") as register:
+            tracker = SessionActivityTracker()
+            flushed = threading.Event()
+            with patch.object(tracker, "flush", side_effect=flushed.set):
+                tracker.record(self.sessions[0].pk)
+                self.assertTrue(flushed.wait(timeout=5))
+            tracker.stop()
+
+        register.assert_called_once_with(tracker.stop)
+
+    @override_settings(SESSION_ACTIVITY_FLUSH_INTERVAL=3600)
+    def test_stop_flushes_remaining_activity(self):
+        """Stopping the tracker, as happens at exit, writes what is buffered."""
+        tracker = SessionActivityTracker()
+        later = timezone.now() + timedelta(minutes=5)
+        with patch("users.services.session_activity.atexit.register"):
+            tracker.record(self.sessions[0].pk, when=later)
+
+        tracker.stop()
+
+        self.sessions[0].refresh_from_db()
+        self.assertEqual(self.sessions[0].last_activity, later)
+        self.assertEqual(tracker.pending_count(), 0)
+
+
+class SessionTrackingMiddlewareActivityTest(SessionActivityTestMixin, TestCase):
+    """Test the middleware only reads and writes when it has to."""
+
+    def setUp(self):
+        """Set up the middleware and clean per-process state."""
+        super().setUp()
+        self.factory = RequestFactory()
+        self.middleware = SessionTrackingMiddleware(lambda request: HttpResponse())
+        for state in (session_activity_tracker, user_session_resolver):
+            state.clear()
+            self.addCleanup(state.clear)
+
+    def _request(
+        self,
+        session_key="activity_0",
+        ip_address="192.168.1.100",
+        user_agent="Chrome/91.0 Desktop",
+    ):
+        request = self.factory.get(
+            "/", REMOTE_ADDR=ip_address, HTTP_USER_AGENT=user_agent
+        )
+        request.user = self.user
+        request.session = SessionStore(session_key=session_key)
+        return request
+
+    def _process(self, request):
+        self.middleware.process_request(request)
+        return self.middleware.process_response(request, HttpResponse())
+
+    def test_known_session_costs_no_queries(self):
+        """Requests on a resolved session neither read nor write."""
+        self._process(self._request())
+
+        request = self._request()
+        with self.assertNumQueries(0):
+            self._process(request)
+
+        self.assertEqual(request.user_session_id, self.sessions[0].pk)
+        self.assertEqual(session_activity_tracker.pending_count(), 1)
+
+    def test_user_session_loads_lazily(self):
+        """Views can still use the full UserSession on the request."""
+        request = self._request()
+        self.middleware.process_request(request)
+
+        self.assertEqual(request.user_session.pk, self.sessions[0].pk)
+        self.assertEqual(request.user_session.user, self.user)
+
+    def test_session_without_django_session_row(self):
+        """Cache-only sessions are tracked by key alone."""
+        request = self._request(session_key="cache_only_session")
+
+        self._process(request)
+
+        user_session = UserSession.objects.get(session_id="cache_only_session")
+        self.assertFalse(Session.objects.filter(pk="cache_only_session").exists())
+        self.assertEqual(user_session.user, self.user)
+        self.assertEqual(user_session.session_key, "cache_only_session")
+        self.assertEqual(request.user_session_id, user_session.pk)
+
+    def test_session_of_other_user_is_not_tracked(self):
+        """A session key tracked for another user is ignored."""
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="testpass123"
+        )
+        request = self._request()
+        request.user = other
+
+        self._process(request)
+
+        self.assertFalse(hasattr(request, "user_session_id"))
+        self.assertEqual(session_activity_tracker.pending_count(), 0)
+
+    def test_ip_change_is_checked_immediately(self):
+        """A changed IP address is logged on the request it appears in."""
+        self._process(self._request())
+
+        self._process(self._request(ip_address="10.0.0.1"))
+
+        self.assertTrue(
+            SessionSecurityLog.objects.filter(
+                user_session=self.sessions[0],
+                event_type=SessionSecurityEvent.IP_ADDRESS_CHANGED,
+            ).exists()
+        )
+
+    def test_checked_client_is_remembered(self):
+        """After a change is checked, the same client costs no further reads."""
+        self._process(self._request())
+        self._process(self._request(ip_address="10.0.0.1"))
+
+        request = self._request(ip_address="10.0.0.1")
+        with self.assertNumQueries(0):
+            self._process(request)
+
+        self.assertEqual(request.user_session_id, self.sessions[0].pk)
+        self.assertEqual(
+            SessionSecurityLog.objects.filter(
+                event_type=SessionSecurityEvent.IP_ADDRESS_CHANGED
+            ).count(),
+            1,
+        )
+
+    def test_session_terminated_elsewhere_is_not_tracked(self):
+        """A session deactivated by another process stops being tracked."""
+        # Expire resolved entries immediately, as if the TTL had passed
+        user_session_resolver.ttl = 0
+        self.addCleanup(setattr, user_session_resolver, "ttl", 60)
+        self._process(self._request())
+        self.sessions[0].deactivate()
+
+        request = self._request()
+        self._process(request)
+
+        self.assertFalse(hasattr(request, "user_session_id"))
+
+
+class UserSessionResolverTest(SessionActivityTestMixin, TestCase):
+    """Test the session key LRU."""
+
+    @override_settings(SESSION_TRACKING_CACHE_SIZE=1)
+    def test_least_recently_used_key_is_evicted(self):
+        """Keys past the size limit are looked up again."""
+        resolver = UserSessionResolver()
+        resolver.resolve("activity_0", self.user.pk)
+        resolver.resolve("activity_1", self.user.pk)
+
+        with self.assertNumQueries(0):
+            resolver.resolve("activity_1", self.user.pk)
+        with self.assertNumQueries(1):
+            tracked = resolver.resolve("activity_0", self.user.pk)
+
+        self.assertEqual(tracked.id, self.sessions[0].pk)
+
+    @override_settings(SESSION_TRACKING_CACHE_TTL=0)
+    def test_expired_entries_are_reloaded(self):
+        """Entries older than the TTL are read again."""
+        resolver = UserSessionResolver()
+        resolver.resolve("activity_0", self.user.pk)
+        self.sessions[0].deactivate()
+
+        with self.assertNumQueries(1):
+            tracked = resolver.resolve("activity_0", self.user.pk)
+
+        self.assertFalse(tracked.is_active)
@@ -13,9 +13,12 @@ Tests cover:
 
 from datetime import timedelta
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.cache import SessionStore
 from django.contrib.sessions.models import Session
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -825,3 +828,119 @@ class SessionAPIErrorHandlingTest(TestCase):
         # Second termination (should fail gracefully)
         response2 = self.client.delete(url)
         self.assertEqual(response2.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cache")
+class CacheSessionEngineAPITest(TestCase):
+    """Test the session endpoints when sessions live only in the cache."""
+
+    def setUp(self):
+        """Log a user in from two clients."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cacheuser", email="cache@example.com", password="testpass123"
+        )
+        self.client = self._login(remember_me=True)
+        self.other_client = self._login()
+        self.current = UserSession.objects.get(
+            session_id=self.client.session.session_key
+        )
+        self.other = UserSession.objects.get(
+            session_id=self.other_client.session.session_key
+        )
+
+    def _login(self, remember_me=False):
+        client = APIClient()
+        client.credentials(HTTP_USER_AGENT="Chrome/91.0 Desktop")
+        response = client.post(
+            reverse("api:auth:api_login"),
+            {
+                "username": "cacheuser",
+                "password": "testpass123",
+                "remember_me": remember_me,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return client
+
+    def _session_exists(self, user_session):
+        return SessionStore().exists(user_session.session_key)
+
+    def test_login_tracks_session_without_django_session_row(self):
+        """Test login creates UserSessions for cache-only sessions."""
+        self.assertFalse(Session.objects.exists())
+        self.assertEqual(UserSession.objects.filter(user=self.user).count(), 2)
+        self.assertTrue(self.current.remember_me)
+
+        # Remember me extends the session stored in the cache by 30 days
+        expected = timezone.now() + timedelta(
+            seconds=settings.SESSION_COOKIE_AGE, days=30
+        )
+        self.assertAlmostEqual(
+            self.current.get_expiry_date(),
+            expected,
+            delta=timedelta(seconds=5),
+        )
+
+    def test_list_sessions(self):
+        """Test both sessions are listed with their expiry."""
+        response = self.client.get(reverse("api:auth:sessions-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        current = {item["id"]: item for item in response.data["results"]}
+        self.assertTrue(current[self.current.id]["is_current"])
+        self.assertFalse(current[self.other.id]["is_current"])
+        self.assertGreater(current[self.other.id]["time_until_expiry"], 0)
+
+    def test_extend_current_session(self):
+        """Test extending moves the cached session's expiry."""
+        original_expiry = self.current.get_expiry_date()
+
+        response = self.client.post(
+            reverse("api:auth:sessions-extend"), {"hours": 48}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertAlmostEqual(
+            self.current.get_expiry_date() - original_expiry,
+            timedelta(hours=48),
+            delta=timedelta(seconds=5),
+        )
+
+    def test_terminate_session(self):
+        """Test terminating a session removes it from the cache."""
+        response = self.client.delete(
+            reverse("api:auth:sessions-detail", kwargs={"session_id": self.other.id})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.other.refresh_from_db()
+        self.assertFalse(self.other.is_active)
+        self.assertFalse(self._session_exists(self.other))
+        self.assertTrue(self._session_exists(self.current))
+
+    def test_terminate_all_other_sessions(self):
+        """Test terminating all sessions keeps the current one."""
+        response = self.client.delete(reverse("api:auth:sessions-terminate-all"))
+
+        self.assertEqual(response.data["terminated_sessions"], 1)
+        self.assertFalse(self._session_exists(self.other))
+        self.current.refresh_from_db()
+        self.assertTrue(self.current.is_active)
+
+    def test_current_session_and_logout(self):
+        """Test the current session is found and deactivated on logout."""
+        response = self.client.get(reverse("api:auth:session-current"))
+        self.assertEqual(response.data["id"], self.current.id)
+
+        self.client.post(reverse("api:auth:api_logout"))
+
+        self.current.refresh_from_db()
+        self.assertFalse(self.current.is_active)
+        self.assertTrue(
+            SessionSecurityLog.objects.filter(
+                user_session=self.current, event_type=SessionSecurityEvent.LOGOUT
+            ).exists()
+        )
@@ -13,7 +13,9 @@ Tests cover:
 """
 
 from datetime import timedelta
+from io import StringIO
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
 from django.core.management import call_command
@@ -769,3 +771,88 @@ class RetentionPolicyTest(TestCase):
 
             # All sessions in this test are recent enough to be retained
             self.assertTrue(should_retain or session_type["retention_days"] < 35)
+
+
+class CleanupSessionsCommandTest(TestCase):
+    """Test the batched cleanup_sessions management command."""
+
+    def setUp(self):
+        """Set up a user with expired and active sessions."""
+        self.user = User.objects.create_user(
+            username="commanduser", email="command@example.com", password="testpass"
+        )
+        for i in range(5):
+            self._create_session(f"expired_{i}", -timedelta(hours=i + 1))
+        self.active = self._create_session("active", timedelta(days=1))
+
+    def _create_session(self, session_key, expire_delta):
+        return UserSession.objects.create(
+            user=self.user,
+            session=Session.objects.create(
+                session_key=session_key,
+                session_data="test_data",
+                expire_date=timezone.now() + expire_delta,
+            ),
+            ip_address="192.168.1.100",
+            user_agent="Chrome/91.0 Desktop",
+        )
+
+    def test_command_deactivates_in_batches(self):
+        """Test sessions are deactivated in batches with progress output."""
+        out = StringIO()
+
+        call_command("cleanup_sessions", batch_size=2, stdout=out)
+
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            [
+                "Deactivated 2 sessions...",
+                "Deactivated 4 sessions...",
+                "Deactivated 5 sessions...",
+                "Deactivated 5 expired sessions",
+            ],
+        )
+        self.assertEqual(UserSession.objects.filter(is_active=True).count(), 1)
+        self.assertFalse(
+            UserSession.objects.filter(is_active=False, ended_at__isnull=True).exists()
+        )
+        self.active.refresh_from_db()
+        self.assertTrue(self.active.is_active)
+
+    def test_cleanup_uses_two_queries_per_batch(self):
+        """Test each batch is one select and one update."""
+        with self.assertNumQueries(2 * 3 + 1):
+            self.assertEqual(UserSession.objects.cleanup_expired(batch_size=2), 5)
+
+    def test_dry_run_changes_nothing(self):
+        """Test dry run only reports the number of expired sessions."""
+        out = StringIO()
+
+        call_command("cleanup_sessions", dry_run=True, stdout=out)
+
+        self.assertIn("5 expired sessions would be deactivated", out.getvalue())
+        self.assertEqual(UserSession.objects.filter(is_active=True).count(), 6)
+
+    def test_sessions_without_session_row_expire_after_inactivity(self):
+        """Test cache-only sessions expire once idle past SESSION_COOKIE_AGE."""
+        idle = UserSession.objects.create(
+            user=self.user,
+            session_id="cache_only_idle",
+            ip_address="192.168.1.100",
+            user_agent="Chrome/91.0 Desktop",
+        )
+        recent = UserSession.objects.create(
+            user=self.user,
+            session_id="cache_only_recent",
+            ip_address="192.168.1.100",
+            user_agent="Chrome/91.0 Desktop",
+        )
+        UserSession.objects.filter(pk=idle.pk).update(
+            last_activity=timezone.now()
+            - timedelta(seconds=settings.SESSION_COOKIE_AGE + 60)
+        )
+
+        expired = UserSession.objects.expired()
+
+        self.assertIn(idle, expired)
+        self.assertNotIn(recent, expired)
@@ -19,6 +19,7 @@ from unittest.mock import Mock, patch
 from django.contrib.auth import get_user_model
 from django.contrib.sessions.models import Session
 from django.core import mail
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -643,3 +644,98 @@ class SecurityServiceIntegrationTest(TestCase):
         SessionSecurityLog.objects.filter(
             user=self.user, event_type=SessionSecurityEvent.SESSION_TERMINATED
         ).exists()
+
+
+class SecurityDashboardAggregationTest(TestCase):
+    """Test the aggregated dashboard and SQL-side event correlation."""
+
+    def setUp(self):
+        """Set up a user with a session and a clean cache."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="dashboarduser", email="dash@example.com", password="testpass"
+        )
+        self.user_session = UserSession.objects.create(
+            user=self.user,
+            session=Session.objects.create(
+                session_key="dashboard_session",
+                session_data="data",
+                expire_date=timezone.now() + timedelta(days=1),
+            ),
+            ip_address="192.168.1.100",
+            user_agent="Chrome/91.0 Desktop",
+        )
+        self.service = SessionSecurityService()
+
+    def _log(self, event_type, ip_address="192.168.1.100", timestamp=None, **details):
+        log = SessionSecurityLog.objects.create(
+            user=self.user,
+            user_session=self.user_session,
+            event_type=event_type,
+            ip_address=ip_address,
+            details=details,
+        )
+        if timestamp:
+            SessionSecurityLog.objects.filter(pk=log.pk).update(timestamp=timestamp)
+        return log
+
+    def test_dashboard_counts_and_caching(self):
+        """Test dashboard counts come from few queries and are cached."""
+        self._log(SessionSecurityEvent.LOGIN_SUCCESS)
+        self._log(SessionSecurityEvent.LOGIN_SUCCESS)
+        self._log(SessionSecurityEvent.IP_ADDRESS_CHANGED, risk_score=8.0)
+        self._log(SessionSecurityEvent.SUSPICIOUS_ACTIVITY, risk_score=6.0)
+        self._log(
+            SessionSecurityEvent.LOGIN_SUCCESS,
+            timestamp=timezone.now() - timedelta(days=45),
+        )
+
+        with self.assertNumQueries(3):
+            data = self.service.get_security_dashboard_data(self.user)
+
+        self.assertEqual(data["total_events"], 4)
+        self.assertEqual(data["security_events"], 2)
+        self.assertEqual(data["recent_logins"], 2)
+        self.assertEqual(data["active_sessions"], 1)
+        self.assertEqual(data["average_risk_score"], 7.0)
+        self.assertEqual(data["risk_level"], "high")
+        self.assertEqual(len(data["recent_security_events"]), 2)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.get_security_dashboard_data(self.user), data)
+
+    def test_correlation_groups_by_ip_and_half_hour(self):
+        """Test events are grouped per IP address and 30-minute window."""
+        window = timezone.now().replace(minute=0, second=0, microsecond=0)
+        window -= timedelta(hours=2)
+        for minutes, event_type, ip_address in [
+            (5, SessionSecurityEvent.IP_ADDRESS_CHANGED, "10.0.0.1"),
+            (10, SessionSecurityEvent.USER_AGENT_CHANGED, "10.0.0.1"),
+            (20, SessionSecurityEvent.LOGIN_SUCCESS, "10.0.0.2"),
+            (35, SessionSecurityEvent.LOGIN_SUCCESS, "10.0.0.2"),
+            (40, SessionSecurityEvent.LOGOUT, "10.0.0.2"),
+            (50, SessionSecurityEvent.LOGIN_SUCCESS, "10.0.0.1"),
+        ]:
+            self._log(
+                event_type,
+                ip_address=ip_address,
+                timestamp=window + timedelta(minutes=minutes),
+            )
+
+        with self.assertNumQueries(2):
+            correlated = self.service.correlate_security_events(self.user, hours=3)
+
+        self.assertEqual(
+            [group["group_key"] for group in correlated],
+            [
+                f"10.0.0.1_{window}",
+                f"10.0.0.2_{window + timedelta(minutes=30)}",
+            ],
+        )
+        self.assertEqual(correlated[0]["correlation_score"], 0.7)
+        self.assertEqual(correlated[0]["security_event_count"], 2)
+        self.assertEqual(
+            [event["event_type"] for event in correlated[1]["events"]],
+            [SessionSecurityEvent.LOGIN_SUCCESS, SessionSecurityEvent.LOGOUT],
+        )
+        self.assertEqual(correlated[1]["correlation_score"], 0.4)
@@ -11,10 +11,18 @@ Tests cover:
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
 from django.template import Context, Template
 from django.test import RequestFactory, TestCase, override_settings
 from django.test.client import Client
 
+from users.models import Theme, UserThemePreference
+from users.theme_registry import (
+    THEME_REGISTRY_VERSION_KEY,
+    invalidate_theme_registry,
+)
+
 User = get_user_model()
 
 
@@ -191,10 +199,11 @@ class ThemeContextProcessorTests(TestCase):
         from users.context_processors import theme_context
 
         request = self.create_request(user=self.user)
+        request.session = SessionStore()
+        theme_context(request)
 
-        # The new theme system will make queries to get theme objects and available themes
-        # This is acceptable for the enhanced functionality
-        with self.assertNumQueries(5):  # Expected queries for theme system
+        # Themes come from the registry and the resolved theme from the session
+        with self.assertNumQueries(0):
             context = theme_context(request)
             self.assertEqual(context["user_theme"], "dark")
 
@@ -297,11 +306,13 @@ class ThemeContextProcessorTests(TestCase):
         """Test context processor caching behavior if implemented."""
         from users.context_processors import theme_context
 
+        # Load the process-wide theme registry
+        theme_context(self.create_request())
         request = self.create_request(user=self.user)
+        request.session = SessionStore()
 
-        # Call multiple times - will make queries each time due to theme lookups
-        # In a real application, this would be cached or optimized
-        with self.assertNumQueries(9):  # Theme lookup queries
+        # Only the first call resolves the theme; later calls use the session
+        with self.assertNumQueries(1):
             context1 = theme_context(request)
             context2 = theme_context(request)
 
@@ -373,3 +384,117 @@ class ThemeContextProcessorTests(TestCase):
         # Should return exactly the keys we expect
         expected_keys = {"user_theme", "theme_object", "available_themes"}
         self.assertEqual(set(context.keys()), expected_keys)
+
+
+class ThemeRegistryCacheTests(TestCase):
+    """Test the theme registry and session-cached theme resolution."""
+
+    def setUp(self):
+        """Set up themes and a user with a session."""
+        # Load these themes into the registry, and drop them again afterwards
+        cache.delete(THEME_REGISTRY_VERSION_KEY)
+        self.addCleanup(cache.delete, THEME_REGISTRY_VERSION_KEY)
+        self.light = Theme.objects.create(
+            name="light",
+            display_name="Light",
+            primary_color="#0d6efd",
+            background_color="#ffffff",
+            text_color="#212529",
+            is_default=True,
+            sort_order=1,
+        )
+        self.dark = Theme.objects.create(
+            name="dark",
+            display_name="Dark",
+            primary_color="#58a6ff",
+            background_color="#0d1117",
+            text_color="#f0f6fc",
+            is_dark_theme=True,
+            sort_order=2,
+        )
+        self.user = User.objects.create_user(
+            username="registryuser",
+            email="registry@example.com",
+            password="testpass123",
+            theme="dark",
+        )
+        self.factory = RequestFactory()
+        self.session = SessionStore()
+
+    def _context(self, user=None):
+        from users.context_processors import theme_context
+
+        request = self.factory.get("/")
+        request.user = user or self.user
+        request.session = self.session
+        return theme_context(request)
+
+    def test_rendering_makes_no_theme_queries_once_resolved(self):
+        """Test repeated renders use the registry and the session."""
+        self._context()
+
+        with self.assertNumQueries(0):
+            context = self._context()
+
+        self.assertEqual(context["user_theme"], "dark")
+        self.assertEqual(context["theme_object"], self.dark)
+        self.assertEqual(context["available_themes"], [self.light, self.dark])
+
+    def test_theme_save_reloads_registry(self):
+        """Test saving a theme invalidates the registry in every process."""
+        self._context()
+        self.dark.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dark.save()
+
+        context = self._context()
+
+        self.assertEqual(context["user_theme"], "light")
+        self.assertEqual(context["theme_object"], self.light)
+        self.assertEqual(context["available_themes"], [self.light])
+
+    def test_evicted_version_reloads_registry(self):
+        """Test a registry version lost from the cache is never reused."""
+        self._context()
+        Theme.objects.filter(pk=self.dark.pk).update(is_active=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_theme_registry()
+        cache.delete(THEME_REGISTRY_VERSION_KEY)
+
+        context = self._context()
+
+        self.assertEqual(context["available_themes"], [self.light])
+        self.assertIsNotNone(cache.get(THEME_REGISTRY_VERSION_KEY))
+
+    def test_preference_change_re_resolves_theme(self):
+        """Test changing a theme preference replaces the session's theme."""
+        self._context()
+        with self.captureOnCommitCallbacks(execute=True):
+            UserThemePreference.objects.create(user=self.user, current_theme=self.light)
+
+        context = self._context()
+
+        self.assertEqual(context["user_theme"], "light")
+        self.assertEqual(context["theme_object"], self.light)
+
+    def test_legacy_theme_change_re_resolves_theme(self):
+        """Test changing the user's theme field replaces the session's theme."""
+        self._context()
+        self.user.theme = "light"
+        self.user.save()
+
+        self.assertEqual(self._context()["user_theme"], "light")
+
+    def test_matches_user_theme_methods(self):
+        """Test resolution agrees with User.get_theme_name/get_theme_object."""
+        for theme in ("dark", "light", "forest"):
+            self.user.theme = theme
+            self.user.save()
+
+            context = self._context()
+
+            self.assertEqual(context["theme_object"], self.user.get_theme_object())
+            expected = self.user.get_theme_name()
+            self.assertEqual(
+                context["user_theme"], expected if expected != "forest" else "light"
+            )
@@ -0,0 +1,146 @@
+"""
+Process-wide registry of themes for template rendering.
+
+Themes change rarely but are needed on every render, so each process keeps
+them in memory and reloads only when the registry version in the cache
+changes. Saving or deleting a Theme sets a new version (see users.signals).
+Changes to a user's theme preference set a per-user version instead, which
+lets the theme resolved for a session be reused until it changes.
+
+New versions are set once the change commits, so no process can load the old
+themes under the new version. A version missing from the cache (never set, or
+evicted) is seeded with a new one, so it never matches a version something was
+loaded under.
+"""
+
+import logging
+import threading
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+
+if TYPE_CHECKING:
+    from .models import Theme
+
+logger = logging.getLogger(__name__)
+
+THEME_REGISTRY_VERSION_KEY = "users:theme_registry_version"
+THEME_PREFERENCE_VERSION_KEY_PREFIX = "users:theme_preference_version"
+
+
+def _theme_preference_version_key(user_id: Any) -> str:
+    return f"{THEME_PREFERENCE_VERSION_KEY_PREFIX}:{user_id}"
+
+
+def _get_version(key: str) -> Optional[str]:
+    """Return the version stored under key, seeding a new one if missing."""
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        # Another process may have seeded it first; None only if the cache
+        # does not keep values at all
+        version = cache.get(key)
+    return version
+
+
+def get_theme_registry_version() -> Optional[str]:
+    """Return the current theme registry version."""
+    return _get_version(THEME_REGISTRY_VERSION_KEY)
+
+
+def get_theme_preference_version(user_id: Any) -> Optional[str]:
+    """Return the current theme preference version of a user."""
+    return _get_version(_theme_preference_version_key(user_id))
+
+
+def invalidate_theme_registry() -> None:
+    """Make every process reload its themes once the change commits."""
+    transaction.on_commit(
+        lambda: cache.set(THEME_REGISTRY_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    )
+
+
+def invalidate_theme_preferences(*user_ids: Any) -> None:
+    """
+    Make sessions re-resolve the theme of the given users once it commits.
+
+    Args:
+        *user_ids: IDs of users whose theme preference changed
+    """
+    versions = {
+        _theme_preference_version_key(user_id): uuid.uuid4().hex for user_id in user_ids
+    }
+    transaction.on_commit(lambda: cache.set_many(versions, timeout=None))
+
+
+class ThemeRegistry:
+    """In-memory copy of all themes, reloaded when the version changes."""
+
+    # Version marker for a registry that has not been loaded yet
+    _UNLOADED = object()
+
+    def __init__(self):
+        """Initialize an empty, unloaded registry."""
+        self._lock = threading.Lock()
+        self._version: Any = self._UNLOADED
+        self.available_themes: List["Theme"] = []
+        self._by_id: Dict[int, "Theme"] = {}
+        self._active_by_name: Dict[str, "Theme"] = {}
+        self.default_theme: Optional["Theme"] = None
+
+    def ensure_current(self, version: Optional[str]) -> "ThemeRegistry":
+        """
+        Reload the themes if the registry version has changed.
+
+        A version of None means the cache could not provide one, so the
+        themes are always reloaded.
+
+        Args:
+            version: Current version from get_theme_registry_version()
+
+        Returns:
+            This registry
+        """
+        if version is None or self._version != version:
+            with self._lock:
+                if version is None or self._version != version:
+                    self._load()
+                    self._version = version
+        return self
+
+    def get(self, theme_id: Optional[int]) -> Optional["Theme"]:
+        """Return a theme by ID, active or not."""
+        return self._by_id.get(theme_id)
+
+    def get_active(self, name: str) -> Optional["Theme"]:
+        """Return an active theme by name."""
+        return self._active_by_name.get(name)
+
+    def is_active(self, name: str) -> bool:
+        """Whether an active theme has this name."""
+        return name in self._active_by_name
+
+    def _load(self) -> None:
+        """Load all themes with one query."""
+        try:
+            from .models import Theme
+
+            themes = list(Theme.objects.order_by("sort_order", "display_name"))
+        except Exception as e:
+            # During migrations or if Theme model doesn't exist yet
+            logger.debug(f"Themes not available: {e}")
+            themes = []
+
+        self.available_themes = [theme for theme in themes if theme.is_active]
+        self._by_id = {theme.pk: theme for theme in themes}
+        self._active_by_name = {theme.name: theme for theme in self.available_themes}
+        by_name = {theme.name: theme for theme in themes}
+        self.default_theme = next(
+            (theme for theme in themes if theme.is_default), by_name.get("light")
+        )
+
+
+# Global instance
+theme_registry = ThemeRegistry()